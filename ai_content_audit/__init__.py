@@ -8,6 +8,13 @@ AI 内容审核系统
 - 加载和处理审核文本数据
 - 定义审核规则和选项
 - 执行单文本或批量审核
+- 基于 asyncio 的异步审核（AsyncAuditManager）
+- 审核结论缓存（内存 LRU/TTL 与 SQLite 持久化）
+- 限流、重试、自适应并发、客户端池、模型级联、对冲与优先级调度等运行时控制（runtime）
+- 批量审核日志与断点续跑（BatchJournal）
+- Prometheus 格式的审核指标（AuditMetrics）
+- 本地 span 追踪与阶段耗时分解（tracing）
+- 离线 Batch API 请求导出与结果导入（offline）
 - 支持多种数据源和配置
 
 使用示例：
@@ -27,9 +34,23 @@ AI 内容审核系统
 """
 
 from ai_content_audit.audit_manager import AuditManager
+from ai_content_audit.async_audit_manager import AsyncAuditManager
 from ai_content_audit import loader
+from ai_content_audit import cache
+from ai_content_audit import runtime
+from ai_content_audit import journal
+from ai_content_audit import metrics
+from ai_content_audit import tracing
+from ai_content_audit import offline
 
 __all__ = [
     "AuditManager",
+    "AsyncAuditManager",
     "loader",
+    "cache",
+    "runtime",
+    "journal",
+    "metrics",
+    "tracing",
+    "offline",
 ]
@@ -0,0 +1,635 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Type, Union
+from uuid import UUID, uuid4
+from openai import AsyncOpenAI
+from pydantic import BaseModel
+from ai_content_audit.audit_manager import (
+    _CallStats,
+    _finalize_decision,
+    _fallback_decision,
+    _make_result,
+    _prefilter_decision,
+    _record_usage,
+    _timed_stage,
+)
+from ai_content_audit.cache import AuditCache, make_cache_key
+from ai_content_audit.metrics import AuditMetrics
+from ai_content_audit.tracing import Tracer, get_tracer
+from ai_content_audit.runtime import (
+    AdaptiveConcurrencyLimiter,
+    AsyncSingleFlight,
+    ClientPool,
+    HedgePolicy,
+    ModelCascade,
+    PriorityScheduler,
+    RateLimiter,
+    RetryPolicy,
+    usage_total_tokens,
+)
+from ai_content_audit.runtime.scheduler import Priority
+from ai_content_audit.models import (
+    AuditOptionsItem,
+    AuditDecision,
+    AuditContent,
+    AuditResult,
+)
+from ai_content_audit.prompts import build_messages
+
+
+class AsyncAuditManager:
+    """
+    异步审核管理器
+
+    职责：
+    - 基于 AsyncOpenAI 客户端，在 asyncio 事件循环中执行审核。
+    - 与 AuditManager 共享消息构建（build_messages）、结果清洗（_ensure_choice）与 AuditResult 结构。
+    - 批量审核使用信号量限制同时在途的请求数，单个事件循环即可维持大量并发审核。
+    """
+
+    def __init__(
+        self,
+        client: Union[AsyncOpenAI, ClientPool],
+        model: str,
+        *,
+        max_concurrency: int = 16,
+        cache: Optional[AuditCache] = None,
+        single_flight: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        cascade: Optional[ModelCascade] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        scheduler: Optional[PriorityScheduler] = None,
+        metrics: Optional[AuditMetrics] = None,
+        tracer: Optional[Tracer] = None,
+    ) -> None:
+        """
+        初始化异步审核管理器。
+
+        参数：
+        - client (Union[AsyncOpenAI, ClientPool]): OpenAI 兼容的异步客户端。应已配置 base_url 与 api_key；
+          也可传入由 AsyncOpenAI 客户端组成的 ClientPool（见 AuditManager）。
+        - model (str): 默认模型名称，方法调用时可临时覆盖。
+        - max_concurrency (int): audit_batch 的默认最大在途请求数，默认 16。
+        - cache (Optional[AuditCache]): 可选审核结论缓存，与 AuditManager 的缓存键一致，可共享同一后端。
+          可能阻塞的后端（cache.blocking 为 True，如 SQLiteCache）在线程中读写（asyncio.to_thread），
+          磁盘 I/O 与锁等待不会阻塞事件循环；MemoryCache 直接读写，命中时没有线程切换开销。
+        - single_flight (bool): 是否合并相同 内容 + 审核项 + 模型 的并发在途请求（默认 True）。
+        - rate_limiter (Optional[RateLimiter]): 可选客户端 RPM/TPM 限流器，可与同步管理器共享。
+        - retry_policy (Optional[RetryPolicy]): 可选重试策略，等待期间不阻塞事件循环。
+        - concurrency_limiter (Optional[AdaptiveConcurrencyLimiter]): 可选自适应并发限制器（AIMD）；
+          启用后 audit_batch 的信号量默认取 max(max_concurrency, concurrency_limiter.max_limit)。
+        - cascade (Optional[ModelCascade]): 可选模型级联，先用快速模型审核，必要时升级到主模型（见 AuditManager）。
+        - hedge_policy (Optional[HedgePolicy]): 可选对冲请求策略，仅作用于 audit_one，落后的请求会被取消。
+        - scheduler (Optional[PriorityScheduler]): 可选优先级调度器，可与同步管理器共享名额（见 AuditManager）；
+          audit_one 默认 interactive，audit_batch 默认 bulk；同时配置 concurrency_limiter 时绑定该限制器。
+        - metrics (Optional[AuditMetrics]): 可选审核指标，可与同步管理器共享（见 AuditManager）。
+        - tracer (Optional[Tracer]): 可选追踪器，默认使用全局追踪器（见 AuditManager）。
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency 必须大于等于 1")
+        if isinstance(client, ClientPool):
+            self.client = None
+            self.client_pool: Optional[ClientPool] = client
+        else:
+            self.client = client
+            self.client_pool = None
+        self.model = model
+        self.max_concurrency = max_concurrency
+        self.cache = cache
+        self._single_flight = AsyncSingleFlight() if single_flight else None
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.concurrency_limiter = concurrency_limiter
+        self.cascade = cascade
+        self.hedge_policy = hedge_policy
+        self.scheduler = scheduler
+        if scheduler is not None and concurrency_limiter is not None:
+            scheduler.bind_limiter(concurrency_limiter)
+        if metrics is not None and concurrency_limiter is not None:
+            metrics.track_limiter(concurrency_limiter)
+        self.metrics = metrics
+        self.tracer = tracer
+
+    async def _parse(
+        self,
+        messages: List[Dict[str, Any]],
+        response_format: Type[BaseModel],
+        *,
+        client: Optional[AsyncOpenAI] = None,
+        model: Optional[str] = None,
+        stats: Optional[_CallStats] = None,
+    ) -> Any:
+        """
+        内部方法：所有模型调用的统一出口（异步），调度、限流与重试逻辑与 AuditManager._parse 一致。
+
+        参数：
+        - messages (List[Dict[str, Any]]): 已构建的消息列表。
+        - response_format (Type[BaseModel]): 结构化输出模型。
+        - client (Optional[AsyncOpenAI]): 可选覆盖客户端。
+        - model (Optional[str]): 可选覆盖模型。
+        - stats (Optional[_CallStats]): 可选调用统计，记录尝试次数。
+
+        返回：
+        - 模型响应对象。
+        """
+        use_client = client or self.client
+        use_model = model or self.model
+
+        attempt = 0
+        while True:
+            attempt += 1
+            if stats is not None:
+                stats.attempts += 1
+                stats.model = use_model
+
+            estimated = 0
+            started = time.perf_counter()
+            tracer = self._tracer()
+            try:
+                with tracer.span("model.attempt", model=use_model, attempt=attempt):
+                    async with self._slot(stats):
+                        if self.rate_limiter is not None:
+                            estimated = self.rate_limiter.estimate_tokens(messages)
+                            with tracer.span("ratelimit.wait", tokens=estimated):
+                                await self.rate_limiter.acquire_async(estimated)
+
+                        started = time.perf_counter()
+                        if (
+                            stats is not None
+                            and stats.hedge
+                            and self.hedge_policy is not None
+                        ):
+                            resp = await self._create_hedged(
+                                use_client, use_model, messages, response_format
+                            )
+                        else:
+                            resp = await self._create(
+                                use_client, use_model, messages, response_format
+                            )
+            except Exception as e:
+                if stats is not None:
+                    stats.usage.latency += time.perf_counter() - started
+                if self.retry_policy is None or not self.retry_policy.should_retry(
+                    e, attempt
+                ):
+                    raise
+                with tracer.span("retry.backoff", attempt=attempt):
+                    await asyncio.sleep(self.retry_policy.delay(e, attempt))
+                continue
+
+            tokens = usage_total_tokens(resp)
+            if stats is not None:
+                stats.usage.latency += time.perf_counter() - started
+                _record_usage(stats.usage, resp)
+            if self.rate_limiter is not None:
+                self.rate_limiter.reconcile(estimated, tokens)
+            return resp
+
+    def _tracer(self) -> Tracer:
+        """内部方法：管理器的追踪器，未配置时使用当前（全局）追踪器。"""
+        return self.tracer if self.tracer is not None else get_tracer()
+
+    @asynccontextmanager
+    async def _slot(self, stats: Optional[_CallStats]) -> AsyncIterator[None]:
+        """内部方法：按调用统计中的优先级与租户占用调度名额的异步上下文管理器，未启用调度器时为空操作。"""
+        if self.scheduler is None:
+            yield
+            return
+        priority, tenant = (
+            (stats.priority, stats.tenant)
+            if stats is not None
+            else ("interactive", None)
+        )
+        with self._tracer().span("scheduler.wait", priority=priority, tenant=tenant):
+            await self.scheduler.acquire_async(priority, tenant=tenant)
+        try:
+            yield
+        finally:
+            self.scheduler.release()
+
+    async def _create(
+        self,
+        client: Optional[AsyncOpenAI],
+        model: str,
+        messages: List[Dict[str, Any]],
+        response_format: Type[BaseModel],
+    ) -> Any:
+        """
+        内部方法：发起一次模型请求（异步）。
+
+        - 启用自适应并发限制器时，请求前占用名额，结束后以延迟或异常反馈给限制器。
+        - 未指定客户端且配置了客户端池时，从池中选择端点，结束后反馈延迟或异常。
+        - 启用指标时，记录在途请求数与请求结果、耗时。
+        """
+        tracer = self._tracer()
+        limiter = self.concurrency_limiter
+        if limiter is not None:
+            with tracer.span("concurrency.wait"):
+                await limiter.acquire_async()
+
+        endpoint = None
+        if client is None and self.client_pool is not None:
+            endpoint = self.client_pool.acquire()
+            client = endpoint.client
+            if endpoint.model and model == self.model:
+                model = endpoint.model
+
+        metrics = self.metrics
+        if metrics is not None:
+            metrics.in_flight.inc()
+        span = tracer.start_span(
+            "http.request",
+            model=model,
+            endpoint=endpoint.name if endpoint is not None else None,
+        )
+        started = time.perf_counter()
+        try:
+            resp = await client.chat.completions.parse(
+                model=model, messages=messages, response_format=response_format
+            )
+        except BaseException as e:
+            tracer.end_span(span, e)
+            if metrics is not None:
+                metrics.in_flight.dec()
+                metrics.observe_request(model, error=e)
+            if endpoint is not None:
+                self.client_pool.release(endpoint, error=e)
+            if limiter is not None:
+                limiter.release(error=e)
+            raise
+        latency = time.perf_counter() - started
+        tracer.end_span(span)
+        if metrics is not None:
+            metrics.in_flight.dec()
+            metrics.observe_request(model, latency=latency)
+        if endpoint is not None:
+            self.client_pool.release(endpoint, latency=latency)
+        if limiter is not None:
+            limiter.release(latency=latency)
+        return resp
+
+    async def _create_hedged(
+        self,
+        client: Optional[AsyncOpenAI],
+        model: str,
+        messages: List[Dict[str, Any]],
+        response_format: Type[BaseModel],
+    ) -> Any:
+        """
+        内部方法：以对冲方式发起模型请求（异步，仅 audit_one 使用）。
+
+        原请求在对冲延迟内未返回且未超过对冲率上限时，向备用客户端 / 模型发起相同请求，
+        取先成功返回者并取消另一个请求。两个请求都失败时抛出原请求的异常。
+        """
+        policy = self.hedge_policy
+        delay = policy.delay()
+        primary = asyncio.ensure_future(
+            self._timed_create(client, model, messages, response_format)
+        )
+        tasks = [primary]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done or not policy.try_hedge():
+                return await primary
+
+            hedge = asyncio.ensure_future(
+                self._timed_create(
+                    policy.client or client,
+                    policy.model or model,
+                    messages,
+                    response_format,
+                )
+            )
+            tasks.append(hedge)
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                # 同时完成时优先原请求
+                for task in tasks:
+                    if task in done and task.exception() is None:
+                        if task is hedge:
+                            policy.record_win()
+                        return task.result()
+            return primary.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def _timed_create(
+        self,
+        client: Optional[AsyncOpenAI],
+        model: str,
+        messages: List[Dict[str, Any]],
+        response_format: Type[BaseModel],
+    ) -> Any:
+        """内部方法：发起一次模型请求（对冲用），成功时向对冲策略记录延迟样本。"""
+        started = time.perf_counter()
+        resp = await self._create(client, model, messages, response_format)
+        self.hedge_policy.observe(time.perf_counter() - started)
+        return resp
+
+    async def _audit_content_with_item(
+        self,
+        content: AuditContent,
+        item: AuditOptionsItem,
+        *,
+        client: Optional[AsyncOpenAI] = None,
+        model: Optional[str] = None,
+        stats: Optional[_CallStats] = None,
+    ) -> AuditDecision:
+        """
+        内部方法：异步审核单个待审核内容与单个审核项，返回 AuditDecision。
+
+        参数：
+        - content (AuditContent): 待审核内容。
+        - item (AuditOptionsItem): 审核项。
+        - client (Optional[AsyncOpenAI]): 可选覆盖客户端。
+        - model (Optional[str]): 可选覆盖模型。
+        - stats (Optional[_CallStats]): 可选调用统计。
+
+        返回：
+        - AuditDecision: 审核决策结果。
+        """
+        with _timed_stage(self.metrics, "prompt_build"):
+            messages = build_messages(content=content, item=item)
+
+        resp = await self._parse(
+            messages, AuditDecision, client=client, model=model, stats=stats
+        )
+        with _timed_stage(self.metrics, "parse"), self._tracer().span("audit.parse"):
+            result: AuditDecision = resp.choices[0].message.parsed
+            return _finalize_decision(result, item)
+
+    async def _resolve_decision(
+        self,
+        content: AuditContent,
+        item: AuditOptionsItem,
+        *,
+        client: Optional[AsyncOpenAI] = None,
+        model: Optional[str] = None,
+        stats: _CallStats,
+    ) -> AuditDecision:
+        """
+        内部方法：获取单个内容 × 单个审核项的决策。
+
+        审核项配置预过滤器且能直接确定时不调用模型；配置模型级联时先用快速模型审核，结论需要复核（或快速模型调用失败）时升级到主模型，
+        stats 记录最终模型与是否升级。
+
+        参数：
+        - stats (_CallStats): 调用统计，两级调用的尝试次数累加记录。
+
+        返回：
+        - AuditDecision: 审核决策。
+        """
+        decision = _prefilter_decision(content, item)
+        if decision is not None:
+            stats.prefiltered = True
+            return decision
+
+        use_model = model or self.model
+        cascade = self.cascade
+        if cascade is not None:
+            try:
+                decision = await self._resolve_tier(
+                    content,
+                    item,
+                    client=cascade.fast_client or client,
+                    model=cascade.fast_model,
+                    stats=stats,
+                )
+            except Exception:
+                decision = None
+            if decision is not None and not cascade.should_escalate(decision, item):
+                return decision
+            stats.escalated = True
+            stats.cache_hit = False
+
+        return await self._resolve_tier(
+            content, item, client=client, model=use_model, stats=stats
+        )
+
+    async def _cache_get(self, key: str) -> Optional[AuditDecision]:
+        """内部方法：读取缓存，阻塞的后端在线程中执行。"""
+        if self.cache.blocking:
+            return await asyncio.to_thread(self.cache.get, key)
+        return self.cache.get(key)
+
+    async def _cache_set(self, key: str, decision: AuditDecision) -> None:
+        """内部方法：写入缓存，阻塞的后端在线程中执行。"""
+        if self.cache.blocking:
+            await asyncio.to_thread(self.cache.set, key, decision)
+        else:
+            self.cache.set(key, decision)
+
+    async def _resolve_tier(
+        self,
+        content: AuditContent,
+        item: AuditOptionsItem,
+        *,
+        client: Optional[AsyncOpenAI] = None,
+        model: Optional[str] = None,
+        stats: _CallStats,
+    ) -> AuditDecision:
+        """
+        内部方法：优先读取缓存，未命中时调用模型并写入缓存。
+
+        启用单飞去重时，相同 内容 + 审核项 + 模型 的并发协程共享同一次模型请求。
+
+        参数：
+        - stats (_CallStats): 调用统计，记录是否命中缓存与模型调用次数。
+
+        返回：
+        - AuditDecision: 审核决策。
+        """
+        stats.model = model or self.model
+        # 未启用缓存与单飞时无需缓存键，跳过对整段内容的哈希
+        key = (
+            make_cache_key(content, item, stats.model)
+            if self.cache is not None or self._single_flight is not None
+            else None
+        )
+        if self.cache is not None:
+            cached = await self._cache_get(key)
+            if cached is not None:
+                stats.cache_hit = True
+                return cached
+
+        async def call() -> Tuple[AuditDecision, bool]:
+            if self.cache is not None:
+                # 等待进入期间可能已有相同请求完成并写入缓存
+                cached = await self._cache_get(key)
+                if cached is not None:
+                    return cached, True
+            decision = await self._audit_content_with_item(
+                content, item, client=client, model=model, stats=stats
+            )
+            if self.cache is not None:
+                await self._cache_set(key, decision)
+            return decision, False
+
+        if self._single_flight is None:
+            decision, stats.cache_hit = await call()
+            return decision
+        (decision, cache_hit), shared = await self._single_flight.do(key, call)
+        stats.cache_hit = cache_hit
+        return decision.model_copy() if shared else decision
+
+    async def audit_one(
+        self,
+        content: AuditContent,
+        item: AuditOptionsItem,
+        *,
+        client: Optional[AsyncOpenAI] = None,
+        model: Optional[str] = None,
+        priority: Priority = "interactive",
+        tenant: Optional[str] = None,
+    ) -> AuditResult:
+        """
+        异步审核单个内容与单个审核项。
+
+        参数：
+        - content (AuditContent): 待审核内容。
+        - item (AuditOptionsItem): 审核项定义。
+        - client (Optional[AsyncOpenAI]): 可选覆盖客户端。
+        - model (Optional[str]): 可选覆盖模型。
+        - priority (str): 调度优先级（启用 scheduler 时生效），默认 "interactive"。
+        - tenant (Optional[str]): 可选租户标识，用于同一优先级内的加权公平排队。
+
+        返回：
+        - AuditResult: 包含完整的审核信息。
+
+        示例：
+        >>> from ai_content_audit import AsyncAuditManager, loader
+        >>> from openai import AsyncOpenAI
+        >>> client = AsyncOpenAI(base_url="https:/", api_key="your_api_key")
+        >>> manager = AsyncAuditManager(client, model="qwen-plus")
+        >>> content = loader.audit_data.create(content="这是一个示例文本。")
+        >>> item = loader.options_item.create(
+        ...     name="是否包含敏感信息",
+        ...     instruction="检查文本中是否出现敏感信息。",
+        ...     options={"有": "检测有敏感信息", "无": "没有检测到敏感信息"},
+        ... )
+        >>> result = await manager.audit_one(content, item)
+        """
+        stats = _CallStats(hedge=True, priority=priority, tenant=tenant)
+        with self._tracer().span("audit.one", text_id=content.id, item_id=item.id):
+            decision = await self._resolve_decision(
+                content, item, client=client, model=model, stats=stats
+            )
+        return self._observe(_make_result(content, item, decision, stats=stats))
+
+    async def audit_batch(
+        self,
+        content: List[AuditContent],
+        items: List[AuditOptionsItem],
+        *,
+        client: Optional[AsyncOpenAI] = None,
+        model: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        priority: Priority = "bulk",
+        tenant: Optional[str] = None,
+    ) -> List[AuditResult]:
+        """
+        异步批量审核：对多个内容应用多个审核项，信号量限制在途请求数。
+
+        参数：
+        - content (List[AuditContent]): 待审核内容列表。
+        - items (List[AuditOptionsItem]): 审核项列表。
+        - client (Optional[AsyncOpenAI]): 可选覆盖客户端。
+        - model (Optional[str]): 可选覆盖模型。
+        - max_concurrency (Optional[int]): 可选覆盖最大在途请求数。
+        - priority (str): 调度优先级（启用 scheduler 时生效），默认 "bulk"。
+        - tenant (Optional[str]): 可选租户标识，用于同一优先级内的加权公平排队。
+
+        返回：
+        - List[AuditResult]: 审核结果列表，顺序与 内容×审核项 的嵌套顺序一致。
+
+        失败策略：
+        - 与 AuditManager.audit_batch 一致：单项失败返回兜底 choice 与 "模型调用失败" 理由，整体不抛出异常。
+
+        示例：
+        >>> results = await manager.audit_batch(contents, items, max_concurrency=64)
+        """
+        if max_concurrency is not None:
+            limit = max_concurrency
+        elif self.concurrency_limiter is not None:
+            limit = max(self.max_concurrency, self.concurrency_limiter.max_limit)
+        else:
+            limit = self.max_concurrency
+        if limit < 1:
+            raise ValueError("max_concurrency 必须大于等于 1")
+
+        batch_id = uuid4()
+        semaphore = asyncio.Semaphore(limit)
+
+        async def run(c: AuditContent, it: AuditOptionsItem) -> AuditResult:
+            async with semaphore:
+                result = await self._audit_cell(
+                    batch_id,
+                    c,
+                    it,
+                    client=client,
+                    model=model,
+                    priority=priority,
+                    tenant=tenant,
+                )
+            return self._observe(result)
+
+        with self._tracer().span("audit.batch", batch_id=batch_id):
+            return list(
+                await asyncio.gather(*(run(c, it) for c in content for it in items))
+            )
+
+    def _observe(self, result: AuditResult) -> AuditResult:
+        """内部方法：启用指标时记录审核结果，原样返回。"""
+        if self.metrics is not None:
+            self.metrics.observe_result(result)
+        return result
+
+    async def _audit_cell(
+        self,
+        batch_id: UUID,
+        content: AuditContent,
+        item: AuditOptionsItem,
+        *,
+        client: Optional[AsyncOpenAI] = None,
+        model: Optional[str] = None,
+        priority: Priority = "bulk",
+        tenant: Optional[str] = None,
+    ) -> AuditResult:
+        """
+        内部方法：批量审核中的单元格，失败时返回兜底结果。
+
+        参数：
+        - batch_id (UUID): 批次ID。
+        - content (AuditContent): 待审核内容。
+        - item (AuditOptionsItem): 审核项。
+        - client (Optional[AsyncOpenAI]): 可选覆盖客户端。
+        - model (Optional[str]): 可选覆盖模型。
+        - priority (str): 调度优先级。
+        - tenant (Optional[str]): 可选租户标识。
+
+        返回：
+        - AuditResult: 审核结果，不抛出异常。
+        """
+        stats = _CallStats(priority=priority, tenant=tenant)
+        try:
+            decision = await self._resolve_decision(
+                content, item, client=client, model=model, stats=stats
+            )
+        except Exception:
+            return _make_result(
+                content,
+                item,
+                _fallback_decision(item),
+                batch_id=batch_id,
+                stats=stats,
+                status="failed",
+            )
+        return _make_result(content, item, decision, batch_id=batch_id, stats=stats)
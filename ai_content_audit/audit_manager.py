@@ -1,13 +1,69 @@
-from typing import Dict, List, Tuple, Optional, Union
-from uuid import uuid4
+import contextvars
+import time
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    TimeoutError as FuturesTimeoutError,
+    wait,
+)
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Set,
+    Tuple,
+    Type,
+    Optional,
+    TypeVar,
+    Union,
+)
+from uuid import UUID, uuid4
 from openai import OpenAI
+from pydantic import BaseModel
+from ai_content_audit.cache import AuditCache, make_cache_key
+from ai_content_audit.journal import BatchJournal
+from ai_content_audit.metrics import AuditMetrics
+from ai_content_audit.tracing import Tracer, get_tracer
 from ai_content_audit.models import (
     AuditOptionsItem,
     AuditDecision,
     AuditContent,
     AuditResult,
+    AuditPackedDecision,
+    AuditUsage,
+    UNCERTAIN_CHOICES,
+    create_multi_decision_model,
+    split_multi_decision,
+)
+from ai_content_audit.runtime import (
+    AdaptiveConcurrencyLimiter,
+    ClientPool,
+    HedgePolicy,
+    ItemPlanner,
+    ModelCascade,
+    PriorityScheduler,
+    RateLimiter,
+    RetryPolicy,
+    SingleFlight,
+    usage_total_tokens,
 )
-from ai_content_audit.prompts import build_messages
+from ai_content_audit.runtime.scheduler import Priority
+from ai_content_audit.prompts import (
+    build_messages,
+    build_multi_item_messages,
+    build_packed_messages,
+    estimate_text_tokens,
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
 
 
 def _ensure_choice(choice: str | None, options: Dict[str, str]) -> str:
@@ -29,12 +85,194 @@ def _ensure_choice(choice: str | None, options: Dict[str, str]) -> str:
         return choice
     # 尝试回退到“不确定”类标签
     for k in options.keys():
-        if k in ("不确定", "无法判断", "Uncertain", "Unknown"):
+        if k in UNCERTAIN_CHOICES:
             return k
     # 否则回退到第一个选项
     return next(iter(options.keys()))
 
 
+def _finalize_decision(
+    decision: AuditDecision, item: AuditOptionsItem
+) -> AuditDecision:
+    """
+    结果兜底与清洗：规范化 choice，并保证 reason 非空。
+
+    参数：
+    - decision (AuditDecision): 模型解析得到的原始决策。
+    - item (AuditOptionsItem): 对应的审核项。
+
+    返回：
+    - AuditDecision: 清洗后的决策（原地修改并返回）。
+    """
+    decision.choice = _ensure_choice(decision.choice, item.options)
+    decision.reason = (decision.reason or "").strip() or "基于文本与选项说明给出的判定"
+    return decision
+
+
+def _fallback_decision(item: AuditOptionsItem) -> AuditDecision:
+    """生成模型调用失败时的兜底决策。"""
+    return AuditDecision(
+        choice=_ensure_choice(None, item.options),
+        reason="模型调用失败",
+    )
+
+
+def _prefilter_decision(
+    content: AuditContent, item: AuditOptionsItem
+) -> Optional[AuditDecision]:
+    """应用审核项的本地预过滤器（仅文本），能直接确定时返回决策，否则返回 None。"""
+    if item.prefilter is None or content.file_type != "text":
+        return None
+    return item.prefilter.apply(content.content)
+
+
+def _record_usage(usage: AuditUsage, resp: Any) -> None:
+    """将模型响应的 usage（输入、输出、提示词缓存 token）累加到 AuditUsage，缺失的字段按 0 计。"""
+    raw = getattr(resp, "usage", None)
+
+    def count(obj: Any, name: str) -> int:
+        value = getattr(obj, name, None)
+        return value if isinstance(value, int) else 0
+
+    prompt = count(raw, "prompt_tokens")
+    completion = count(raw, "completion_tokens")
+    total = usage_total_tokens(resp)
+    usage.prompt_tokens += prompt
+    usage.completion_tokens += completion
+    usage.cached_tokens += count(
+        getattr(raw, "prompt_tokens_details", None), "cached_tokens"
+    )
+    usage.total_tokens += total if total is not None else prompt + completion
+
+
+@contextmanager
+def _timed_stage(metrics: Optional[AuditMetrics], stage: str) -> Iterator[None]:
+    """记录代码块耗时到 metrics 的阶段直方图，metrics 为 None 时不计时。"""
+    if metrics is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.observe_stage(stage, time.perf_counter() - started)
+
+
+class _CallStats:
+    """
+    内部：一次审核的调用统计（模型调用尝试次数、是否命中缓存/预过滤、最终模型与是否升级、
+    模型调用用量 AuditUsage），由调用方创建并向下传递。
+
+    hedge、priority 与 tenant 为调用方的设置：是否允许对冲请求（仅 audit_one）与调度优先级、租户。
+    """
+
+    __slots__ = (
+        "attempts",
+        "cache_hit",
+        "model",
+        "escalated",
+        "prefiltered",
+        "hedge",
+        "usage",
+        "priority",
+        "tenant",
+    )
+
+    def __init__(
+        self,
+        *,
+        cache_hit: bool = False,
+        model: Optional[str] = None,
+        prefiltered: bool = False,
+        hedge: bool = False,
+        priority: Priority = "interactive",
+        tenant: Optional[str] = None,
+    ) -> None:
+        self.attempts = 0
+        self.cache_hit = cache_hit
+        self.model = model
+        self.escalated = False
+        self.prefiltered = prefiltered
+        self.hedge = hedge
+        self.usage = AuditUsage()
+        self.priority = priority
+        self.tenant = tenant
+
+
+def _make_result(
+    content: AuditContent,
+    item: AuditOptionsItem,
+    decision: AuditDecision,
+    *,
+    batch_id: Optional[UUID] = None,
+    stats: Optional[_CallStats] = None,
+    status: str = "success",
+) -> AuditResult:
+    """由内容、审核项、决策与调用统计构建 AuditResult；status 见 AuditResult.status。"""
+    stats = stats or _CallStats()
+    return AuditResult(
+        batch_id=batch_id,
+        text_id=content.id,
+        item_id=item.id,
+        item_name=item.name,
+        text_excerpt=content.content,
+        decision=decision,
+        cache_hit=stats.cache_hit,
+        attempts=stats.attempts,
+        status=status,
+        model=stats.model,
+        escalated=stats.escalated,
+        prefiltered=stats.prefiltered,
+        usage=stats.usage.model_copy(),
+    )
+
+
+def _spread_usage(results: List[AuditResult], stats: _CallStats) -> None:
+    """
+    将一次失败的合并调用的尝试次数与用量按整数均分累加到回退结果上，汇总时总量不变。
+    """
+    n = len(results)
+
+    def parts(total: int) -> List[int]:
+        quotient, remainder = divmod(total, n)
+        return [quotient + (i < remainder) for i in range(n)]
+
+    for result, part in zip(results, parts(stats.attempts)):
+        result.attempts += part
+    for field in (
+        "prompt_tokens",
+        "completion_tokens",
+        "cached_tokens",
+        "total_tokens",
+    ):
+        for result, part in zip(results, parts(getattr(stats.usage, field))):
+            setattr(result.usage, field, getattr(result.usage, field) + part)
+    for result in results:
+        result.usage.latency += stats.usage.latency / n
+
+
+def _is_blocking(result: AuditResult, item: AuditOptionsItem) -> bool:
+    """审核结果是否为该审核项的阻断结论（仅成功的结论计入）。"""
+    return (
+        result.status == "success" and result.decision.choice in item.blocking_choices
+    )
+
+
+def _skipped_result(
+    content: AuditContent,
+    item: AuditOptionsItem,
+    blocker: AuditResult,
+    *,
+    batch_id: Optional[UUID] = None,
+) -> AuditResult:
+    """生成因前序审核项给出阻断结论而跳过的结果（status="skipped"，未调用模型）。"""
+    decision = AuditDecision(
+        choice=_ensure_choice(None, item.options),
+        reason=f"已跳过：审核项「{blocker.item_name}」给出阻断结论「{blocker.decision.choice}」",
+    )
+    return _make_result(content, item, decision, batch_id=batch_id, status="skipped")
+
+
 class AuditManager:
     """
     审核管理器
@@ -42,23 +280,326 @@ class AuditManager:
     职责：
     - 管理与大模型的交互（持有 client 与默认 model）。
     - 将审核项与审核文本组装为消息，调用模型生成结构化结果（AuditDecision）。
-    - 支持批量审核，提高处理效率。
+    - 支持批量审核，提高处理效率（可选线程池并发执行）。
     """
 
-    def __init__(self, client: OpenAI, model: str) -> None:
+    def __init__(
+        self,
+        client: Union[OpenAI, ClientPool],
+        model: str,
+        *,
+        max_concurrency: int = 1,
+        cache: Optional[AuditCache] = None,
+        single_flight: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        cascade: Optional[ModelCascade] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        planner: Optional[ItemPlanner] = None,
+        scheduler: Optional[PriorityScheduler] = None,
+        metrics: Optional[AuditMetrics] = None,
+        tracer: Optional[Tracer] = None,
+    ) -> None:
         """
         初始化审核管理器。
 
         参数：
-        - client (OpenAI): OpenAI 兼容客户端，用于与大模型交互。应已配置 base_url 与 api_key。
+        - client (Union[OpenAI, ClientPool]): OpenAI 兼容客户端，用于与大模型交互。应已配置 base_url 与 api_key。
+          传入 ClientPool 时，每次模型请求（含重试）从池中按负载与健康状况选择端点；
+          方法级 client= 覆盖时不经过客户端池。
         - model (str): 默认模型名称，方法调用时可临时覆盖。需与客户端兼容。
+        - max_concurrency (int): audit_batch 的默认并发数（线程池大小），默认 1 即顺序执行。
+        - cache (Optional[AuditCache]): 可选审核结论缓存（如 MemoryCache、SQLiteCache）。
+          缓存键为 内容哈希 + 审核项指纹 + 模型名称，命中时不调用模型，结果 cache_hit 为 True。
+        - single_flight (bool): 是否合并相同 内容 + 审核项 + 模型 的并发在途请求（默认 True），
+          并发的重复调用只发起一次模型请求，所有调用者得到相同的 AuditDecision。
+        - rate_limiter (Optional[RateLimiter]): 可选客户端 RPM/TPM 限流器，按配额匀速发送请求，避免触发 429。
+        - retry_policy (Optional[RetryPolicy]): 可选重试策略，对限流、超时、5xx 等可重试错误指数退避重试，
+          鉴权与校验类错误立即失败。结果的 attempts 字段记录实际调用次数。
+        - concurrency_limiter (Optional[AdaptiveConcurrencyLimiter]): 可选自适应并发限制器（AIMD），
+          根据延迟与 429/超时动态调整同时在途的模型请求数；启用后 audit_batch 的线程池大小
+          默认取 max(max_concurrency, concurrency_limiter.max_limit)，实际并发由限制器决定。
+        - cascade (Optional[ModelCascade]): 可选模型级联，先用快速模型审核，仅将“不确定”类或指定标签的结论
+          升级到主模型（model）重新审核；结果的 model 与 escalated 字段记录最终模型与是否升级。
+          作用于单审核项调用（audit_one、audit_batch / audit_iter 默认模式）；combine_items 与 audit_packed
+          的合并调用直接使用主模型。
+        - hedge_policy (Optional[HedgePolicy]): 可选对冲请求策略，仅作用于 audit_one：请求超过对冲延迟
+          （默认为近期延迟的 p95）仍未返回时再发起一个相同请求，取先返回者，用于降低尾延迟；
+          对冲率由 hedge_policy.hedge_rate 报告并受 max_hedge_rate 限制。
+        - planner (Optional[ItemPlanner]): 可选审核项排序规划器。批量审核的单审核项调用按审核项记录
+          阻断率、耗时与 token 用量；短路模式（short_circuit=True）按期望成本最小的顺序审核。
+        - scheduler (Optional[PriorityScheduler]): 可选优先级调度器，每次模型请求（含限流等待）前按优先级排队：
+          interactive 请求优先获得名额，bulk 请求使用剩余名额。audit_one / audit_items 默认 interactive，
+          audit_batch / audit_iter / audit_packed 默认 bulk，可通过 priority= 覆盖；tenant= 用于按租户加权公平排队。
+          同时配置 concurrency_limiter 时调度器绑定该限制器，名额数随其并发上限收缩。
+        - metrics (Optional[AuditMetrics]): 可选审核指标，记录模型请求数与结果（含 429）、审核结果与兜底次数、
+          token 用量、在途请求数，以及构建消息 / 模型请求 / 结果校验各阶段耗时，可通过 metrics.exposition()
+          以 Prometheus 文本格式输出；同时配置 concurrency_limiter 时还输出其当前并发上限与在途请求数。
+        - tracer (Optional[Tracer]): 可选追踪器，默认使用全局追踪器（见 tracing.set_tracer）。为审核调用、
+          调度 / 限流 / 并发等待、每次模型请求尝试、HTTP 请求、重试退避与结果校验记录带父子关系的 span，
+          属性含 batch_id、text_id、item_id 与模型名称。
 
         使用场景：
         - 单文本审核：调用 audit_one 对单个文本应用单个审核项。
         - 批量审核：调用 audit_batch 对多个文本应用多个审核项，自动处理失败项。
         """
-        self.client = client
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency 必须大于等于 1")
+        if isinstance(client, ClientPool):
+            self.client = None
+            self.client_pool: Optional[ClientPool] = client
+        else:
+            self.client = client
+            self.client_pool = None
         self.model = model
+        self.max_concurrency = max_concurrency
+        self.cache = cache
+        self._single_flight = SingleFlight() if single_flight else None
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.concurrency_limiter = concurrency_limiter
+        self.cascade = cascade
+        self.hedge_policy = hedge_policy
+        self.planner = planner
+        self.scheduler = scheduler
+        if scheduler is not None and concurrency_limiter is not None:
+            scheduler.bind_limiter(concurrency_limiter)
+        if metrics is not None and concurrency_limiter is not None:
+            metrics.track_limiter(concurrency_limiter)
+        self.metrics = metrics
+        self.tracer = tracer
+
+    def _parse(
+        self,
+        messages: List[Dict[str, Any]],
+        response_format: Type[BaseModel],
+        *,
+        client: Optional[OpenAI] = None,
+        model: Optional[str] = None,
+        stats: Optional[_CallStats] = None,
+    ) -> Any:
+        """
+        内部方法：所有模型调用的统一出口，调用 chat.completions.parse 获取结构化输出。
+
+        - 启用限流器时，每次尝试前按估算 token 预约 RPM/TPM 配额，返回后用实际 usage 修正。
+        - 启用重试策略时，可重试错误按退避时间等待后重试，最终失败抛出最后一次的异常。
+        - 启用优先级调度器时，每次尝试（含限流等待）按 stats 的优先级与租户占用调度名额，重试等待期间不占用。
+
+        参数：
+        - messages (List[Dict[str, Any]]): 已构建的消息列表。
+        - response_format (Type[BaseModel]): 结构化输出模型。
+        - client (Optional[OpenAI]): 可选覆盖客户端。
+        - model (Optional[str]): 可选覆盖模型。
+        - stats (Optional[_CallStats]): 可选调用统计，记录尝试次数。
+
+        返回：
+        - 模型响应对象（choices[0].message.parsed 为 response_format 实例）。
+        """
+        # 选择客户端与模型（允许方法级覆盖）
+        use_client = client or self.client
+        use_model = model or self.model
+
+        attempt = 0
+        while True:
+            attempt += 1
+            if stats is not None:
+                stats.attempts += 1
+                stats.model = use_model
+
+            estimated = 0
+            started = time.perf_counter()
+            tracer = self._tracer()
+            try:
+                with (
+                    tracer.span("model.attempt", model=use_model, attempt=attempt),
+                    self._slot(stats),
+                ):
+                    if self.rate_limiter is not None:
+                        estimated = self.rate_limiter.estimate_tokens(messages)
+                        with tracer.span("ratelimit.wait", tokens=estimated):
+                            self.rate_limiter.acquire(estimated)
+
+                    started = time.perf_counter()
+                    if (
+                        stats is not None
+                        and stats.hedge
+                        and self.hedge_policy is not None
+                    ):
+                        resp = self._create_hedged(
+                            use_client, use_model, messages, response_format
+                        )
+                    else:
+                        resp = self._create(
+                            use_client, use_model, messages, response_format
+                        )
+            except Exception as e:
+                if stats is not None:
+                    stats.usage.latency += time.perf_counter() - started
+                if self.retry_policy is None or not self.retry_policy.should_retry(
+                    e, attempt
+                ):
+                    raise
+                with tracer.span("retry.backoff", attempt=attempt):
+                    time.sleep(self.retry_policy.delay(e, attempt))
+                continue
+
+            tokens = usage_total_tokens(resp)
+            if stats is not None:
+                stats.usage.latency += time.perf_counter() - started
+                _record_usage(stats.usage, resp)
+            if self.rate_limiter is not None:
+                self.rate_limiter.reconcile(estimated, tokens)
+            return resp
+
+    def _tracer(self) -> Tracer:
+        """内部方法：管理器的追踪器，未配置时使用当前（全局）追踪器。"""
+        return self.tracer if self.tracer is not None else get_tracer()
+
+    @contextmanager
+    def _slot(self, stats: Optional[_CallStats]) -> Iterator[None]:
+        """内部方法：按调用统计中的优先级与租户占用调度名额的上下文管理器，未启用调度器时为空操作。"""
+        if self.scheduler is None:
+            yield
+            return
+        priority, tenant = (
+            (stats.priority, stats.tenant)
+            if stats is not None
+            else ("interactive", None)
+        )
+        with self._tracer().span("scheduler.wait", priority=priority, tenant=tenant):
+            self.scheduler.acquire(priority, tenant=tenant)
+        try:
+            yield
+        finally:
+            self.scheduler.release()
+
+    def _create(
+        self,
+        client: Optional[OpenAI],
+        model: str,
+        messages: List[Dict[str, Any]],
+        response_format: Type[BaseModel],
+    ) -> Any:
+        """
+        内部方法：发起一次模型请求。
+
+        - 启用自适应并发限制器时，请求前占用名额，结束后以延迟或异常反馈给限制器。
+        - 未指定客户端且配置了客户端池时，从池中选择端点，结束后反馈延迟或异常。
+        - 启用指标时，记录在途请求数与请求结果、耗时。
+        """
+        tracer = self._tracer()
+        limiter = self.concurrency_limiter
+        if limiter is not None:
+            with tracer.span("concurrency.wait"):
+                limiter.acquire()
+
+        endpoint = None
+        if client is None and self.client_pool is not None:
+            endpoint = self.client_pool.acquire()
+            client = endpoint.client
+            if endpoint.model and model == self.model:
+                model = endpoint.model
+
+        metrics = self.metrics
+        if metrics is not None:
+            metrics.in_flight.inc()
+        span = tracer.start_span(
+            "http.request",
+            model=model,
+            endpoint=endpoint.name if endpoint is not None else None,
+        )
+        started = time.perf_counter()
+        try:
+            resp = client.chat.completions.parse(
+                model=model, messages=messages, response_format=response_format
+            )
+        except BaseException as e:
+            tracer.end_span(span, e)
+            if metrics is not None:
+                metrics.in_flight.dec()
+                metrics.observe_request(model, error=e)
+            if endpoint is not None:
+                self.client_pool.release(endpoint, error=e)
+            if limiter is not None:
+                limiter.release(error=e)
+            raise
+        latency = time.perf_counter() - started
+        tracer.end_span(span)
+        if metrics is not None:
+            metrics.in_flight.dec()
+            metrics.observe_request(model, latency=latency)
+        if endpoint is not None:
+            self.client_pool.release(endpoint, latency=latency)
+        if limiter is not None:
+            limiter.release(latency=latency)
+        return resp
+
+    def _create_hedged(
+        self,
+        client: Optional[OpenAI],
+        model: str,
+        messages: List[Dict[str, Any]],
+        response_format: Type[BaseModel],
+    ) -> Any:
+        """
+        内部方法：以对冲方式发起模型请求（仅 audit_one 使用）。
+
+        原请求在对冲延迟内未返回且未超过对冲率上限时，向备用客户端 / 模型发起相同请求，取先成功返回者。
+        同步客户端无法中断进行中的请求，落后的请求在后台线程结束后丢弃结果。
+        两个请求都失败时抛出原请求的异常。
+        """
+        policy = self.hedge_policy
+        delay = policy.delay()
+        primary = self._submit_create(client, model, messages, response_format)
+        try:
+            return primary.result(timeout=delay)
+        except FuturesTimeoutError:
+            pass
+        if not policy.try_hedge():
+            return primary.result()
+
+        hedge = self._submit_create(
+            policy.client or client,
+            policy.model or model,
+            messages,
+            response_format,
+        )
+        futures = [primary, hedge]
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            # 同时完成时优先原请求
+            for future in futures:
+                if future in done and future.exception() is None:
+                    if future is hedge:
+                        policy.record_win()
+                    return future.result()
+        return primary.result()
+
+    def _submit_create(
+        self,
+        client: Optional[OpenAI],
+        model: str,
+        messages: List[Dict[str, Any]],
+        response_format: Type[BaseModel],
+    ) -> Future:
+        """
+        内部方法：在对冲策略的共享线程池中发起一次模型请求，成功时向对冲策略记录延迟样本。
+
+        同步客户端的请求无法中断，原请求也须在后台执行，调用方才能在对冲请求先返回时立即返回。
+        """
+        policy = self.hedge_policy
+
+        def run() -> Any:
+            started = time.perf_counter()
+            resp = self._create(client, model, messages, response_format)
+            policy.observe(time.perf_counter() - started)
+            return resp
+
+        # 复制上下文，使线程池中的 span 仍挂在当前 span 下
+        context = contextvars.copy_context()
+        return policy.executor().submit(context.run, run)
 
     def _audit_content_with_item(
         self,
@@ -67,6 +608,7 @@ class AuditManager:
         *,
         client: Optional[OpenAI] = None,
         model: Optional[str] = None,
+        stats: Optional[_CallStats] = None,
     ) -> AuditDecision:
         """
         内部方法：审核单个待审核内容与单个审核项，返回 AuditDecision。
@@ -76,29 +618,306 @@ class AuditManager:
         - item (AuditOptionsItem): 审核项。
         - client (Optional[OpenAI]): 可选覆盖客户端。
         - model (Optional[str]): 可选覆盖模型。
+        - stats (Optional[_CallStats]): 可选调用统计。
 
         返回：
         - AuditDecision: 审核决策结果。
         """
         # 构建消息
-        messages = build_messages(content=content, item=item)
-
-        # 选择客户端与模型（允许方法级覆盖）
-        use_client = client or self.client
-        use_model = model or self.model
+        with _timed_stage(self.metrics, "prompt_build"):
+            messages = build_messages(content=content, item=item)
 
         # 结构化输出（优先使用 parse -> Pydantic）
-        resp = use_client.chat.completions.parse(
-            model=use_model,
-            messages=messages,
-            response_format=AuditDecision,
+        resp = self._parse(
+            messages, AuditDecision, client=client, model=model, stats=stats
         )
-        result: AuditDecision = resp.choices[0].message.parsed
 
         # 结果兜底与清洗
-        result.choice = _ensure_choice(result.choice, item.options)
-        result.reason = (result.reason or "").strip() or "基于文本与选项说明给出的判定"
-        return result
+        with _timed_stage(self.metrics, "parse"), self._tracer().span("audit.parse"):
+            result: AuditDecision = resp.choices[0].message.parsed
+            return _finalize_decision(result, item)
+
+    def _audit_content_with_items(
+        self,
+        content: AuditContent,
+        items: List[AuditOptionsItem],
+        *,
+        client: Optional[OpenAI] = None,
+        model: Optional[str] = None,
+        stats: Optional[_CallStats] = None,
+    ) -> List[AuditDecision]:
+        """
+        内部方法：一次调用审核单个内容与多个审核项，返回与 items 对应的 AuditDecision 列表。
+
+        参数：
+        - content (AuditContent): 待审核内容。
+        - items (List[AuditOptionsItem]): 审核项列表。
+        - client (Optional[OpenAI]): 可选覆盖客户端。
+        - model (Optional[str]): 可选覆盖模型。
+        - stats (Optional[_CallStats]): 可选调用统计。
+
+        返回：
+        - List[AuditDecision]: 审核决策列表，顺序与 items 一致。
+        """
+        with _timed_stage(self.metrics, "prompt_build"):
+            messages = build_multi_item_messages(content=content, items=items)
+
+        # 动态生成的多审核项决策模型：每个审核项一个 AuditDecision 字段
+        resp = self._parse(
+            messages,
+            create_multi_decision_model(items),
+            client=client,
+            model=model,
+            stats=stats,
+        )
+
+        with _timed_stage(self.metrics, "parse"), self._tracer().span("audit.parse"):
+            parsed = resp.choices[0].message.parsed
+            return [
+                _finalize_decision(decision, it)
+                for decision, it in zip(split_multi_decision(parsed, items), items)
+            ]
+
+    def _audit_contents_with_item(
+        self,
+        contents: List[AuditContent],
+        item: AuditOptionsItem,
+        *,
+        client: Optional[OpenAI] = None,
+        model: Optional[str] = None,
+        stats: Optional[_CallStats] = None,
+    ) -> Dict[int, AuditDecision]:
+        """
+        内部方法：一次调用审核多条文本与单个审核项（打包审核）。
+
+        参数：
+        - contents (List[AuditContent]): 待审核文本列表。
+        - item (AuditOptionsItem): 审核项。
+        - client (Optional[OpenAI]): 可选覆盖客户端。
+        - model (Optional[str]): 可选覆盖模型。
+        - stats (Optional[_CallStats]): 可选调用统计。
+
+        返回：
+        - Dict[int, AuditDecision]: 内容下标（从 0 开始）到决策的映射。
+          编号越界、重复或 choice 不在选项中的条目视为无效，不出现在映射中。
+        """
+        with _timed_stage(self.metrics, "prompt_build"):
+            messages = build_packed_messages(contents=contents, item=item)
+
+        resp = self._parse(
+            messages, AuditPackedDecision, client=client, model=model, stats=stats
+        )
+        with _timed_stage(self.metrics, "parse"), self._tracer().span("audit.parse"):
+            return self._split_packed(resp, contents, item)
+
+    @staticmethod
+    def _split_packed(
+        resp: Any, contents: List[AuditContent], item: AuditOptionsItem
+    ) -> Dict[int, AuditDecision]:
+        """内部方法：校验打包审核的结构化结果，返回有效条目（见 _audit_contents_with_item）。"""
+        parsed: AuditPackedDecision = resp.choices[0].message.parsed
+
+        decisions: Dict[int, AuditDecision] = {}
+        for entry in parsed.decisions:
+            index = entry.index - 1
+            if not 0 <= index < len(contents) or index in decisions:
+                continue
+            if entry.choice not in item.options:
+                continue
+            decisions[index] = _finalize_decision(
+                AuditDecision(choice=entry.choice, reason=entry.reason), item
+            )
+        return decisions
+
+    def _local_decision(
+        self, content: AuditContent, item: AuditOptionsItem, model: Optional[str]
+    ) -> Optional[Tuple[AuditDecision, _CallStats]]:
+        """
+        内部方法：无需调用模型即可得到的决策（预过滤命中优先，其次缓存命中），否则返回 None。
+
+        返回：
+        - Optional[Tuple[AuditDecision, _CallStats]]: （审核决策, 调用统计）。
+        """
+        decision = _prefilter_decision(content, item)
+        if decision is not None:
+            return decision, _CallStats(prefiltered=True)
+        cached = self._cache_get(content, item, model)
+        if cached is not None:
+            return cached, _CallStats(cache_hit=True, model=model or self.model)
+        return None
+
+    def _cache_get(
+        self, content: AuditContent, item: AuditOptionsItem, model: Optional[str]
+    ) -> Optional[AuditDecision]:
+        """内部方法：读取缓存的审核结论，未启用缓存或未命中返回 None。"""
+        if self.cache is None:
+            return None
+        return self.cache.get(make_cache_key(content, item, model or self.model))
+
+    def _cache_set(
+        self,
+        content: AuditContent,
+        item: AuditOptionsItem,
+        model: Optional[str],
+        decision: AuditDecision,
+    ) -> None:
+        """内部方法：写入审核结论缓存（仅缓存模型成功返回的结论）。"""
+        if self.cache is None:
+            return
+        self.cache.set(make_cache_key(content, item, model or self.model), decision)
+
+    def _resolve_decision(
+        self,
+        content: AuditContent,
+        item: AuditOptionsItem,
+        *,
+        client: Optional[OpenAI] = None,
+        model: Optional[str] = None,
+        stats: _CallStats,
+    ) -> AuditDecision:
+        """
+        内部方法：获取单个内容 × 单个审核项的决策。
+
+        审核项配置预过滤器且能直接确定时不调用模型；配置模型级联时先用快速模型审核，结论需要复核（或快速模型调用失败）时升级到主模型，
+        stats 记录最终模型与是否升级。
+
+        参数：
+        - stats (_CallStats): 调用统计，两级调用的尝试次数累加记录。
+
+        返回：
+        - AuditDecision: 审核决策。
+        """
+        decision = _prefilter_decision(content, item)
+        if decision is not None:
+            stats.prefiltered = True
+            return decision
+
+        use_model = model or self.model
+        cascade = self.cascade
+        if cascade is not None:
+            try:
+                decision = self._resolve_tier(
+                    content,
+                    item,
+                    client=cascade.fast_client or client,
+                    model=cascade.fast_model,
+                    stats=stats,
+                )
+            except Exception:
+                decision = None
+            if decision is not None and not cascade.should_escalate(decision, item):
+                return decision
+            stats.escalated = True
+            stats.cache_hit = False
+
+        return self._resolve_tier(
+            content, item, client=client, model=use_model, stats=stats
+        )
+
+    def _resolve_tier(
+        self,
+        content: AuditContent,
+        item: AuditOptionsItem,
+        *,
+        client: Optional[OpenAI] = None,
+        model: Optional[str] = None,
+        stats: _CallStats,
+    ) -> AuditDecision:
+        """
+        内部方法：优先读取缓存，未命中时调用模型并写入缓存。
+
+        启用单飞去重时，相同 内容 + 审核项 + 模型 的并发调用共享同一次模型请求。
+
+        参数：
+        - stats (_CallStats): 调用统计，记录是否命中缓存与模型调用次数（失败时同样记录）。
+
+        返回：
+        - AuditDecision: 审核决策。
+        """
+        stats.model = model or self.model
+        # 未启用缓存与单飞时无需缓存键，跳过对整段内容的哈希
+        key = (
+            make_cache_key(content, item, stats.model)
+            if self.cache is not None or self._single_flight is not None
+            else None
+        )
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                stats.cache_hit = True
+                return cached
+
+        def call() -> Tuple[AuditDecision, bool]:
+            if self.cache is not None:
+                # 等待进入期间可能已有相同请求完成并写入缓存
+                cached = self.cache.get(key)
+                if cached is not None:
+                    return cached, True
+            decision = self._audit_content_with_item(
+                content, item, client=client, model=model, stats=stats
+            )
+            if self.cache is not None:
+                self.cache.set(key, decision)
+            return decision, False
+
+        if self._single_flight is None:
+            decision, stats.cache_hit = call()
+            return decision
+        (decision, cache_hit), shared = self._single_flight.do(key, call)
+        stats.cache_hit = cache_hit
+        # 共享结果时返回副本，避免多个 AuditResult 引用同一对象
+        return decision.model_copy() if shared else decision
+
+    def _resolve_decisions(
+        self,
+        content: AuditContent,
+        items: List[AuditOptionsItem],
+        *,
+        client: Optional[OpenAI] = None,
+        model: Optional[str] = None,
+        stats: _CallStats,
+    ) -> List[Tuple[AuditDecision, _CallStats]]:
+        """
+        内部方法：单个内容 × 多个审核项，缓存命中的审核项不再发送，其余审核项合并为一次调用。
+
+        参数：
+        - stats (_CallStats): 合并调用的统计（失败时同样记录调用次数）。
+
+        返回：
+        - List[Tuple[AuditDecision, _CallStats]]: 与 items 对应的（审核决策, 调用统计）列表。
+        """
+        resolved: List[Optional[Tuple[AuditDecision, _CallStats]]] = []
+        misses: List[int] = []
+        for index, it in enumerate(items):
+            local = self._local_decision(content, it, model)
+            resolved.append(local)
+            if local is None:
+                misses.append(index)
+
+        # 合并调用的用量由本次调用的全部审核项分摊
+        stats.usage.shared = max(len(misses), 1)
+        if len(misses) == 1:
+            it = items[misses[0]]
+            decisions = [
+                self._audit_content_with_item(
+                    content, it, client=client, model=model, stats=stats
+                )
+            ]
+        elif misses:
+            decisions = self._audit_content_with_items(
+                content,
+                [items[i] for i in misses],
+                client=client,
+                model=model,
+                stats=stats,
+            )
+        else:
+            decisions = []
+
+        for index, decision in zip(misses, decisions):
+            self._cache_set(content, items[index], model, decision)
+            resolved[index] = (decision, stats)
+        return resolved
 
     def audit_one(
         self,
@@ -107,6 +926,8 @@ class AuditManager:
         *,
         client: Optional[OpenAI] = None,
         model: Optional[str] = None,
+        priority: Priority = "interactive",
+        tenant: Optional[str] = None,
     ) -> AuditResult:
         """
         审核单个内容与单个审核项。
@@ -116,6 +937,8 @@ class AuditManager:
         - item (AuditOptionsItem): 审核项定义，AuditOptionsItem模型
         - client (Optional[OpenAI]): 可选覆盖客户端。
         - model (Optional[str]): 可选覆盖模型。
+        - priority (str): 调度优先级（启用 scheduler 时生效），默认 "interactive"。
+        - tenant (Optional[str]): 可选租户标识，用于同一优先级内的加权公平排队。
 
         返回：
         - AuditResult: 包含完整的审核信息。
@@ -144,20 +967,158 @@ class AuditManager:
         >>> print(f"理由: {result.decision.reason}")
         >>> print("=" * 60)
         """
-        # 获取审核决策
-        decision = self._audit_content_with_item(
-            content, item, client=client, model=model
-        )
+        # 获取审核决策（启用缓存时优先读取缓存）
+        stats = _CallStats(hedge=True, priority=priority, tenant=tenant)
+        with self._tracer().span("audit.one", text_id=content.id, item_id=item.id):
+            decision = self._resolve_decision(
+                content, item, client=client, model=model, stats=stats
+            )
 
         # 构建 AuditResult
-        result = AuditResult(
-            text_id=content.id,
-            item_id=item.id,
-            item_name=item.name,
-            text_excerpt=content.content,
-            decision=decision,
-        )
-        return result
+        return self._observe(_make_result(content, item, decision, stats=stats))
+
+    def audit_items(
+        self,
+        content: AuditContent,
+        items: List[AuditOptionsItem],
+        *,
+        client: Optional[OpenAI] = None,
+        model: Optional[str] = None,
+        priority: Priority = "interactive",
+        tenant: Optional[str] = None,
+    ) -> List[AuditResult]:
+        """
+        单次调用审核单个内容的多个审核项。
+
+        所有审核项渲染进同一个提示词，模型返回动态生成的结构化结果（每个审核项一个 AuditDecision），
+        再拆分为与 items 顺序一致的 AuditResult 列表。相比逐项调用 audit_one，内容只发送一次。
+
+        参数：
+        - content (AuditContent): 待审核内容。
+        - items (List[AuditOptionsItem]): 审核项列表，不能为空。
+        - client (Optional[OpenAI]): 可选覆盖客户端。
+        - model (Optional[str]): 可选覆盖模型。
+        - priority (str): 调度优先级（启用 scheduler 时生效），默认 "interactive"。
+        - tenant (Optional[str]): 可选租户标识，用于同一优先级内的加权公平排队。
+
+        返回：
+        - List[AuditResult]: 审核结果列表，顺序与 items 一致。
+
+        示例：
+        >>> results = manager.audit_items(content, [item1, item2, item3])
+        >>> for res in results:
+        ...     print(res.item_name, res.decision.choice)
+        """
+        with self._tracer().span(
+            "audit.items", text_id=content.id, item_ids=[it.id for it in items]
+        ):
+            resolved = self._resolve_decisions(
+                content,
+                items,
+                client=client,
+                model=model,
+                stats=_CallStats(priority=priority, tenant=tenant),
+            )
+        return [
+            self._observe(_make_result(content, it, decision, stats=stats))
+            for it, (decision, stats) in zip(items, resolved)
+        ]
+
+    def audit_packed(
+        self,
+        content: List[AuditContent],
+        item: AuditOptionsItem,
+        *,
+        client: Optional[OpenAI] = None,
+        model: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        max_pack_size: int = 20,
+        max_pack_tokens: int = 2000,
+        priority: Priority = "bulk",
+        tenant: Optional[str] = None,
+    ) -> List[AuditResult]:
+        """
+        打包审核：将多条短文本打包进同一请求，对单个审核项进行审核。
+
+        短文本场景下系统提示词、审核说明与输出格式占据了大部分 token，
+        打包后这些开销由一个包内的所有文本分摊。
+
+        参数：
+        - content (List[AuditContent]): 待审核内容列表。图片内容不参与打包，单独调用。
+        - item (AuditOptionsItem): 审核项。
+        - client (Optional[OpenAI]): 可选覆盖客户端。
+        - model (Optional[str]): 可选覆盖模型。
+        - max_concurrency (Optional[int]): 可选覆盖并发数（按包并发）。
+        - max_pack_size (int): 每个包最多包含的文本条数，默认 20。
+        - max_pack_tokens (int): 每个包内文本的估算 token 上限，默认 2000；超长文本单独成包。
+        - priority (str): 调度优先级（启用 scheduler 时生效），默认 "bulk"。
+        - tenant (Optional[str]): 可选租户标识，用于同一优先级内的加权公平排队。
+
+        返回：
+        - List[AuditResult]: 审核结果列表，顺序与 content 一致，同一次调用共用 batch_id。
+
+        失败策略：
+        - 包内缺失、编号错误或 choice 不在选项中的条目，回退为单条调用重新审核。
+        - 整包调用失败时，包内全部文本回退为单条调用；单条调用失败返回兜底结果，整体不抛出异常。
+
+        示例：
+        >>> comments = [loader.audit_data.create(content=t) for t in short_texts]
+        >>> results = manager.audit_packed(comments, item, max_pack_size=30)
+        """
+        if max_pack_size < 1:
+            raise ValueError("max_pack_size 必须大于等于 1")
+        workers = self._workers(max_concurrency)
+
+        batch_id = uuid4()
+
+        # 按条数与估算 token 贪心分包；图片单独成包且保持原有顺序
+        packs: List[List[AuditContent]] = []
+        current: List[AuditContent] = []
+        current_tokens = 0
+        for c in content:
+            if c.file_type != "text":
+                if current:
+                    packs.append(current)
+                    current, current_tokens = [], 0
+                packs.append([c])
+                continue
+            tokens = estimate_text_tokens(c.content)
+            if current and (
+                len(current) >= max_pack_size
+                or current_tokens + tokens > max_pack_tokens
+            ):
+                packs.append(current)
+                current, current_tokens = [], 0
+            current.append(c)
+            current_tokens += tokens
+        if current:
+            packs.append(current)
+
+        tracer = self._tracer()
+
+        def run(pack: List[AuditContent]) -> List[AuditResult]:
+            with tracer.span(
+                "audit.pack",
+                parent=parent,
+                batch_id=batch_id,
+                item_id=item.id,
+                text_ids=[c.id for c in pack],
+            ):
+                return self._audit_pack_cell(
+                    batch_id,
+                    pack,
+                    item,
+                    client=client,
+                    model=model,
+                    priority=priority,
+                    tenant=tenant,
+                )
+
+        results: List[AuditResult] = []
+        with tracer.span("audit.packed", batch_id=batch_id, item_id=item.id) as parent:
+            for chunk in self._map(run, packs, workers):
+                results.extend(self._observe(r) for r in chunk)
+        return results
 
     def audit_batch(
         self,
@@ -166,6 +1127,13 @@ class AuditManager:
         *,
         client: Optional[OpenAI] = None,
         model: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        combine_items: bool = False,
+        batch_id: Optional[UUID] = None,
+        journal: Optional[BatchJournal] = None,
+        short_circuit: bool = False,
+        priority: Priority = "bulk",
+        tenant: Optional[str] = None,
     ) -> List[AuditResult]:
         """
         批量审核：对多个内容依次应用多个审核项。
@@ -175,12 +1143,21 @@ class AuditManager:
         - items (List[AuditOptionsItem]): 审核项列表，对每个内容依次应用。
         - client (Optional[OpenAI]): 可选覆盖客户端。
         - model (Optional[str]): 可选覆盖模型。
+        - max_concurrency (Optional[int]): 可选覆盖并发数；大于 1 时使用线程池并发调用模型。
+        - combine_items (bool): 为 True 时每个内容只调用一次模型，同时给出全部审核项的决策（见 audit_items），
+          内容（尤其是图片）只发送一次，可显著减少调用次数与输入 token。
+        - batch_id (Optional[UUID]): 可选批次ID，默认新生成；续跑时传入上次的批次ID。
+        - journal (Optional[BatchJournal]): 可选批量审核日志，用于中断后续跑（见 audit_iter）。
+        - short_circuit (bool): 短路模式，内容被某审核项的阻断结论（blocking_choices）拒绝后跳过剩余审核项（见 audit_iter）。
+        - priority (str): 调度优先级（启用 scheduler 时生效），默认 "bulk"。
+        - tenant (Optional[str]): 可选租户标识，用于同一优先级内的加权公平排队。
 
         返回：
-        - List[AuditResult]: 审核结果列表，每个元素包含完整的审核信息。
+        - List[AuditResult]: 审核结果列表，顺序与 内容×审核项 的嵌套顺序一致（与并发数无关）。
 
         失败策略：
-        - 单项失败不影响其它项，失败项返回兜底 choice 与 "模型调用失败" 理由。
+        - 单项失败不影响其它项，失败项返回兜底 choice 与 "模型调用失败" 理由（status="failed"）。
+        - combine_items 模式下一次调用失败时，该内容的全部审核项均返回兜底结果。
         - 整体不抛出异常，确保批量处理继续。
 
         示例：
@@ -207,38 +1184,452 @@ class AuditManager:
         ...     print("-" * 40)
         >>> print("=" * 80)
         """
-        # 生成批次ID
-        batch_id = uuid4()
-        results: List[AuditResult] = []
+        return list(
+            self.audit_iter(
+                content,
+                items,
+                client=client,
+                model=model,
+                max_concurrency=max_concurrency,
+                combine_items=combine_items,
+                ordered=True,
+                batch_id=batch_id,
+                journal=journal,
+                short_circuit=short_circuit,
+                priority=priority,
+                tenant=tenant,
+            )
+        )
 
-        for c in content:
-            for it in items:
-                try:
-                    decision = self._audit_content_with_item(
-                        c, it, client=client, model=model
+    def audit_iter(
+        self,
+        content: Iterable[AuditContent],
+        items: List[AuditOptionsItem],
+        *,
+        client: Optional[OpenAI] = None,
+        model: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        combine_items: bool = False,
+        ordered: bool = False,
+        max_pending: Optional[int] = None,
+        batch_id: Optional[UUID] = None,
+        journal: Optional[BatchJournal] = None,
+        short_circuit: bool = False,
+        priority: Priority = "bulk",
+        tenant: Optional[str] = None,
+    ) -> Iterator[AuditResult]:
+        """
+        流式批量审核：逐个产出审核结果，适合超大规模输入与边审边写的场景。
+
+        与 audit_batch 语义一致（同一 batch_id、失败返回兜底结果、不抛出异常），区别在于：
+        - content 可以是任意可迭代对象（含生成器），按需惰性读取，不会一次性展开。
+        - 已提交但未产出的任务数不超过 max_pending，内存占用与输入规模无关。
+        - 结果一经完成即产出，下游可立即开始写入。
+
+        参数：
+        - content (Iterable[AuditContent]): 待审核内容的可迭代对象。
+        - items (List[AuditOptionsItem]): 审核项列表，对每个内容依次应用。
+        - client (Optional[OpenAI]): 可选覆盖客户端。
+        - model (Optional[str]): 可选覆盖模型。
+        - max_concurrency (Optional[int]): 可选覆盖并发数。
+        - combine_items (bool): 为 True 时每个内容一次调用覆盖全部审核项（见 audit_batch）。
+        - ordered (bool): 为 True 时按 内容×审核项 的输入顺序产出；默认 False，按完成顺序产出。
+        - max_pending (Optional[int]): 最大已提交未产出的任务数，默认 并发数 × 2。
+        - batch_id (Optional[UUID]): 可选批次ID，默认新生成；续跑时传入上次的批次ID。
+        - journal (Optional[BatchJournal]): 可选批量审核日志，成功的单元格逐条追加写入；
+          同一 batch_id 再次运行时，日志中已完成的单元格直接由日志恢复结果（attempts=0），不再调用模型，
+          也不计入 metrics 指标。
+        - short_circuit (bool): 短路模式，每个内容按 items 顺序逐项审核，某审核项给出其 blocking_choices
+          中的结论后，该内容的剩余审核项不再调用模型，返回 status="skipped" 的结果。不能与 combine_items 同时使用。
+          配置 planner 时按规划器给出的顺序审核（结果顺序不变）。
+        - priority (str): 调度优先级（启用 scheduler 时生效），默认 "bulk"。
+        - tenant (Optional[str]): 可选租户标识，用于同一优先级内的加权公平排队。
+
+        返回：
+        - Iterator[AuditResult]: 审核结果迭代器。提前停止迭代时，尚未开始的任务会被取消。
+
+        示例：
+        >>> def read_contents(path):
+        ...     with open(path, encoding="utf-8") as f:
+        ...         for line in f:
+        ...             yield loader.audit_data.create(content=line.strip())
+        >>> with open("results.jsonl", "w", encoding="utf-8") as out:
+        ...     for res in manager.audit_iter(read_contents("input.txt"), items, max_concurrency=8):
+        ...         out.write(res.model_dump_json() + "\\n")
+        """
+        workers = self._workers(max_concurrency)
+        if max_pending is None:
+            max_pending = workers * 2
+        if max_pending < 1:
+            raise ValueError("max_pending 必须大于等于 1")
+        if short_circuit and combine_items:
+            raise ValueError("short_circuit 与 combine_items 不能同时使用")
+
+        # 生成批次ID（续跑时沿用传入的批次ID）
+        if batch_id is None:
+            batch_id = uuid4()
+        completed = journal.load(batch_id) if journal is not None else {}
+        use_model = model or self.model
+
+        if short_circuit or (combine_items and len(items) > 1):
+            # 每个内容一个任务：合并为一次调用，或短路模式下按顺序逐项审核
+            units: Iterable[Tuple[AuditContent, List[AuditOptionsItem]]] = (
+                (c, items) for c in content
+            )
+        else:
+            units = ((c, [it]) for c in content for it in items)
+
+        def audit(c: AuditContent, its: List[AuditOptionsItem]) -> List[AuditResult]:
+            if len(its) > 1:
+                return self._audit_multi_cell(
+                    batch_id,
+                    c,
+                    its,
+                    client=client,
+                    model=model,
+                    priority=priority,
+                    tenant=tenant,
+                )
+            return [
+                self._audit_cell(
+                    batch_id,
+                    c,
+                    its[0],
+                    client=client,
+                    model=model,
+                    priority=priority,
+                    tenant=tenant,
+                )
+            ]
+
+        def resolve(c: AuditContent, its: List[AuditOptionsItem]) -> List[AuditResult]:
+            if journal is None:
+                return [self._observe(r) for r in audit(c, its)]
+
+            # 跳过日志中已完成的单元格，只审核剩余审核项
+            keys = [make_cache_key(c, it, use_model) for it in its]
+            todo = [it for it, key in zip(its, keys) if key not in completed]
+            fresh = iter(audit(c, todo) if todo else [])
+            results: List[AuditResult] = []
+            for it, key in zip(its, keys):
+                decision = completed.get(key)
+                if decision is not None:
+                    results.append(
+                        _make_result(c, it, decision.model_copy(), batch_id=batch_id)
                     )
-                    result = AuditResult(
-                        batch_id=batch_id,
-                        text_id=c.id,
-                        item_id=it.id,
-                        item_name=it.name,
-                        text_excerpt=c.content,
-                        decision=decision,
+                    continue
+                result = next(fresh)
+                if result.status == "success":
+                    journal.record(batch_id, key, result)
+                # 只记录本次实际审核的结果，由日志恢复的结果不计入指标
+                results.append(self._observe(result))
+            return results
+
+        # 短路模式下的审核顺序：配置规划器时按期望成本最小排序，结果仍按 items 原顺序返回
+        order = list(range(len(items)))
+        if short_circuit and self.planner is not None:
+            order = self.planner.plan_order(items)
+
+        tracer = self._tracer()
+        batch_span = tracer.start_span("audit.batch", batch_id=batch_id)
+
+        def run(unit: Tuple[AuditContent, List[AuditOptionsItem]]) -> List[AuditResult]:
+            c, its = unit
+            with tracer.span(
+                "audit.unit",
+                parent=batch_span,
+                batch_id=batch_id,
+                text_id=c.id,
+                item_ids=[it.id for it in its],
+            ):
+                return evaluate(c, its)
+
+        def evaluate(c: AuditContent, its: List[AuditOptionsItem]) -> List[AuditResult]:
+            if not short_circuit:
+                return resolve(c, its)
+
+            # 按顺序逐项审核，出现阻断结论后跳过该内容的剩余审核项
+            results: List[Optional[AuditResult]] = [None] * len(its)
+            blocker: Optional[AuditResult] = None
+            for index in order:
+                it = its[index]
+                if blocker is not None:
+                    results[index] = self._observe(
+                        _skipped_result(c, it, blocker, batch_id=batch_id)
                     )
-                    results.append(result)
-                except Exception:
-                    # 失败时创建兜底结果
-                    fallback_decision = AuditDecision(
-                        choice=_ensure_choice(None, it.options),
-                        reason="模型调用失败",
+                    continue
+                result = resolve(c, [it])[0]
+                results[index] = result
+                if _is_blocking(result, it):
+                    blocker = result
+            return results
+
+        error: Optional[BaseException] = None
+        try:
+            if workers == 1:
+                for unit in units:
+                    yield from run(unit)
+                return
+
+            executor = ThreadPoolExecutor(max_workers=workers)
+            try:
+                if ordered:
+                    # 队首完成后才产出，保证输入顺序
+                    queue: Deque[Future] = deque()
+                    for unit in units:
+                        queue.append(executor.submit(run, unit))
+                        if len(queue) >= max_pending:
+                            yield from queue.popleft().result()
+                    while queue:
+                        yield from queue.popleft().result()
+                else:
+                    pending: Set[Future] = set()
+                    for unit in units:
+                        pending.add(executor.submit(run, unit))
+                        if len(pending) >= max_pending:
+                            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                            for future in done:
+                                yield from future.result()
+                    while pending:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            yield from future.result()
+            finally:
+                # 提前停止迭代（break / close）时取消未开始的任务
+                executor.shutdown(wait=True, cancel_futures=True)
+        except GeneratorExit:
+            # 提前停止迭代不视为错误
+            raise
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            tracer.end_span(batch_span, error)
+
+    def _observe(self, result: AuditResult) -> AuditResult:
+        """内部方法：启用指标时记录审核结果，原样返回。"""
+        if self.metrics is not None:
+            self.metrics.observe_result(result)
+        return result
+
+    def _workers(self, max_concurrency: Optional[int]) -> int:
+        """
+        内部方法：确定批量执行的线程池大小。
+
+        未显式指定且启用自适应并发或优先级调度器时，取 max(max_concurrency, 限制器上界, 调度器名额数)，
+        实际在途请求数由限制器与调度器控制。
+        """
+        if max_concurrency is not None:
+            workers = max_concurrency
+        else:
+            workers = self.max_concurrency
+            if self.concurrency_limiter is not None:
+                workers = max(workers, self.concurrency_limiter.max_limit)
+            if self.scheduler is not None:
+                workers = max(workers, self.scheduler.max_concurrency)
+        if workers < 1:
+            raise ValueError("max_concurrency 必须大于等于 1")
+        return workers
+
+    @staticmethod
+    def _map(fn: Callable[[T], R], units: List[T], workers: int) -> List[R]:
+        """
+        内部方法：按并发数执行 fn，结果顺序与 units 一致。
+
+        workers 为 1（或任务数不超过 1）时顺序执行，否则使用线程池并发执行。
+        """
+        if workers == 1 or len(units) <= 1:
+            return [fn(unit) for unit in units]
+
+        # 线程池并发执行，map 保证结果顺序与输入一致
+        with ThreadPoolExecutor(max_workers=min(workers, len(units))) as executor:
+            return list(executor.map(fn, units))
+
+    def _audit_cell(
+        self,
+        batch_id: UUID,
+        content: AuditContent,
+        item: AuditOptionsItem,
+        *,
+        client: Optional[OpenAI] = None,
+        model: Optional[str] = None,
+        priority: Priority = "bulk",
+        tenant: Optional[str] = None,
+    ) -> AuditResult:
+        """
+        内部方法：批量审核中的单元格（单个内容 × 单个审核项），失败时返回兜底结果。
+
+        参数：
+        - batch_id (UUID): 批次ID。
+        - content (AuditContent): 待审核内容。
+        - item (AuditOptionsItem): 审核项。
+        - client (Optional[OpenAI]): 可选覆盖客户端。
+        - model (Optional[str]): 可选覆盖模型。
+        - priority (str): 调度优先级。
+        - tenant (Optional[str]): 可选租户标识。
+
+        返回：
+        - AuditResult: 审核结果，不抛出异常。
+        """
+        stats = _CallStats(priority=priority, tenant=tenant)
+        try:
+            decision = self._resolve_decision(
+                content, item, client=client, model=model, stats=stats
+            )
+        except Exception:
+            # 失败时创建兜底结果
+            return _make_result(
+                content,
+                item,
+                _fallback_decision(item),
+                batch_id=batch_id,
+                stats=stats,
+                status="failed",
+            )
+        if self.planner is not None:
+            self.planner.record(
+                item.id,
+                blocked=decision.choice in item.blocking_choices,
+                latency=stats.usage.latency,
+                tokens=stats.usage.total_tokens,
+            )
+        return _make_result(content, item, decision, batch_id=batch_id, stats=stats)
+
+    def _audit_multi_cell(
+        self,
+        batch_id: UUID,
+        content: AuditContent,
+        items: List[AuditOptionsItem],
+        *,
+        client: Optional[OpenAI] = None,
+        model: Optional[str] = None,
+        priority: Priority = "bulk",
+        tenant: Optional[str] = None,
+    ) -> List[AuditResult]:
+        """
+        内部方法：批量审核中单个内容 × 全部审核项的单次调用，失败时未命中缓存的审核项返回兜底结果。
+
+        参数：
+        - batch_id (UUID): 批次ID。
+        - content (AuditContent): 待审核内容。
+        - items (List[AuditOptionsItem]): 审核项列表。
+        - client (Optional[OpenAI]): 可选覆盖客户端。
+        - model (Optional[str]): 可选覆盖模型。
+        - priority (str): 调度优先级。
+        - tenant (Optional[str]): 可选租户标识。
+
+        返回：
+        - List[AuditResult]: 审核结果列表，顺序与 items 一致，不抛出异常。
+        """
+        stats = _CallStats(priority=priority, tenant=tenant)
+        try:
+            resolved = self._resolve_decisions(
+                content, items, client=client, model=model, stats=stats
+            )
+        except Exception:
+            results = []
+            for it in items:
+                local = self._local_decision(content, it, model)
+                if local is not None:
+                    decision, it_stats = local
+                    results.append(
+                        _make_result(
+                            content, it, decision, batch_id=batch_id, stats=it_stats
+                        )
                     )
-                    result = AuditResult(
-                        batch_id=batch_id,
-                        text_id=c.id,
-                        item_id=it.id,
-                        item_name=it.name,
-                        text_excerpt=c.content,
-                        decision=fallback_decision,
+                else:
+                    results.append(
+                        _make_result(
+                            content,
+                            it,
+                            _fallback_decision(it),
+                            batch_id=batch_id,
+                            stats=stats,
+                            status="failed",
+                        )
                     )
-                    results.append(result)
+            return results
+        return [
+            _make_result(content, it, decision, batch_id=batch_id, stats=it_stats)
+            for it, (decision, it_stats) in zip(items, resolved)
+        ]
+
+    def _audit_pack_cell(
+        self,
+        batch_id: UUID,
+        contents: List[AuditContent],
+        item: AuditOptionsItem,
+        *,
+        client: Optional[OpenAI] = None,
+        model: Optional[str] = None,
+        priority: Priority = "bulk",
+        tenant: Optional[str] = None,
+    ) -> List[AuditResult]:
+        """
+        内部方法：打包审核中的单个包，无效或缺失条目回退为单条调用，不抛出异常。
+
+        参数：
+        - batch_id (UUID): 批次ID。
+        - contents (List[AuditContent]): 包内待审核内容。
+        - item (AuditOptionsItem): 审核项。
+        - client (Optional[OpenAI]): 可选覆盖客户端。
+        - model (Optional[str]): 可选覆盖模型。
+        - priority (str): 调度优先级。
+        - tenant (Optional[str]): 可选租户标识。
+
+        返回：
+        - List[AuditResult]: 审核结果列表，顺序与 contents 一致。
+        """
+        results: List[Optional[AuditResult]] = []
+        pending: List[int] = []
+        for index, c in enumerate(contents):
+            local = self._local_decision(c, item, model)
+            if local is None:
+                results.append(None)
+                pending.append(index)
+            else:
+                decision, c_stats = local
+                results.append(
+                    _make_result(c, item, decision, batch_id=batch_id, stats=c_stats)
+                )
+
+        decisions: Dict[int, AuditDecision] = {}
+        stats = _CallStats(priority=priority, tenant=tenant)
+        failed_pack = False
+        if len(pending) > 1:
+            try:
+                packed = self._audit_contents_with_item(
+                    [contents[i] for i in pending],
+                    item,
+                    client=client,
+                    model=model,
+                    stats=stats,
+                )
+                decisions = {pending[k]: d for k, d in packed.items()}
+                stats.usage.shared = max(len(decisions), 1)
+            except Exception:
+                # 整包失败：全部回退为单条调用，打包请求的尝试次数与用量分摊到回退结果
+                decisions = {}
+                failed_pack = True
+
+        for index in pending:
+            c = contents[index]
+            decision = decisions.get(index)
+            if decision is None:
+                results[index] = self._audit_cell(
+                    batch_id,
+                    c,
+                    item,
+                    client=client,
+                    model=model,
+                    priority=priority,
+                    tenant=tenant,
+                )
+            else:
+                self._cache_set(c, item, model, decision)
+                results[index] = _make_result(
+                    c, item, decision, batch_id=batch_id, stats=stats
+                )
+        if failed_pack:
+            _spread_usage([results[i] for i in pending], stats)
         return results
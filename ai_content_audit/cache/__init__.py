@@ -0,0 +1,19 @@
+"""
+审核结论缓存模块。
+
+缓存键由内容哈希、审核项完整指纹与模型名称组成（见 make_cache_key）。
+提供进程内 LRU/TTL 缓存 `MemoryCache` 与可跨进程共享的持久化缓存 `SQLiteCache`，
+也可继承 `AuditCache` 实现自定义后端（如 Redis）。
+"""
+
+from ai_content_audit.cache.base import AuditCache, item_fingerprint, make_cache_key
+from ai_content_audit.cache.memory_cache import MemoryCache
+from ai_content_audit.cache.sqlite_cache import SQLiteCache
+
+__all__ = [
+    "AuditCache",
+    "MemoryCache",
+    "SQLiteCache",
+    "item_fingerprint",
+    "make_cache_key",
+]
@@ -0,0 +1,71 @@
+import hashlib
+import json
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Optional, Tuple
+from ai_content_audit.models import AuditContent, AuditDecision, AuditOptionsItem
+
+
+def item_fingerprint(item: AuditOptionsItem) -> str:
+    """
+    计算审核项的完整指纹（name、instruction 与 options 的标签及说明）。
+
+    与 AuditOptionsItem.id 不同，指纹包含审核依据与选项说明，任一文字修改都会产生新指纹，
+    避免规则调整后命中旧的缓存结论。
+
+    同一审核项在批量审核中会为每条内容重复计算指纹，结果按字段取值缓存（修改字段后自动重新计算）。
+    """
+    return _fingerprint(
+        item.name, item.instruction, tuple(sorted(item.options.items()))
+    )
+
+
+@lru_cache(maxsize=1024)
+def _fingerprint(
+    name: str, instruction: str, options: Tuple[Tuple[str, str], ...]
+) -> str:
+    """内部方法：按审核项字段计算指纹（供 item_fingerprint 缓存复用）。"""
+    payload = json.dumps([name, instruction, list(options)], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def make_cache_key(content: AuditContent, item: AuditOptionsItem, model: str) -> str:
+    """
+    生成审核结论的缓存键：内容哈希 + 审核项指纹 + 模型名称。
+
+    参数：
+    - content (AuditContent): 待审核内容（仅使用 content 字段，与 id/source 无关）。
+    - item (AuditOptionsItem): 审核项。
+    - model (str): 模型名称。
+
+    返回：
+    - str: 十六进制缓存键。
+    """
+    content_hash = hashlib.sha256(content.content.encode("utf-8")).hexdigest()
+    key = f"{content_hash}|{item_fingerprint(item)}|{model}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+class AuditCache(ABC):
+    """
+    审核结论缓存的抽象基类。
+
+    实现类需提供 get / set / clear 方法，存取对象为 AuditDecision；实现需保证线程安全。
+
+    blocking 表示 get / set 是否可能阻塞（磁盘、网络 I/O），AsyncAuditManager 只把阻塞的实现放到线程中执行，
+    纯内存实现应设为 False 以直接调用。
+    """
+
+    blocking: bool = True
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[AuditDecision]:
+        """读取缓存，未命中或已过期返回 None。"""
+
+    @abstractmethod
+    def set(self, key: str, decision: AuditDecision) -> None:
+        """写入缓存。"""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """清空缓存。"""
@@ -0,0 +1,63 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+from ai_content_audit.cache.base import AuditCache
+from ai_content_audit.models import AuditDecision
+
+
+class MemoryCache(AuditCache):
+    """
+    进程内 LRU 缓存，支持可选 TTL。
+
+    - 超过 maxsize 时淘汰最久未使用的条目。
+    - ttl 为 None 时条目永不过期。
+    - 线程安全。
+    """
+
+    blocking = False
+
+    def __init__(self, maxsize: int = 10000, ttl: Optional[float] = None) -> None:
+        """
+        参数：
+        - maxsize (int): 最大条目数，默认 10000。
+        - ttl (Optional[float]): 条目存活秒数，默认 None（不过期）。
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize 必须大于等于 1")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl 必须大于 0")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, Tuple[Optional[float], str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[AuditDecision]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, payload = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+        # 每次返回新对象，避免调用方修改缓存内容
+        return AuditDecision.model_validate_json(payload)
+
+    def set(self, key: str, decision: AuditDecision) -> None:
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        payload = decision.model_dump_json()
+        with self._lock:
+            self._data[key] = (expires_at, payload)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
@@ -0,0 +1,83 @@
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Union
+from ai_content_audit.cache.base import AuditCache
+from ai_content_audit.models import AuditDecision
+
+
+class SQLiteCache(AuditCache):
+    """
+    基于 SQLite 的持久化缓存，可跨进程共享（同一数据库文件）。
+
+    - 使用 WAL 日志模式，支持多进程并发读写。
+    - ttl 为 None 时条目永不过期；过期条目在读取时删除。
+    - 线程安全（单连接 + 锁）。
+    """
+
+    blocking = True
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        *,
+        ttl: Optional[float] = None,
+        timeout: float = 30.0,
+    ) -> None:
+        """
+        参数：
+        - path (Union[str, Path]): 数据库文件路径，不存在时自动创建。
+        - ttl (Optional[float]): 条目存活秒数，默认 None（不过期）。
+        - timeout (float): 等待数据库锁的秒数，默认 30。
+        """
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl 必须大于 0")
+        self.path = Path(path)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path), timeout=timeout, check_same_thread=False
+        )
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS audit_cache ("
+                "key TEXT PRIMARY KEY, "
+                "decision TEXT NOT NULL, "
+                "expires_at REAL, "
+                "created_at REAL NOT NULL)"
+            )
+
+    def get(self, key: str) -> Optional[AuditDecision]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT decision, expires_at FROM audit_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            payload, expires_at = row
+            if expires_at is not None and expires_at <= time.time():
+                with self._conn:
+                    self._conn.execute("DELETE FROM audit_cache WHERE key = ?", (key,))
+                return None
+        return AuditDecision.model_validate_json(payload)
+
+    def set(self, key: str, decision: AuditDecision) -> None:
+        now = time.time()
+        expires_at = now + self.ttl if self.ttl is not None else None
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO audit_cache (key, decision, expires_at, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, decision.model_dump_json(), expires_at, now),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM audit_cache")
+
+    def close(self) -> None:
+        """关闭数据库连接。"""
+        with self._lock:
+            self._conn.close()
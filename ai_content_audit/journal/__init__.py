@@ -0,0 +1,10 @@
+"""
+批量审核日志模块。
+
+`BatchJournal` 将已完成的单元格追加写入 JSONL 文件；
+`AuditManager.audit_batch` / `audit_iter` 传入 journal 与相同的 batch_id 即可在中断后续跑，跳过已完成的单元格。
+"""
+
+from ai_content_audit.journal.batch_journal import BatchJournal
+
+__all__ = ["BatchJournal"]
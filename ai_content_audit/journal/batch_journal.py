@@ -0,0 +1,101 @@
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Union
+from uuid import UUID
+from ai_content_audit.models import AuditDecision, AuditResult
+
+
+class BatchJournal:
+    """
+    批量审核日志：以 JSONL 追加写入已完成的单元格，用于中断后续跑。
+
+    - 每行记录 batch_id、单元格键（内容哈希 + 审核项指纹 + 模型，见 make_cache_key）、
+      text_id、item_id 与决策；只记录成功的结论，失败的兜底结果在续跑时会重新审核。
+    - 每条记录写入后立即 flush，进程崩溃最多丢失正在写入的一行；读取时忽略不完整的行。
+    - 同一文件可保存多个批次，按 batch_id 区分。
+    - 线程安全。
+    """
+
+    def __init__(self, path: Union[str, Path], *, fsync: bool = False) -> None:
+        """
+        参数：
+        - path (Union[str, Path]): 日志文件路径，不存在时自动创建。
+        - fsync (bool): 每条记录后是否调用 os.fsync，防止断电丢失（较慢），默认 False。
+        """
+        self.path = Path(path)
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        self._file = open(self.path, "a+", encoding="utf-8")
+        # 上次崩溃可能留下不完整的行，先补换行避免与新记录粘连
+        if self._file.tell() > 0:
+            with open(self.path, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    self._file.write("\n")
+                    self._file.flush()
+
+    def load(self, batch_id: UUID) -> Dict[str, AuditDecision]:
+        """
+        读取指定批次已完成的单元格。
+
+        参数：
+        - batch_id (UUID): 批次ID。
+
+        返回：
+        - Dict[str, AuditDecision]: 单元格键 -> 决策。
+        """
+        completed: Dict[str, AuditDecision] = {}
+        target = str(batch_id)
+        with self._lock:
+            self._file.flush()
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # 崩溃时未写完的行
+                        continue
+                    if record.get("batch_id") != target:
+                        continue
+                    completed[record["key"]] = AuditDecision.model_validate(
+                        record["decision"]
+                    )
+        return completed
+
+    def record(self, batch_id: UUID, key: str, result: AuditResult) -> None:
+        """
+        追加一条已完成单元格的记录。
+
+        参数：
+        - batch_id (UUID): 批次ID。
+        - key (str): 单元格键。
+        - result (AuditResult): 审核结果。
+        """
+        line = json.dumps(
+            {
+                "batch_id": str(batch_id),
+                "key": key,
+                "text_id": str(result.text_id),
+                "item_id": str(result.item_id),
+                "decision": result.decision.model_dump(),
+            },
+            ensure_ascii=False,
+        )
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        """关闭日志文件。"""
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self) -> "BatchJournal":
+        return self
+
+    def __exit__(self, *exc_info: Optional[object]) -> None:
+        self.close()
@@ -4,7 +4,7 @@ from pathlib import Path
 from typing import Any, Dict, Iterable, List, Mapping, Optional, Union
 import json
 from pydantic import ValidationError
-from ai_content_audit.models import AuditOptionsItem
+from ai_content_audit.models import AuditOptionsItem, AuditPrefilter
 
 
 class AuditOptionsItemLoader:
@@ -25,7 +25,12 @@ class AuditOptionsItemLoader:
     # 直接创建
     @staticmethod
     def create(
-        name: str, instruction: str, options: Dict[str, str]
+        name: str,
+        instruction: str,
+        options: Dict[str, str],
+        *,
+        blocking_choices: Optional[List[str]] = None,
+        prefilter: Optional[AuditPrefilter] = None,
     ) -> AuditOptionsItem:
         """
         创建一个审核项，用于定义审核规则和选项。
@@ -34,6 +39,8 @@ class AuditOptionsItemLoader:
         - name (str): 审核项的名称。
         - instruction (str): 审核的判定依据说明，告诉模型如何判断。
         - options (dict[str, str]): 审核选项映射，键为选项标签，值为该选项的含义说明。
+        - blocking_choices (Optional[List[str]]): 可选阻断标签，短路模式下给出这些结论时跳过同一内容的剩余审核项。
+        - prefilter (Optional[AuditPrefilter]): 可选本地预过滤器，关键词/正则可确定的文本直接给出选项，不调用模型。
 
         返回：
         - AuditOptionsItem: 构建好的审核项对象，可直接用于审核管理器。
@@ -50,7 +57,13 @@ class AuditOptionsItemLoader:
         ...     }
         ... )
         """
-        return AuditOptionsItem(name=name, instruction=instruction, options=options)
+        return AuditOptionsItem(
+            name=name,
+            instruction=instruction,
+            options=options,
+            blocking_choices=blocking_choices or [],
+            prefilter=prefilter,
+        )
 
     # 从字典加载（常用于外部配置转入）
     @staticmethod
@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import List, Union
 import filetype
 from ai_content_audit.models import AuditContent
+from ai_content_audit.tracing import get_tracer
 import mimetypes
 from collections import namedtuple
 
@@ -37,6 +38,11 @@ class MediaLoader:
 
     @staticmethod
     def from_file(path: Union[str, Path], encoding: str = "utf-8") -> AuditContent:
+        with get_tracer().span("loader.from_file", path=str(path)):
+            return MediaLoader._from_file(path, encoding)
+
+    @staticmethod
+    def _from_file(path: Union[str, Path], encoding: str) -> AuditContent:
         p = Path(path)
         # 检测文件是否存在
         if not p.exists() or not p.is_file():
@@ -63,7 +69,8 @@ class TextLoader:
 
     @staticmethod
     def from_file(path: Path, encoding: str = "utf-8") -> AuditContent:
-        content = path.read_text(encoding=encoding)
+        with get_tracer().span("loader.read", path=str(path)):
+            content = path.read_text(encoding=encoding)
         return AuditContent(content=content, source=str(path), file_type="text")
 
 
@@ -74,8 +81,12 @@ class ImageLoader:
 
     @staticmethod
     def from_file(path: Path, mime_type: str, encoding: str = "utf-8") -> AuditContent:
-        with open(path, "rb") as f:
-            img_data = f.read()
+        tracer = get_tracer()
+        with tracer.span("loader.read", path=str(path)) as span:
+            with open(path, "rb") as f:
+                img_data = f.read()
+            span.set_attribute("bytes", len(img_data))
+        with tracer.span("loader.base64_encode", bytes=len(img_data)):
             img_base64 = base64.b64encode(img_data).decode(encoding)
         content = f"data:{mime_type};base64,{img_base64}"
         return AuditContent(content=content, source=str(path), file_type="image")
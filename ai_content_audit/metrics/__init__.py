@@ -0,0 +1,28 @@
+"""
+指标模块。
+
+无第三方依赖的指标注册表 `MetricsRegistry`（`Counter`、`Gauge`、`Histogram`），
+以 Prometheus 文本格式输出（`MetricsRegistry.exposition`，Content-Type 见 `CONTENT_TYPE`）；
+`AuditMetrics` 定义审核流水线指标，传给 `AuditManager(metrics=...)` 即自动记录。
+"""
+
+from ai_content_audit.metrics.registry import (
+    CONTENT_TYPE,
+    DEFAULT_BUCKETS,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+)
+from ai_content_audit.metrics.audit_metrics import AuditMetrics, request_outcome
+
+__all__ = [
+    "AuditMetrics",
+    "CONTENT_TYPE",
+    "Counter",
+    "DEFAULT_BUCKETS",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "request_outcome",
+]
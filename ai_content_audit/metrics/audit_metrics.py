@@ -0,0 +1,156 @@
+import asyncio
+from typing import Optional, Sequence
+import openai
+from ai_content_audit.metrics.registry import DEFAULT_BUCKETS, MetricsRegistry
+from ai_content_audit.models import AuditResult
+from ai_content_audit.runtime.adaptive import AdaptiveConcurrencyLimiter
+
+
+def request_outcome(error: Optional[BaseException]) -> str:
+    """
+    模型请求结果分类：success、rate_limited（429）、timeout、server_error（5xx）、
+    client_error（其它 4xx）、cancelled（如被取消的对冲请求）或 error（连接错误等）。
+    """
+    if error is None:
+        return "success"
+    if isinstance(error, asyncio.CancelledError):
+        return "cancelled"
+    if isinstance(error, openai.APITimeoutError):
+        return "timeout"
+    if isinstance(error, openai.APIStatusError):
+        if error.status_code == 429:
+            return "rate_limited"
+        if error.status_code >= 500:
+            return "server_error"
+        return "client_error"
+    return "error"
+
+
+class AuditMetrics:
+    """
+    审核流水线指标：在 MetricsRegistry 上注册审核相关的计数器、直方图与仪表。
+
+    指标（默认前缀 ai_audit）：
+    - ai_audit_requests_total{model, outcome}：模型请求数（含重试与对冲），outcome 见 request_outcome。
+    - ai_audit_rate_limited_total{model}：429 限流次数。
+    - ai_audit_results_total{model, item, status}：审核结果数，status 为 success / failed / skipped。
+    - ai_audit_fallbacks_total{item}：模型调用失败后返回兜底结论的次数。
+    - ai_audit_tokens_total{model, type}：token 用量，type 为 prompt / completion / cached。
+    - ai_audit_stage_seconds{stage}：各阶段耗时直方图，stage 为 prompt_build（构建消息）、
+      network（模型请求）、parse（结构化结果校验与清洗）。
+    - ai_audit_in_flight_requests：在途模型请求数。
+    - ai_audit_concurrency_limit / ai_audit_concurrency_limiter_in_flight：自适应并发限制器的当前并发上限
+      与占用名额数，仅在管理器配置了 concurrency_limiter 时注册（见 track_limiter），输出时读取。
+
+    可传给 AuditManager / AsyncAuditManager 的 metrics 参数，多个管理器可共享同一实例。
+    """
+
+    def __init__(
+        self,
+        registry: Optional[MetricsRegistry] = None,
+        *,
+        namespace: str = "ai_audit",
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        """
+        参数：
+        - registry (Optional[MetricsRegistry]): 指标注册表，默认新建。
+        - namespace (str): 指标名称前缀，默认 "ai_audit"。
+        - buckets (Sequence[float]): 耗时直方图的桶上界（秒）。
+        """
+        self.registry = registry if registry is not None else MetricsRegistry()
+        self.namespace = namespace
+        r = self.registry
+        self.requests = r.counter(
+            f"{namespace}_requests_total",
+            "模型请求数（含重试与对冲请求）",
+            ("model", "outcome"),
+        )
+        self.rate_limited = r.counter(
+            f"{namespace}_rate_limited_total", "模型请求被限流（429）的次数", ("model",)
+        )
+        self.results = r.counter(
+            f"{namespace}_results_total",
+            "审核结果数",
+            ("model", "item", "status"),
+        )
+        self.fallbacks = r.counter(
+            f"{namespace}_fallbacks_total",
+            "模型调用失败后返回兜底结论的次数",
+            ("item",),
+        )
+        self.tokens = r.counter(
+            f"{namespace}_tokens_total", "模型 token 用量", ("model", "type")
+        )
+        self.stage_seconds = r.histogram(
+            f"{namespace}_stage_seconds",
+            "审核各阶段耗时（秒）",
+            ("stage",),
+            buckets=buckets,
+        )
+        self.in_flight = r.gauge(f"{namespace}_in_flight_requests", "在途模型请求数")
+
+    def track_limiter(self, limiter: AdaptiveConcurrencyLimiter) -> None:
+        """
+        注册自适应并发限制器的仪表，输出指标时读取其当前并发上限与在途请求数。
+
+        多个管理器共享同一 AuditMetrics 时应共享同一限制器，后注册的限制器覆盖先前的。
+
+        参数：
+        - limiter (AdaptiveConcurrencyLimiter): 并发限制器。
+        """
+        r = self.registry
+        r.gauge(
+            f"{self.namespace}_concurrency_limit", "自适应并发限制器的当前并发上限"
+        ).set_function(lambda: limiter.limit)
+        r.gauge(
+            f"{self.namespace}_concurrency_limiter_in_flight",
+            "自适应并发限制器占用的在途请求数",
+        ).set_function(lambda: limiter.in_flight)
+
+    def observe_request(
+        self,
+        model: str,
+        latency: Optional[float] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """
+        记录一次模型请求。
+
+        参数：
+        - model (str): 模型名称。
+        - latency (Optional[float]): 请求耗时（秒），计入 network 阶段。
+        - error (Optional[BaseException]): 请求失败时的异常。
+        """
+        outcome = request_outcome(error)
+        self.requests.inc(model=model, outcome=outcome)
+        if outcome == "rate_limited":
+            self.rate_limited.inc(model=model)
+        if latency is not None:
+            self.stage_seconds.observe(latency, stage="network")
+
+    def observe_stage(self, stage: str, seconds: float) -> None:
+        """记录一个阶段的耗时（秒）。"""
+        self.stage_seconds.observe(seconds, stage=stage)
+
+    def observe_result(self, result: AuditResult) -> None:
+        """
+        记录一个审核结果：结果数、兜底次数，以及实际调用模型的结果的 token 用量（合并调用按 shared 分摊）。
+        """
+        model = result.model or ""
+        self.results.inc(model=model, item=result.item_name, status=result.status)
+        if result.status == "failed":
+            self.fallbacks.inc(item=result.item_name)
+        usage = result.usage
+        share = max(usage.shared, 1)
+        for kind, value in (
+            ("prompt", usage.prompt_tokens),
+            ("completion", usage.completion_tokens),
+            ("cached", usage.cached_tokens),
+        ):
+            if value:
+                self.tokens.inc(value / share, model=model, type=kind)
+
+    def exposition(self) -> str:
+        """以 Prometheus 文本格式输出注册表中的全部指标（见 MetricsRegistry.exposition）。"""
+        return self.registry.exposition()
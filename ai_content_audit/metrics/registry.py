@@ -0,0 +1,331 @@
+import bisect
+import math
+import re
+import threading
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# Prometheus 文本格式的 Content-Type，供 HTTP 抓取端点使用
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+_NAME_RE = re.compile(r"^[a-zA-Z_:][a-zA-Z0-9_:]*$")
+_LABEL_RE = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+
+
+class _Metric:
+    """指标基类：按标签值分别保存样本，线程安全。"""
+
+    type_name = ""
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        if not _NAME_RE.match(name):
+            raise ValueError(f"指标名称无效: {name}")
+        for label in labelnames:
+            if not _LABEL_RE.match(label) or label.startswith("__"):
+                raise ValueError(f"标签名称无效: {label}")
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"指标 {self.name} 需要标签 {list(self.labelnames)}，实际为 {sorted(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _label_text(
+        self, values: Tuple[str, ...], extra: Optional[Tuple[str, str]] = None
+    ) -> str:
+        pairs = list(zip(self.labelnames, values))
+        if extra is not None:
+            pairs.append(extra)
+        if not pairs:
+            return ""
+        inner = ",".join(f'{k}="{_escape_label(v)}"' for k, v in pairs)
+        return "{" + inner + "}"
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def expose(self) -> str:
+        """生成该指标的 Prometheus 文本格式（含 HELP 与 TYPE 行）。"""
+        lines = [
+            f"# HELP {self.name} {_escape_help(self.documentation)}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        lines.extend(self._samples())
+        return "\n".join(lines) + "\n"
+
+
+class Counter(_Metric):
+    """只增计数器，名称建议以 _total 结尾。"""
+
+    type_name = "counter"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """增加计数，amount 不能为负。"""
+        if amount < 0:
+            raise ValueError("计数器只能增加")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        """读取当前计数。"""
+        key = self._key(labels)
+        with self._lock:
+            return self._values.get(key, 0.0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{self._label_text(key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Gauge(_Metric):
+    """可增可减的瞬时值（如在途请求数）。"""
+
+    type_name = "gauge"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._functions: Dict[Tuple[str, ...], Callable[[], float]] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """增加 amount。"""
+        key = self._key(labels)
+        with self._lock:
+            self._functions.pop(key, None)
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        """减少 amount。"""
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        """设置为 value。"""
+        key = self._key(labels)
+        with self._lock:
+            self._functions.pop(key, None)
+            self._values[key] = value
+
+    def set_function(self, fn: Callable[[], float], **labels: str) -> None:
+        """
+        改为在读取时调用 fn 取值（如读取其它组件的当前状态），之后的 inc / dec / set 会取消该函数。
+
+        参数：
+        - fn (Callable[[], float]): 无参数函数，返回当前值。
+        """
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = 0.0
+            self._functions[key] = fn
+
+    def value(self, **labels: str) -> float:
+        """读取当前值。"""
+        key = self._key(labels)
+        with self._lock:
+            fn = self._functions.get(key)
+            value = self._values.get(key, 0.0)
+        return float(fn()) if fn is not None else value
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            functions = dict(self._functions)
+            items = sorted(self._values.items())
+        items = [
+            (key, float(functions[key]()) if key in functions else value)
+            for key, value in items
+        ]
+        if not items and not self.labelnames:
+            items = [((), 0.0)]
+        return [
+            f"{self.name}{self._label_text(key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Histogram(_Metric):
+    """直方图：按桶统计观测值分布，并记录总和与次数。"""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        *,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        if "le" in self.labelnames:
+            raise ValueError("直方图不能使用 le 标签")
+        bounds = sorted(float(b) for b in buckets if not math.isinf(b))
+        if not bounds:
+            raise ValueError("buckets 不能为空")
+        self.buckets = tuple(bounds)
+        # 每组标签：[各桶计数（非累计）..., +Inf 桶计数], 总和
+        self._values: Dict[Tuple[str, ...], Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """记录一次观测值。"""
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = ([0] * (len(self.buckets) + 1), [0.0])
+                self._values[key] = entry
+            entry[0][index] += 1
+            entry[1][0] += value
+
+    def count(self, **labels: str) -> int:
+        """读取观测次数。"""
+        key = self._key(labels)
+        with self._lock:
+            entry = self._values.get(key)
+            return sum(entry[0]) if entry is not None else 0
+
+    def sum(self, **labels: str) -> float:
+        """读取观测值总和。"""
+        key = self._key(labels)
+        with self._lock:
+            entry = self._values.get(key)
+            return entry[1][0] if entry is not None else 0.0
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(
+                (key, (list(counts), total[0]))
+                for key, (counts, total) in self._values.items()
+            )
+        lines: List[str] = []
+        for key, (counts, total) in items:
+            cumulative = 0
+            bounds = [_format_value(b) for b in self.buckets] + ["+Inf"]
+            for bound, count in zip(bounds, counts):
+                cumulative += count
+                lines.append(
+                    f"{self.name}_bucket{self._label_text(key, ('le', bound))} {cumulative}"
+                )
+            lines.append(
+                f"{self.name}_sum{self._label_text(key)} {_format_value(total)}"
+            )
+            lines.append(f"{self.name}_count{self._label_text(key)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    指标注册表：集中创建指标，并以 Prometheus 文本格式（0.0.4）输出全部指标。
+
+    同名指标重复注册时返回已注册的实例（类型与标签须一致），多个管理器可共享同一注册表。
+    """
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        """注册（或获取已注册的）计数器。"""
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Gauge:
+        """注册（或获取已注册的）仪表。"""
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        *,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """注册（或获取已注册的）直方图。"""
+        return self._register(
+            Histogram, name, documentation, labelnames, buckets=buckets
+        )
+
+    def get(self, name: str) -> Optional[_Metric]:
+        """按名称获取已注册的指标，不存在时返回 None。"""
+        with self._lock:
+            return self._metrics.get(name)
+
+    def exposition(self) -> str:
+        """
+        以 Prometheus 文本格式输出全部指标，可直接作为 /metrics 端点的响应体（Content-Type 见 CONTENT_TYPE）。
+
+        返回：
+        - str: 指标文本。
+        """
+        with self._lock:
+            metrics = [self._metrics[name] for name in sorted(self._metrics)]
+        return "".join(metric.expose() for metric in metrics)
+
+    def _register(self, cls, name, documentation, labelnames, **kwargs):
+        with self._lock:
+            existing = self._metrics.get(name)
+            if existing is not None:
+                if type(existing) is not cls or existing.labelnames != tuple(
+                    labelnames
+                ):
+                    raise ValueError(f"指标 {name} 已以不同类型或标签注册")
+                return existing
+            metric = cls(name, documentation, labelnames, **kwargs)
+            self._metrics[name] = metric
+            return metric
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    if float(value).is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _escape_help(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n")
@@ -1,11 +1,38 @@
+from ai_content_audit.models.audit_prefilter_model import (
+    AuditPrefilter,
+    PrefilterRule,
+)
 from ai_content_audit.models.audit_options_item_model import AuditOptionsItem
-from ai_content_audit.models.audit_decision_model import AuditDecision
+from ai_content_audit.models.audit_decision_model import (
+    AuditDecision,
+    UNCERTAIN_CHOICES,
+)
 from ai_content_audit.models.audit_content_model import AuditContent
 from ai_content_audit.models.audit_result_model import AuditResult
+from ai_content_audit.models.audit_usage_model import AuditUsage, AuditUsageSummary
+from ai_content_audit.models.audit_packed_decision_model import (
+    AuditPackedDecision,
+    AuditPackedDecisionEntry,
+)
+from ai_content_audit.models.audit_multi_decision_model import (
+    create_multi_decision_model,
+    multi_decision_field,
+    split_multi_decision,
+)
 
 __all__ = [
     "AuditOptionsItem",
+    "AuditPrefilter",
+    "PrefilterRule",
     "AuditDecision",
     "AuditContent",
     "AuditResult",
+    "AuditUsage",
+    "AuditUsageSummary",
+    "AuditPackedDecision",
+    "AuditPackedDecisionEntry",
+    "create_multi_decision_model",
+    "multi_decision_field",
+    "split_multi_decision",
+    "UNCERTAIN_CHOICES",
 ]
@@ -1,5 +1,8 @@
 from pydantic import BaseModel, Field
 
+# “不确定”类选项标签：模型无法明确判断时应选择的标签
+UNCERTAIN_CHOICES = ("不确定", "无法判断", "Uncertain", "Unknown")
+
 
 class AuditDecision(BaseModel):
     """审核决策：仅两个字段——choice(在 options 中的一个) 与 reason(简要理由)。"""
@@ -0,0 +1,56 @@
+from functools import lru_cache
+from typing import List, Sequence, Tuple, Type
+from pydantic import BaseModel, Field, create_model
+from ai_content_audit.models.audit_decision_model import AuditDecision
+from ai_content_audit.models.audit_options_item_model import AuditOptionsItem
+
+
+def multi_decision_field(index: int) -> str:
+    """第 index 个审核项（从 0 开始）在多审核项决策模型中的字段名，如 item_1。"""
+    return f"item_{index + 1}"
+
+
+@lru_cache(maxsize=128)
+def _create_model(item_names: Tuple[str, ...]) -> Type[BaseModel]:
+    fields = {
+        multi_decision_field(i): (
+            AuditDecision,
+            Field(..., description=f"审核项「{name}」的审核决策"),
+        )
+        for i, name in enumerate(item_names)
+    }
+    return create_model("AuditMultiDecision", **fields)
+
+
+def create_multi_decision_model(items: Sequence[AuditOptionsItem]) -> Type[BaseModel]:
+    """
+    根据审核项列表动态生成多审核项决策模型。
+
+    生成的模型每个审核项对应一个 AuditDecision 字段（item_1、item_2 ...，顺序与 items 一致），
+    用于一次模型调用同时给出多个审核项的决策。相同审核项名称序列的模型会被缓存复用。
+
+    参数：
+    - items (Sequence[AuditOptionsItem]): 审核项列表，不能为空。
+
+    返回：
+    - Type[BaseModel]: 动态生成的 Pydantic 模型类。
+    """
+    if not items:
+        raise ValueError("items 不能为空")
+    return _create_model(tuple(item.name for item in items))
+
+
+def split_multi_decision(
+    parsed: BaseModel, items: Sequence[AuditOptionsItem]
+) -> List[AuditDecision]:
+    """
+    将多审核项决策模型实例按 items 顺序拆分为 AuditDecision 列表。
+
+    参数：
+    - parsed (BaseModel): create_multi_decision_model 生成模型的实例。
+    - items (Sequence[AuditOptionsItem]): 与生成模型时相同的审核项列表。
+
+    返回：
+    - List[AuditDecision]: 与 items 一一对应的决策列表。
+    """
+    return [getattr(parsed, multi_decision_field(i)) for i in range(len(items))]
@@ -1,6 +1,7 @@
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from uuid import UUID, uuid5, NAMESPACE_URL
 from pydantic import BaseModel, Field, field_validator, model_validator
+from ai_content_audit.models.audit_prefilter_model import AuditPrefilter
 
 
 class AuditOptionsItem(BaseModel):
@@ -13,6 +14,14 @@ class AuditOptionsItem(BaseModel):
     name: str = Field(..., description="审核项名称")
     instruction: str = Field(..., description="该审核项的审核理由/判定依据说明")
     options: Dict[str, str] = Field(..., description="选项映射：标签 -> 选项含义说明")
+    blocking_choices: List[str] = Field(
+        default_factory=list,
+        description="阻断标签：短路模式下该审核项给出这些结论时，跳过同一内容的剩余审核项",
+    )
+    prefilter: Optional[AuditPrefilter] = Field(
+        default=None,
+        description="可选本地预过滤器：关键词/正则可确定的文本直接给出选项，不调用模型",
+    )
 
     @classmethod
     def _generate_stable_id(cls, name: str, options: Dict[str, str]) -> UUID:
@@ -29,6 +38,18 @@ class AuditOptionsItem(BaseModel):
             self.id = self._generate_stable_id(self.name, self.options)
         return self
 
+    @model_validator(mode="after")
+    def _validate_choices(self) -> "AuditOptionsItem":
+        """校验阻断标签与预过滤器给出的选项均在 options 中"""
+        for choice in self.blocking_choices:
+            if choice not in self.options:
+                raise ValueError(f"阻断标签 {choice} 不在 options 中")
+        if self.prefilter is not None:
+            for choice in self.prefilter.choices():
+                if choice not in self.options:
+                    raise ValueError(f"预过滤选项 {choice} 不在 options 中")
+        return self
+
     @field_validator("options")
     @classmethod
     def _validate_options(cls, v: Dict[str, str]) -> Dict[str, str]:
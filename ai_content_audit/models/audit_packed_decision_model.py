@@ -0,0 +1,18 @@
+from typing import List
+from pydantic import BaseModel, Field
+
+
+class AuditPackedDecisionEntry(BaseModel):
+    """打包审核中单条内容的决策：index(内容编号) + choice + reason。"""
+
+    index: int = Field(..., description="待审核内容的编号（与输入中的 [编号] 对应）")
+    choice: str = Field(..., description="模型在给定选项中做出的唯一选择（标签）")
+    reason: str = Field(..., description="做出该选择的简短理由（引用关键依据）")
+
+
+class AuditPackedDecision(BaseModel):
+    """打包审核决策：一次请求中多条内容的决策列表。"""
+
+    decisions: List[AuditPackedDecisionEntry] = Field(
+        ..., description="每条待审核内容一个决策，按编号顺序排列"
+    )
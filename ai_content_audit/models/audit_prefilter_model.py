@@ -0,0 +1,191 @@
+import re
+from collections import deque
+from typing import Dict, List, Optional, Pattern, Tuple
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
+from ai_content_audit.models.audit_decision_model import AuditDecision
+
+
+class _KeywordAutomaton:
+    """
+    关键词的 Aho-Corasick 自动机，一次扫描匹配全部关键词，耗时与关键词数量基本无关。
+
+    扫描时先用首字符集合的正则（C 实现）跳到可能命中的位置，
+    自动机回到根状态之前才逐字符推进。
+    """
+
+    def __init__(self, keywords: List[str]):
+        goto: List[Dict[str, int]] = [{}]
+        # out[state]：在该状态结束的全部关键词长度，降序（自身在前，其次沿失败链）
+        out: List[Tuple[int, ...]] = [()]
+        for keyword in keywords:
+            state = 0
+            for ch in keyword:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    out.append(())
+                state = nxt
+            out[state] = (len(keyword),)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                out[nxt] = out[nxt] + out[fail[nxt]]
+
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+        self._max_len = max(len(k) for k in keywords)
+        self._skip = re.compile(
+            "[" + "".join(re.escape(ch) for ch in sorted(goto[0])) + "]"
+        ).search
+
+    def search(self, text: str) -> Optional[Tuple[int, int]]:
+        """返回最左（同起点取最长）命中的 (起点, 终点)，未命中返回 None。"""
+        goto, fail, out, skip = self._goto, self._fail, self._out, self._skip
+        best: Optional[Tuple[int, int]] = None
+        state = 0
+        i = 0
+        n = len(text)
+        while i < n:
+            if not state:
+                match = skip(text, i)
+                if match is None:
+                    break
+                i = match.start()
+            # 之后结束的命中长度不超过 _max_len，起点不可能再早于 best
+            if best is not None and i - best[0] >= self._max_len:
+                break
+            ch = text[i]
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                start = i + 1 - out[state][0]
+                if best is None or start <= best[0]:
+                    best = (start, i + 1)
+            i += 1
+        return best
+
+
+def _fold_case(text: str) -> str:
+    """逐字符转小写，保持长度不变以便按位置截取原文。"""
+    folded = text.lower()
+    if len(folded) == len(text):
+        return folded
+    return "".join(ch if len(ch.lower()) != 1 else ch.lower() for ch in text)
+
+
+class PrefilterRule(BaseModel):
+    """
+    预过滤规则：关键词与正则任一命中即判定为 choice。
+
+    关键词在构建时编译为 Aho-Corasick 自动机，正则合并为单个正则；
+    返回最左的命中片段（同一起点关键词优先、较长者优先）。
+    """
+
+    choice: str = Field(
+        ..., description="命中时直接给出的选项标签（必须在审核项的 options 中）"
+    )
+    keywords: List[str] = Field(
+        default_factory=list, description="关键词列表（字面匹配）"
+    )
+    patterns: List[str] = Field(default_factory=list, description="正则表达式列表")
+    ignore_case: bool = Field(False, description="是否忽略大小写")
+    reason: Optional[str] = Field(
+        None, description="命中时的理由；默认为“命中预过滤规则：<命中片段>”"
+    )
+
+    _automaton: Optional[_KeywordAutomaton] = PrivateAttr(None)
+    _regex: Optional[Pattern[str]] = PrivateAttr(None)
+
+    @model_validator(mode="after")
+    def _compile(self) -> "PrefilterRule":
+        """编译关键词自动机与正则"""
+        keywords = {k for k in self.keywords if k}
+        if not keywords and not self.patterns:
+            raise ValueError("keywords 与 patterns 不能同时为空")
+        if keywords:
+            if self.ignore_case:
+                keywords = {_fold_case(k) for k in keywords}
+            self._automaton = _KeywordAutomaton(sorted(keywords))
+        if self.patterns:
+            try:
+                self._regex = re.compile(
+                    "|".join(f"(?:{p})" for p in self.patterns),
+                    re.IGNORECASE if self.ignore_case else 0,
+                )
+            except re.error as e:
+                raise ValueError(f"正则表达式无效: {e}") from e
+        return self
+
+    def search(self, text: str) -> Optional[str]:
+        """返回首个命中的片段，未命中返回 None。"""
+        span = None
+        if self._automaton is not None:
+            span = self._automaton.search(
+                _fold_case(text) if self.ignore_case else text
+            )
+        if self._regex is not None:
+            match = self._regex.search(text)
+            if match is not None and (span is None or match.start() < span[0]):
+                span = match.span()
+        return text[span[0] : span[1]] if span is not None else None
+
+
+class AuditPrefilter(BaseModel):
+    """
+    审核项的本地预过滤器：可由模式匹配确定的内容直接给出结论，不调用模型。
+
+    - 按 rules 顺序匹配，首个命中的规则给出其 choice。
+    - 全部未命中时，no_match_choice 不为空则直接给出该选项（确定的“未命中”），
+      否则交给模型审核。
+    - 仅作用于文本内容，图片内容始终交给模型。
+    """
+
+    rules: List[PrefilterRule] = Field(
+        default_factory=list, description="预过滤规则（按顺序匹配）"
+    )
+    no_match_choice: Optional[str] = Field(
+        None, description="全部规则未命中时直接给出的选项标签；为空表示交给模型审核"
+    )
+    no_match_reason: str = Field("未命中任何预过滤规则", description="未命中时的理由")
+
+    def choices(self) -> List[str]:
+        """预过滤器可能给出的全部选项标签。"""
+        labels = [rule.choice for rule in self.rules]
+        if self.no_match_choice is not None:
+            labels.append(self.no_match_choice)
+        return labels
+
+    def apply(self, text: str) -> Optional[AuditDecision]:
+        """
+        对文本应用预过滤。
+
+        参数：
+        - text (str): 待审核文本。
+
+        返回：
+        - Optional[AuditDecision]: 能直接确定时返回决策，否则返回 None（交给模型）。
+        """
+        for rule in self.rules:
+            hit = rule.search(text)
+            if hit is not None:
+                return AuditDecision(
+                    choice=rule.choice,
+                    reason=rule.reason or f"命中预过滤规则：{hit}",
+                )
+        if self.no_match_choice is not None:
+            return AuditDecision(
+                choice=self.no_match_choice, reason=self.no_match_reason
+            )
+        return None
@@ -1,6 +1,7 @@
-from typing import Optional
+from typing import Literal, Optional
 from pydantic import BaseModel, Field, model_validator
 from ai_content_audit.models.audit_decision_model import AuditDecision
+from ai_content_audit.models.audit_usage_model import AuditUsage
 from uuid import UUID, uuid4
 
 
@@ -22,6 +23,31 @@ class AuditResult(BaseModel):
     decision: AuditDecision = Field(
         ..., description="审核决策（包含 choice 和 reason）"
     )
+    cache_hit: bool = Field(False, description="是否命中审核结论缓存（未调用模型）")
+    attempts: int = Field(
+        0, description="模型调用尝试次数（含重试；命中缓存或共享在途结果时为 0）"
+    )
+    model: Optional[str] = Field(
+        None,
+        description="给出最终结论的模型名称（启用模型级联时可区分快速模型与主模型）",
+    )
+    escalated: bool = Field(
+        False, description="是否由模型级联的快速模型升级到主模型重新审核"
+    )
+    prefiltered: bool = Field(
+        False, description="是否由审核项的本地预过滤器直接给出结论（未调用模型）"
+    )
+    status: Literal["success", "failed", "skipped"] = Field(
+        "success",
+        description=(
+            "审核状态：success 为模型或缓存给出的结论，failed 为模型调用失败后的兜底结论，"
+            "skipped 为短路模式下因前序审核项给出阻断结论而跳过（未调用模型）"
+        ),
+    )
+    usage: AuditUsage = Field(
+        default_factory=AuditUsage,
+        description="模型调用用量（token 与耗时），批量汇总见 AuditUsageSummary.from_results",
+    )
 
     @model_validator(mode="after")
     def _set_text_excerpt(self) -> "AuditResult":
@@ -0,0 +1,97 @@
+from typing import TYPE_CHECKING, Iterable
+from pydantic import BaseModel, Field
+
+if TYPE_CHECKING:
+    from ai_content_audit.models.audit_result_model import AuditResult
+
+
+class AuditUsage(BaseModel):
+    """
+    单个审核结果对应的模型调用用量：token 用量与请求耗时。
+
+    - 累计产生该结果的全部模型请求（含重试与模型级联的快速模型请求）。
+    - 合并调用（combine_items、audit_packed）的一次请求对应多个结果时，每个结果记录整次请求的用量，
+      shared 为分摊该请求的结果数，单个结果的成本可按 用量 / shared 估算。
+    - 打包调用（audit_packed）整包失败时，失败请求的尝试次数与用量均分计入各回退结果。
+    - 命中缓存、预过滤、共享在途请求或被跳过的结果用量为 0。
+    """
+
+    prompt_tokens: int = Field(0, description="输入 token 数")
+    completion_tokens: int = Field(0, description="输出 token 数")
+    cached_tokens: int = Field(
+        0, description="命中服务端提示词缓存的输入 token 数（如有报告）"
+    )
+    total_tokens: int = Field(0, description="总 token 数")
+    latency: float = Field(
+        0.0, description="模型请求累计耗时（秒，不含限流与重试等待）"
+    )
+    shared: int = Field(1, description="分摊同一次调用用量的结果数（合并调用时大于 1）")
+
+
+class AuditUsageSummary(BaseModel):
+    """
+    一批审核结果的用量汇总，合并调用的用量按 shared 分摊后只计一次。
+    """
+
+    results: int = Field(0, description="结果数")
+    success: int = Field(0, description="成功结果数")
+    failed: int = Field(0, description="失败（兜底）结果数")
+    skipped: int = Field(0, description="短路跳过的结果数")
+    cache_hits: int = Field(0, description="命中缓存的结果数")
+    prefiltered: int = Field(0, description="由预过滤给出结论的结果数")
+    attempts: int = Field(0, description="模型请求次数（含重试）")
+    prompt_tokens: int = Field(0, description="输入 token 数")
+    completion_tokens: int = Field(0, description="输出 token 数")
+    cached_tokens: int = Field(0, description="命中服务端提示词缓存的输入 token 数")
+    total_tokens: int = Field(0, description="总 token 数")
+    latency: float = Field(0.0, description="模型请求累计耗时（秒）")
+
+    @classmethod
+    def from_results(cls, results: Iterable["AuditResult"]) -> "AuditUsageSummary":
+        """
+        汇总审核结果的用量。
+
+        参数：
+        - results (Iterable[AuditResult]): 审核结果（如 audit_batch 的返回值）。
+
+        返回：
+        - AuditUsageSummary: 用量汇总。
+        """
+        counts = {"results": 0, "success": 0, "failed": 0, "skipped": 0}
+        cache_hits = prefiltered = 0
+        totals = {
+            "attempts": 0.0,
+            "prompt_tokens": 0.0,
+            "completion_tokens": 0.0,
+            "cached_tokens": 0.0,
+            "total_tokens": 0.0,
+        }
+        latency = 0.0
+        for result in results:
+            counts["results"] += 1
+            counts[result.status] += 1
+            cache_hits += result.cache_hit
+            prefiltered += result.prefiltered
+            usage = result.usage
+            share = max(usage.shared, 1)
+            totals["attempts"] += result.attempts / share
+            for field in (
+                "prompt_tokens",
+                "completion_tokens",
+                "cached_tokens",
+                "total_tokens",
+            ):
+                totals[field] += getattr(usage, field) / share
+            latency += usage.latency / share
+        return cls(
+            **counts,
+            cache_hits=cache_hits,
+            prefiltered=prefiltered,
+            **{field: round(value) for field, value in totals.items()},
+            latency=latency,
+        )
+
+    @property
+    def avg_latency(self) -> float:
+        """平均每次模型请求耗时（秒）。"""
+        return self.latency / self.attempts if self.attempts else 0.0
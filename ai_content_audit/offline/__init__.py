@@ -0,0 +1,23 @@
+"""
+离线批量审核模块（OpenAI 兼容 Batch API）。
+
+`export_batch_requests` 将 内容 × 审核项 单元格渲染为批量请求 JSONL（custom_id 确定性生成，见 make_custom_id），
+上传并完成批量任务后，`ingest_batch_results` 将输出 JSONL 转换回 AuditResult，缺失或出错的行返回兜底结论。
+适用于不要求实时结果的回填任务，全程只读写本地文件。
+"""
+
+from ai_content_audit.offline.batch_api import (
+    DEFAULT_BATCH_URL,
+    decision_response_format,
+    export_batch_requests,
+    ingest_batch_results,
+    make_custom_id,
+)
+
+__all__ = [
+    "DEFAULT_BATCH_URL",
+    "decision_response_format",
+    "export_batch_requests",
+    "ingest_batch_results",
+    "make_custom_id",
+]
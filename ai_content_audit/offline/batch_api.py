@@ -0,0 +1,205 @@
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+from uuid import UUID, uuid4
+from openai.types.chat import ChatCompletion
+from ai_content_audit.audit_manager import (
+    _CallStats,
+    _fallback_decision,
+    _finalize_decision,
+    _make_result,
+    _prefilter_decision,
+    _record_usage,
+)
+from ai_content_audit.cache import make_cache_key
+from ai_content_audit.models import (
+    AuditContent,
+    AuditDecision,
+    AuditOptionsItem,
+    AuditResult,
+)
+from ai_content_audit.prompts import build_messages
+
+# 批量请求文件中每行请求的默认接口路径
+DEFAULT_BATCH_URL = "/v1/chat/completions"
+
+
+def make_custom_id(content: AuditContent, item: AuditOptionsItem, model: str) -> str:
+    """
+    生成单元格的批量请求 custom_id：与缓存键相同（内容哈希 + 审核项指纹 + 模型，见 make_cache_key）。
+
+    同一内容、审核项与模型在任何时候都得到相同的 custom_id，与 AuditContent.id 无关，
+    因此导出与导入可在不同进程中分别重建输入列表。
+    """
+    return make_cache_key(content, item, model)
+
+
+def decision_response_format() -> Dict[str, Any]:
+    """AuditDecision 的严格 JSON Schema 结构化输出参数（与在线审核的 parse 调用一致）。"""
+    schema = AuditDecision.model_json_schema()
+    schema["additionalProperties"] = False
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": "AuditDecision", "schema": schema, "strict": True},
+    }
+
+
+def export_batch_requests(
+    path: Union[str, Path],
+    content: Sequence[AuditContent],
+    items: Sequence[AuditOptionsItem],
+    model: str,
+    *,
+    url: str = DEFAULT_BATCH_URL,
+    response_format: Optional[Dict[str, Any]] = None,
+) -> int:
+    """
+    将每个 内容 × 审核项 单元格渲染为 OpenAI 兼容 Batch API 的请求 JSONL 文件。
+
+    - 每行为 {"custom_id", "method": "POST", "url", "body": {"model", "messages", "response_format"}}，
+      messages 由 build_messages 生成，与在线审核的提示词一致。
+    - custom_id 见 make_custom_id；相同的单元格只导出一次。
+    - 本地预过滤器能直接确定结论的单元格不导出，导入时再次应用预过滤器。
+
+    参数：
+    - path (Union[str, Path]): 输出文件路径（覆盖写入）。
+    - content (Sequence[AuditContent]): 待审核内容列表。
+    - items (Sequence[AuditOptionsItem]): 审核项列表。
+    - model (str): 模型名称。
+    - url (str): 每行请求的接口路径，默认 "/v1/chat/completions"。
+    - response_format (Optional[Dict[str, Any]]): 结构化输出参数，默认 decision_response_format()；
+      服务端不支持 json_schema 时可传入 {"type": "json_object"}。
+
+    返回：
+    - int: 写入的请求数。
+    """
+    if response_format is None:
+        response_format = decision_response_format()
+    seen = set()
+    with open(path, "w", encoding="utf-8") as f:
+        for c in content:
+            for it in items:
+                if _prefilter_decision(c, it) is not None:
+                    continue
+                custom_id = make_custom_id(c, it, model)
+                if custom_id in seen:
+                    continue
+                seen.add(custom_id)
+                request = {
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": url,
+                    "body": {
+                        "model": model,
+                        "messages": build_messages(c, it),
+                        "response_format": response_format,
+                    },
+                }
+                f.write(json.dumps(request, ensure_ascii=False) + "\n")
+    return len(seen)
+
+
+def _load_outputs(paths: Sequence[Union[str, Path]]) -> Dict[str, Dict[str, Any]]:
+    """读取批量输出 / 错误文件，返回 custom_id -> 记录，忽略无法解析的行。"""
+    outputs: Dict[str, Dict[str, Any]] = {}
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(record, dict) and record.get("custom_id"):
+                    outputs[record["custom_id"]] = record
+    return outputs
+
+
+def _parse_output(record: Dict[str, Any]) -> ChatCompletion:
+    """取出一条成功输出的 chat.completion 响应；出错、非 200 或格式不符时抛出 ValueError。"""
+    if record.get("error"):
+        raise ValueError(f"批量请求失败: {record['error']}")
+    response = record.get("response") or {}
+    status = response.get("status_code")
+    if status != 200:
+        raise ValueError(f"批量请求状态码异常: {status}")
+    return ChatCompletion.model_validate(response.get("body"))
+
+
+def ingest_batch_results(
+    path: Union[str, Path, Sequence[Union[str, Path]]],
+    content: Sequence[AuditContent],
+    items: Sequence[AuditOptionsItem],
+    model: str,
+    *,
+    batch_id: Optional[UUID] = None,
+) -> List[AuditResult]:
+    """
+    将 Batch API 的输出 JSONL 转换为 AuditResult 列表（与 export_batch_requests 使用相同的输入）。
+
+    - 按 custom_id 匹配输出行；choice 经过与在线审核相同的规范化（_ensure_choice），
+      reason 为空时补全。
+    - 缺失的行、出错或非 200 的行、无法解析为 AuditDecision 的输出均返回兜底结论（status="failed"）。
+    - 导出时被预过滤器跳过的单元格再次应用预过滤器，结果 prefiltered 为 True。
+    - 相同单元格共享一次请求的用量（usage.shared 为共享的单元格数）。
+
+    参数：
+    - path (Union[str, Path, Sequence[Union[str, Path]]]): 输出文件路径，可传入多个
+      （如输出文件与错误文件）。
+    - content (Sequence[AuditContent]): 导出时的待审核内容列表。
+    - items (Sequence[AuditOptionsItem]): 导出时的审核项列表。
+    - model (str): 导出时的模型名称。
+    - batch_id (Optional[UUID]): 可选批次ID，默认自动生成。
+
+    返回：
+    - List[AuditResult]: 审核结果列表，顺序与 audit_batch 一致（按内容，再按审核项），共用 batch_id。
+    """
+    paths = [path] if isinstance(path, (str, Path)) else list(path)
+    outputs = _load_outputs(paths)
+    batch_id = batch_id or uuid4()
+
+    cells = [(c, it, make_custom_id(c, it, model)) for c in content for it in items]
+    shared: Dict[str, int] = {}
+    for _, _, custom_id in cells:
+        shared[custom_id] = shared.get(custom_id, 0) + 1
+
+    results: List[AuditResult] = []
+    for c, it, custom_id in cells:
+        decision = _prefilter_decision(c, it)
+        if decision is not None:
+            stats = _CallStats(prefiltered=True)
+            results.append(
+                _make_result(c, it, decision, batch_id=batch_id, stats=stats)
+            )
+            continue
+
+        stats = _CallStats(model=model)
+        record = outputs.get(custom_id)
+        try:
+            if record is None:
+                raise ValueError(f"批量输出中缺少 custom_id: {custom_id}")
+            stats.attempts = 1
+            completion = _parse_output(record)
+            stats.model = completion.model or model
+            _record_usage(stats.usage, completion)
+            stats.usage.shared = shared[custom_id]
+            parsed = AuditDecision.model_validate_json(
+                completion.choices[0].message.content or ""
+            )
+        except Exception:
+            results.append(
+                _make_result(
+                    c,
+                    it,
+                    _fallback_decision(it),
+                    batch_id=batch_id,
+                    stats=stats,
+                    status="failed",
+                )
+            )
+            continue
+        results.append(
+            _make_result(
+                c, it, _finalize_decision(parsed, it), batch_id=batch_id, stats=stats
+            )
+        )
+    return results
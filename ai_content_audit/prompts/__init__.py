@@ -1,5 +1,17 @@
-from ai_content_audit.prompts.builder import build_messages
+from ai_content_audit.prompts.builder import (
+    build_messages,
+    build_multi_item_messages,
+    build_packed_messages,
+)
+from ai_content_audit.prompts.token_estimator import (
+    estimate_message_tokens,
+    estimate_text_tokens,
+)
 
 __all__ = [
     "build_messages",
+    "build_multi_item_messages",
+    "build_packed_messages",
+    "estimate_message_tokens",
+    "estimate_text_tokens",
 ]
@@ -1,28 +1,35 @@
-from typing import Dict, List
-from ai_content_audit.models import AuditOptionsItem, AuditDecision, AuditContent
+from typing import Dict, List, Sequence
+from ai_content_audit.models import (
+    AuditOptionsItem,
+    AuditDecision,
+    AuditContent,
+    AuditPackedDecision,
+    create_multi_decision_model,
+    multi_decision_field,
+)
 from ai_content_audit.prompts.structured_output_prompt import structured_output
 from ai_content_audit.prompts.system_prompt import get_system_prompt
+from ai_content_audit.tracing import traced
 
 
-def build_messages(
-    content: AuditContent, item: AuditOptionsItem
-) -> List[Dict[str, str]]:
-    """构建消息列表，用于大模型审核文本或图片"""
-    options_list = "\n".join([f"- {k}：{v}" for k, v in item.options.items()])
+def _render_options(item: AuditOptionsItem) -> str:
+    """渲染审核项的选项列表（- 标签：含义）"""
+    return "\n".join([f"- {k}：{v}" for k, v in item.options.items()])
 
+
+def _wrap_content(content: AuditContent, task_text: str, tail_text: str):
+    """
+    将审核说明与待审核内容组装为 user 消息内容。
+
+    - 文本：task_text + 待审核文本 + tail_text 拼接为字符串。
+    - 图片：image_url 片段 + 文本片段（task_text + 图像分析提示 + tail_text）。
+    """
     if content.file_type == "text":
         # 文本审核
-        user_content = (
-            f"审核项：{item.name}\n"
-            f"审核理由/依据：{item.instruction}\n"
-            f"可选项（标签：含义）：\n{options_list}\n\n"
-            f"待审核文本：\n{content.content}\n\n"
-            f"输出要求：{structured_output(AuditDecision)}\n"
-            "如果无法明确判断且存在‘不确定’或类似选项，请选择该选项。"
-        )
+        return f"{task_text}\n\n待审核文本：\n{content.content}\n\n{tail_text}"
     elif content.file_type == "image":
         # 图片审核（使用 vision API）
-        user_content = [
+        return [
             {
                 "type": "image_url",
                 "image_url": {"url": content.content},  # content 为 base64 格式
@@ -30,17 +37,97 @@ def build_messages(
             {
                 "type": "text",
                 "text": (
-                    f"审核项：{item.name}\n"
-                    f"审核理由/依据：{item.instruction}\n"
-                    f"可选项（标签：含义）：\n{options_list}\n\n"
+                    f"{task_text}\n\n"
                     "请分析提供的图像内容，并根据审核项给出判断。\n\n"
-                    f"输出要求：{structured_output(AuditDecision)}\n"
-                    "如果无法明确判断且存在‘不确定’或类似选项，请选择该选项。"
+                    f"{tail_text}"
                 ),
             },
         ]
-    else:
-        raise ValueError(f"不支持的文件类型: {content.file_type}")
+    raise ValueError(f"不支持的文件类型: {content.file_type}")
+
+
+@traced("prompt.build", kind="single")
+def build_messages(
+    content: AuditContent, item: AuditOptionsItem
+) -> List[Dict[str, str]]:
+    """构建消息列表，用于大模型审核文本或图片"""
+    task_text = (
+        f"审核项：{item.name}\n"
+        f"审核理由/依据：{item.instruction}\n"
+        f"可选项（标签：含义）：\n{_render_options(item)}"
+    )
+    tail_text = (
+        f"输出要求：{structured_output(AuditDecision)}\n"
+        "如果无法明确判断且存在‘不确定’或类似选项，请选择该选项。"
+    )
+    user_content = _wrap_content(content, task_text, tail_text)
+
+    return [
+        {"role": "system", "content": get_system_prompt()},
+        {"role": "user", "content": user_content},
+    ]
+
+
+@traced("prompt.build", kind="multi_item")
+def build_multi_item_messages(
+    content: AuditContent, items: Sequence[AuditOptionsItem]
+) -> List[Dict[str, str]]:
+    """
+    构建多审核项消息列表：一次请求同时审核同一内容的多个审核项。
+
+    各审核项以 item_1、item_2 ... 编号，输出格式为 create_multi_decision_model(items) 的描述，
+    内容（含图片 base64）只发送一次。
+    """
+    sections = [
+        f"【{multi_decision_field(i)}】审核项：{item.name}\n"
+        f"审核理由/依据：{item.instruction}\n"
+        f"可选项（标签：含义）：\n{_render_options(item)}"
+        for i, item in enumerate(items)
+    ]
+    task_text = (
+        f"请对同一内容分别完成以下 {len(items)} 个审核项，各审核项相互独立判断：\n\n"
+        + "\n\n".join(sections)
+    )
+    tail_text = (
+        f"输出要求：{structured_output(create_multi_decision_model(items))}\n"
+        "每个审核项的 choice 只能从该审核项自身的选项标签中选择；"
+        "如果无法明确判断且存在‘不确定’或类似选项，请选择该选项。"
+    )
+    user_content = _wrap_content(content, task_text, tail_text)
+
+    return [
+        {"role": "system", "content": get_system_prompt()},
+        {"role": "user", "content": user_content},
+    ]
+
+
+@traced("prompt.build", kind="packed")
+def build_packed_messages(
+    contents: Sequence[AuditContent], item: AuditOptionsItem
+) -> List[Dict[str, str]]:
+    """
+    构建打包消息列表：一次请求审核多条短文本（同一审核项）。
+
+    各文本以 [1]、[2] ... 编号，输出格式为 AuditPackedDecision，要求按编号逐条给出决策。
+    仅支持文本内容。
+    """
+    for content in contents:
+        if content.file_type != "text":
+            raise ValueError(f"打包审核仅支持文本内容，实际为: {content.file_type}")
+
+    texts = "\n\n".join(
+        f"[{i}]\n{content.content}" for i, content in enumerate(contents, 1)
+    )
+    user_content = (
+        f"审核项：{item.name}\n"
+        f"审核理由/依据：{item.instruction}\n"
+        f"可选项（标签：含义）：\n{_render_options(item)}\n\n"
+        f"以下共 {len(contents)} 条待审核文本，以 [编号] 分隔，请逐条独立判断：\n\n"
+        f"{texts}\n\n"
+        f"输出要求：{structured_output(AuditPackedDecision)}\n"
+        f"decisions 必须恰好包含 {len(contents)} 个元素，index 与文本编号一一对应。\n"
+        "如果无法明确判断且存在‘不确定’或类似选项，请选择该选项。"
+    )
 
     return [
         {"role": "system", "content": get_system_prompt()},
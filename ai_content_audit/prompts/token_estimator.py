@@ -0,0 +1,39 @@
+from typing import Any, Dict, List
+
+# 单张图片的估算 token 数（视觉模型按分辨率计费，此处取保守的固定值）
+IMAGE_TOKENS = 1000
+# 每条消息的格式开销（role、分隔符等）
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+def estimate_text_tokens(text: str) -> int:
+    """
+    粗略估算文本的 token 数，无需加载分词器。
+
+    - CJK 等非 ASCII 字符：约 1 个字符 1 个 token。
+    - ASCII 字符：约 4 个字符 1 个 token。
+    """
+    non_ascii = sum(1 for ch in text if ord(ch) > 127)
+    ascii_count = len(text) - non_ascii
+    return non_ascii + (ascii_count + 3) // 4
+
+
+def estimate_message_tokens(messages: List[Dict[str, Any]]) -> int:
+    """
+    估算 build_messages 等构建的消息列表的输入 token 数。
+
+    支持字符串内容与 vision 格式的分段内容（text / image_url）。
+    """
+    total = 0
+    for message in messages:
+        total += MESSAGE_OVERHEAD_TOKENS
+        content = message.get("content")
+        if isinstance(content, str):
+            total += estimate_text_tokens(content)
+        elif isinstance(content, list):
+            for part in content:
+                if part.get("type") == "text":
+                    total += estimate_text_tokens(part.get("text", ""))
+                elif part.get("type") == "image_url":
+                    total += IMAGE_TOKENS
+    return total
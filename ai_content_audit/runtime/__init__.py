@@ -0,0 +1,55 @@
+"""
+运行时控制模块。
+
+提供审核管理器在调用模型时使用的并发与流量控制组件：
+- `SingleFlight` / `AsyncSingleFlight`：相同请求的在途去重（请求合并）。
+- `RateLimiter`：客户端 RPM/TPM 令牌桶限流。
+- `RetryPolicy`：可重试错误的指数退避重试（遵循 Retry-After）。
+- `AdaptiveConcurrencyLimiter`：基于延迟与 429 的 AIMD 自适应并发控制。
+- `ClientPool`：多 API Key / 多端点客户端池，负载均衡并临时摘除故障端点。
+- `ModelCascade`：快速模型优先、仅升级不确定结论的模型级联。
+- `HedgePolicy`：按延迟分位数触发的对冲请求，降低尾延迟。
+- `ItemPlanner`：按审核项阻断率与成本规划短路模式下的审核顺序。
+- `PriorityScheduler`：实时 / 批量两级优先级调度，支持按租户加权公平排队。
+"""
+
+from ai_content_audit.runtime.adaptive import (
+    AdaptiveConcurrencyLimiter,
+    is_overload_error,
+)
+from ai_content_audit.runtime.cascade import ModelCascade
+from ai_content_audit.runtime.client_pool import (
+    ClientPool,
+    PoolEndpoint,
+    is_endpoint_error,
+)
+from ai_content_audit.runtime.hedging import HedgePolicy
+from ai_content_audit.runtime.planner import ItemPlanner, ItemStats
+from ai_content_audit.runtime.scheduler import PriorityScheduler
+from ai_content_audit.runtime.singleflight import AsyncSingleFlight, SingleFlight
+from ai_content_audit.runtime.rate_limiter import RateLimiter, usage_total_tokens
+from ai_content_audit.runtime.retry import (
+    RetryPolicy,
+    is_retryable_error,
+    retry_after_seconds,
+)
+
+__all__ = [
+    "AdaptiveConcurrencyLimiter",
+    "AsyncSingleFlight",
+    "ClientPool",
+    "HedgePolicy",
+    "ItemPlanner",
+    "ItemStats",
+    "ModelCascade",
+    "PoolEndpoint",
+    "PriorityScheduler",
+    "RateLimiter",
+    "RetryPolicy",
+    "SingleFlight",
+    "is_endpoint_error",
+    "is_overload_error",
+    "is_retryable_error",
+    "retry_after_seconds",
+    "usage_total_tokens",
+]
@@ -0,0 +1,153 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Deque, Optional, Tuple
+import openai
+
+# 视为过载信号的状态码：限流、服务不可用、网关超时
+OVERLOAD_STATUS_CODES = {429, 503, 504}
+
+
+def is_overload_error(exc: BaseException) -> bool:
+    """判断异常是否为服务端过载信号（429/503/504 或请求超时）。"""
+    if isinstance(exc, openai.APITimeoutError):
+        return True
+    if isinstance(exc, openai.APIStatusError):
+        return exc.status_code in OVERLOAD_STATUS_CODES
+    return False
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    自适应并发限制器（AIMD：加性增、乘性减）。
+
+    - 每个请求成功且延迟健康时，并发上限增加 increase / limit（即每完成一轮约 +increase）。
+    - 遇到过载信号（429、503/504、超时）或延迟超过 latency_threshold 时，上限乘以 decrease_factor；
+      cooldown 秒内的多次过载只降一次，避免同一轮失败把上限压到最低。
+    - 其它错误（如 400、鉴权失败）不调整上限。
+    - limit 属性即当前并发上限，可作为监控指标。
+
+    同时提供同步 acquire 与异步 acquire_async，可在线程与 asyncio 调用方间共享。
+    """
+
+    def __init__(
+        self,
+        initial: int = 4,
+        *,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        latency_threshold: Optional[float] = None,
+        cooldown: float = 1.0,
+    ) -> None:
+        """
+        参数：
+        - initial (int): 初始并发上限，默认 4。
+        - min_limit (int): 并发上限下界，默认 1。
+        - max_limit (int): 并发上限上界，默认 64。
+        - increase (float): 每轮加性增加量，默认 1。
+        - decrease_factor (float): 过载时的乘性缩减系数（0~1），默认 0.5。
+        - latency_threshold (Optional[float]): 健康延迟上限（秒），超过视为过载；None 表示不按延迟判断。
+        - cooldown (float): 两次缩减之间的最短间隔（秒），默认 1。
+        """
+        if not 1 <= min_limit <= initial <= max_limit:
+            raise ValueError("需满足 1 <= min_limit <= initial <= max_limit")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor 必须在 (0, 1) 之间")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.latency_threshold = latency_threshold
+        self.cooldown = cooldown
+
+        self._limit = float(initial)
+        self._in_flight = 0
+        self._last_decrease = float("-inf")
+        self._ewma_latency: Optional[float] = None
+        self._cond = threading.Condition()
+        self._async_waiters: Deque[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = (
+            deque()
+        )
+
+    @property
+    def limit(self) -> int:
+        """当前并发上限。"""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """当前在途请求数。"""
+        return self._in_flight
+
+    @property
+    def ewma_latency(self) -> Optional[float]:
+        """成功请求延迟的指数加权平均值（秒）。"""
+        return self._ewma_latency
+
+    def acquire(self) -> None:
+        """占用一个并发名额，达到上限时阻塞等待。"""
+        with self._cond:
+            while self._in_flight >= int(self._limit):
+                self._cond.wait()
+            self._in_flight += 1
+
+    async def acquire_async(self) -> None:
+        """acquire 的 asyncio 版本。"""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._cond:
+                if self._in_flight < int(self._limit):
+                    self._in_flight += 1
+                    return
+                future = loop.create_future()
+                self._async_waiters.append((loop, future))
+            await future
+
+    def release(
+        self, *, latency: Optional[float] = None, error: Optional[BaseException] = None
+    ) -> None:
+        """
+        释放名额并根据本次请求结果调整并发上限。
+
+        参数：
+        - latency (Optional[float]): 本次请求耗时（秒）。
+        - error (Optional[BaseException]): 请求失败时的异常，成功时为 None。
+        """
+        now = time.monotonic()
+        with self._cond:
+            self._in_flight -= 1
+            overloaded = error is not None and is_overload_error(error)
+            if error is None and latency is not None:
+                self._ewma_latency = (
+                    latency
+                    if self._ewma_latency is None
+                    else 0.8 * self._ewma_latency + 0.2 * latency
+                )
+                if self.latency_threshold is not None:
+                    overloaded = latency > self.latency_threshold
+
+            if overloaded:
+                if now - self._last_decrease >= self.cooldown:
+                    self._limit = max(
+                        float(self.min_limit), self._limit * self.decrease_factor
+                    )
+                    self._last_decrease = now
+            elif error is None:
+                self._limit = min(
+                    float(self.max_limit), self._limit + self.increase / self._limit
+                )
+
+            self._cond.notify_all()
+            waiters = list(self._async_waiters)
+            self._async_waiters.clear()
+
+        for loop, future in waiters:
+            loop.call_soon_threadsafe(_wake, future)
+
+
+def _wake(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
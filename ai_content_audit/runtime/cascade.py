@@ -0,0 +1,48 @@
+from typing import Any, Iterable, Optional
+from ai_content_audit.models import AuditDecision, AuditOptionsItem, UNCERTAIN_CHOICES
+
+
+class ModelCascade:
+    """
+    模型级联：先用快速（廉价）模型审核，仅将不确定或需复核的结论升级到主模型重新审核。
+
+    - 快速模型给出“不确定”类标签（与 _ensure_choice 识别的标签集合一致，见 UNCERTAIN_CHOICES）
+      或 escalate_labels 中的标签时，升级到管理器的主模型。
+    - 快速模型调用失败时同样升级，由主模型兜底。
+    - 两级结论分别按各自的模型名称缓存。
+    """
+
+    def __init__(
+        self,
+        fast_model: str,
+        *,
+        fast_client: Optional[Any] = None,
+        escalate_uncertain: bool = True,
+        escalate_labels: Iterable[str] = (),
+    ) -> None:
+        """
+        参数：
+        - fast_model (str): 第一级快速模型名称。
+        - fast_client (Optional[Any]): 可选快速模型专用客户端，默认与主模型使用相同客户端（或客户端池）。
+        - escalate_uncertain (bool): 快速模型给出“不确定”类标签时是否升级，默认 True。
+        - escalate_labels (Iterable[str]): 额外需要升级复核的标签（如 "违规"），默认无。
+        """
+        self.fast_model = fast_model
+        self.fast_client = fast_client
+        self.escalate_uncertain = escalate_uncertain
+        self.escalate_labels = frozenset(escalate_labels)
+
+    def should_escalate(self, decision: AuditDecision, item: AuditOptionsItem) -> bool:
+        """
+        判断快速模型的结论是否需要升级到主模型。
+
+        参数：
+        - decision (AuditDecision): 快速模型的决策（已规范化）。
+        - item (AuditOptionsItem): 审核项。
+
+        返回：
+        - bool: 需要升级时为 True。
+        """
+        if decision.choice in self.escalate_labels:
+            return True
+        return self.escalate_uncertain and decision.choice in UNCERTAIN_CHOICES
@@ -0,0 +1,261 @@
+import threading
+import time
+from typing import Any, Dict, List, Literal, Optional, Sequence, Union
+import openai
+from ai_content_audit.runtime.retry import is_retryable_error
+
+# 视为端点自身故障的鉴权类状态码（如某个 API Key 失效或被停用）
+ENDPOINT_AUTH_STATUS_CODES = {401, 403}
+
+
+def is_endpoint_error(exc: BaseException) -> bool:
+    """
+    判断异常是否反映端点健康状况（计入端点错误率）。
+
+    - 计入：连接错误与超时、408/409/429、5xx，以及 401/403（该端点的 Key 不可用）。
+    - 不计入：请求本身的问题（400/404/422、结构化输出校验失败等），换端点也无济于事。
+    """
+    if is_retryable_error(exc):
+        return True
+    if isinstance(exc, openai.APIStatusError):
+        return exc.status_code in ENDPOINT_AUTH_STATUS_CODES
+    return False
+
+
+class PoolEndpoint:
+    """
+    客户端池中的单个端点（一个 OpenAI 兼容客户端）及其健康统计。
+
+    统计字段由 ClientPool 在持锁时更新，外部只读。
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        name: Optional[str] = None,
+        weight: int = 1,
+        model: Optional[str] = None,
+    ) -> None:
+        """
+        参数：
+        - client (Any): OpenAI / AsyncOpenAI 兼容客户端。
+        - name (Optional[str]): 端点名称，用于监控展示；默认取 client.base_url。
+        - weight (int): 权重（正整数），配额越大的端点权重越高，默认 1。
+        - model (Optional[str]): 可选模型名称覆盖（不同区域的部署名不同时使用），只替换管理器的默认模型，
+          方法级 model= 覆盖与级联快速模型不受影响；缓存键仍使用管理器的模型名称。
+        """
+        if weight < 1:
+            raise ValueError("weight 必须大于等于 1")
+        self.client = client
+        self.name = name or str(getattr(client, "base_url", "endpoint"))
+        self.weight = weight
+        self.model = model
+
+        self.outstanding = 0
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.error_rate = 0.0
+        self.ewma_latency: Optional[float] = None
+        self.ejections = 0
+        self.ejected_until = 0.0
+        self._current_weight = 0
+
+    @property
+    def healthy(self) -> bool:
+        """当前是否可用（未处于摘除期）。"""
+        return time.monotonic() >= self.ejected_until
+
+
+class ClientPool:
+    """
+    多端点客户端池：在多个 API Key / 区域端点之间分配请求，并按健康状况临时摘除故障端点。
+
+    - 负载均衡策略：
+      - "least_outstanding"（默认）：选择 在途请求数 / 权重 最小的端点，相同时轮转，
+        慢端点或故障端点的在途请求会自然积压而少分流量。
+      - "round_robin"：平滑加权轮询，请求数按权重比例分配。
+    - 健康检查：请求失败（见 is_endpoint_error）计入该端点错误率（指数加权）与连续失败数；
+      连续失败达到 max_consecutive_failures，或请求数达到 min_requests 后错误率达到 max_error_rate 时，
+      摘除 ejection_time 秒，再次摘除时时长翻倍（不超过 max_ejection_time），恢复成功后重置。
+    - 全部端点都被摘除时，选择最早恢复的端点继续请求（宁可尝试也不整体不可用）。
+
+    线程安全，可在 AuditManager 与 AsyncAuditManager 间共享（客户端类型需与管理器一致）。
+    """
+
+    def __init__(
+        self,
+        endpoints: Sequence[Union[PoolEndpoint, Any]],
+        *,
+        strategy: Literal["least_outstanding", "round_robin"] = "least_outstanding",
+        max_consecutive_failures: int = 5,
+        max_error_rate: float = 0.5,
+        min_requests: int = 10,
+        ejection_time: float = 30.0,
+        max_ejection_time: float = 300.0,
+        ewma_alpha: float = 0.1,
+    ) -> None:
+        """
+        参数：
+        - endpoints (Sequence[Union[PoolEndpoint, Any]]): 端点列表；直接传入客户端时按权重 1 包装。
+        - strategy (str): 负载均衡策略，"least_outstanding"（默认）或 "round_robin"。
+        - max_consecutive_failures (int): 连续失败多少次后摘除，默认 5。
+        - max_error_rate (float): 错误率（指数加权，0~1）阈值，默认 0.5。
+        - min_requests (int): 按错误率摘除前至少完成的请求数，默认 10。
+        - ejection_time (float): 首次摘除时长（秒），默认 30。
+        - max_ejection_time (float): 摘除时长上限（秒），默认 300。
+        - ewma_alpha (float): 错误率与延迟的指数加权系数（0~1），默认 0.1。
+        """
+        if not endpoints:
+            raise ValueError("endpoints 不能为空")
+        if strategy not in ("least_outstanding", "round_robin"):
+            raise ValueError(f"不支持的负载均衡策略: {strategy}")
+        if max_consecutive_failures < 1:
+            raise ValueError("max_consecutive_failures 必须大于等于 1")
+        if not 0 < max_error_rate <= 1:
+            raise ValueError("max_error_rate 必须在 (0, 1] 之间")
+        if not 0 < ewma_alpha <= 1:
+            raise ValueError("ewma_alpha 必须在 (0, 1] 之间")
+        self._endpoints: List[PoolEndpoint] = [
+            e if isinstance(e, PoolEndpoint) else PoolEndpoint(e) for e in endpoints
+        ]
+        self.strategy = strategy
+        self.max_consecutive_failures = max_consecutive_failures
+        self.max_error_rate = max_error_rate
+        self.min_requests = min_requests
+        self.ejection_time = ejection_time
+        self.max_ejection_time = max_ejection_time
+        self.ewma_alpha = ewma_alpha
+
+        self._cursor = 0
+        self._lock = threading.Lock()
+
+    @property
+    def endpoints(self) -> List[PoolEndpoint]:
+        """全部端点（只读视图）。"""
+        return list(self._endpoints)
+
+    def acquire(self) -> PoolEndpoint:
+        """
+        选择一个端点并计入在途请求，请求结束后必须调用 release。
+
+        返回：
+        - PoolEndpoint: 选中的端点。
+        """
+        now = time.monotonic()
+        with self._lock:
+            candidates = [e for e in self._endpoints if now >= e.ejected_until]
+            if not candidates:
+                endpoint = min(self._endpoints, key=lambda e: e.ejected_until)
+            elif self.strategy == "round_robin":
+                endpoint = self._pick_round_robin(candidates)
+            else:
+                endpoint = self._pick_least_outstanding(candidates)
+            endpoint.outstanding += 1
+            return endpoint
+
+    def release(
+        self,
+        endpoint: PoolEndpoint,
+        *,
+        latency: Optional[float] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """
+        结束一次请求，更新端点的健康统计，必要时摘除端点。
+
+        参数：
+        - endpoint (PoolEndpoint): acquire 返回的端点。
+        - latency (Optional[float]): 请求耗时（秒），成功时提供。
+        - error (Optional[BaseException]): 请求失败时的异常，成功时为 None。
+        """
+        alpha = self.ewma_alpha
+        with self._lock:
+            endpoint.outstanding -= 1
+            if error is not None and not is_endpoint_error(error):
+                # 请求本身的问题，与端点健康无关
+                return
+
+            endpoint.requests += 1
+            if error is None:
+                endpoint.consecutive_failures = 0
+                endpoint.error_rate *= 1 - alpha
+                if (
+                    endpoint.ejected_until
+                    and time.monotonic() >= endpoint.ejected_until
+                ):
+                    # 摘除恢复后首次成功，重置退避
+                    endpoint.ejections = 0
+                    endpoint.ejected_until = 0.0
+                if latency is not None:
+                    endpoint.ewma_latency = (
+                        latency
+                        if endpoint.ewma_latency is None
+                        else (1 - alpha) * endpoint.ewma_latency + alpha * latency
+                    )
+                return
+
+            endpoint.failures += 1
+            endpoint.consecutive_failures += 1
+            endpoint.error_rate = (1 - alpha) * endpoint.error_rate + alpha
+            if endpoint.consecutive_failures >= self.max_consecutive_failures or (
+                endpoint.requests >= self.min_requests
+                and endpoint.error_rate >= self.max_error_rate
+            ):
+                self._eject(endpoint)
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """
+        各端点的健康统计快照，便于监控与日志。
+
+        返回：
+        - List[Dict[str, Any]]: 每个端点的 name、weight、healthy、outstanding、requests、
+          failures、error_rate、ewma_latency。
+        """
+        now = time.monotonic()
+        with self._lock:
+            return [
+                {
+                    "name": e.name,
+                    "weight": e.weight,
+                    "healthy": now >= e.ejected_until,
+                    "outstanding": e.outstanding,
+                    "requests": e.requests,
+                    "failures": e.failures,
+                    "error_rate": e.error_rate,
+                    "ewma_latency": e.ewma_latency,
+                }
+                for e in self._endpoints
+            ]
+
+    def _pick_least_outstanding(self, candidates: List[PoolEndpoint]) -> PoolEndpoint:
+        """内部方法：在途请求数 / 权重 最小者，从轮转起点开始比较以打散平局（调用方持有锁）。"""
+        start = self._cursor % len(candidates)
+        self._cursor += 1
+        ordered = candidates[start:] + candidates[:start]
+        return min(ordered, key=lambda e: e.outstanding / e.weight)
+
+    def _pick_round_robin(self, candidates: List[PoolEndpoint]) -> PoolEndpoint:
+        """内部方法：平滑加权轮询（调用方持有锁）。"""
+        total = 0
+        best: Optional[PoolEndpoint] = None
+        for e in candidates:
+            e._current_weight += e.weight
+            total += e.weight
+            if best is None or e._current_weight > best._current_weight:
+                best = e
+        assert best is not None
+        best._current_weight -= total
+        return best
+
+    def _eject(self, endpoint: PoolEndpoint) -> None:
+        """内部方法：摘除端点，时长随连续摘除次数指数增长（调用方持有锁）。"""
+        duration = min(
+            self.ejection_time * (2**endpoint.ejections), self.max_ejection_time
+        )
+        endpoint.ejections += 1
+        endpoint.ejected_until = time.monotonic() + duration
+        endpoint.consecutive_failures = 0
+        endpoint.error_rate = 0.0
+        endpoint._current_weight = 0
@@ -0,0 +1,162 @@
+import math
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Deque, Optional
+
+
+class HedgePolicy:
+    """
+    对冲请求策略：请求在延迟阈值内未返回时，再发起一个相同请求，取先返回者。
+
+    - 延迟阈值默认取近期成功请求延迟的 percentile 分位数（样本不足时使用 initial_delay），
+      也可通过 delay 固定。
+    - max_hedge_rate 限制对冲请求占全部请求的比例，控制额外成本。
+    - 对冲请求可发往备用客户端 / 模型（client / model），默认与原请求相同。
+    - requests、hedged、hedge_wins 与 hedge_rate 可作为监控指标。
+    - 同步管理器的原请求与对冲请求在共享线程池（executor()，首次使用时创建）中执行。
+
+    线程安全，可在同步与异步管理器间共享。
+    """
+
+    def __init__(
+        self,
+        *,
+        delay: Optional[float] = None,
+        percentile: float = 95.0,
+        initial_delay: float = 1.0,
+        min_delay: float = 0.05,
+        max_delay: Optional[float] = None,
+        max_hedge_rate: float = 0.1,
+        window: int = 1000,
+        min_samples: int = 20,
+        client: Optional[Any] = None,
+        model: Optional[str] = None,
+        max_workers: int = 32,
+    ) -> None:
+        """
+        参数：
+        - delay (Optional[float]): 固定对冲延迟（秒）；None 时按延迟分位数自适应。
+        - percentile (float): 自适应时使用的延迟分位数（0~100），默认 95。
+        - initial_delay (float): 样本不足 min_samples 时的对冲延迟（秒），默认 1。
+        - min_delay (float): 自适应延迟下限（秒），默认 0.05。
+        - max_delay (Optional[float]): 自适应延迟上限（秒），默认不限。
+        - max_hedge_rate (float): 对冲请求数 / 请求数 的上限（0~1），默认 0.1。
+        - window (int): 延迟样本窗口大小，默认 1000。
+        - min_samples (int): 使用分位数前至少需要的样本数，默认 20。
+        - client (Optional[Any]): 可选备用客户端，对冲请求发往该客户端。
+        - model (Optional[str]): 可选备用模型，对冲请求使用该模型。
+        - max_workers (int): 同步管理器发起请求的共享线程池大小，默认 32；
+          需覆盖同时在途的 audit_one 请求及落后未结束的请求。
+        """
+        if delay is not None and delay < 0:
+            raise ValueError("delay 不能为负数")
+        if not 0 < percentile <= 100:
+            raise ValueError("percentile 必须在 (0, 100] 之间")
+        if not 0 <= max_hedge_rate <= 1:
+            raise ValueError("max_hedge_rate 必须在 [0, 1] 之间")
+        if window < 1:
+            raise ValueError("window 必须大于等于 1")
+        if max_workers < 1:
+            raise ValueError("max_workers 必须大于等于 1")
+        self.fixed_delay = delay
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.max_hedge_rate = max_hedge_rate
+        self.min_samples = min_samples
+        self.client = client
+        self.model = model
+        self.max_workers = max_workers
+
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._requests = 0
+        self._hedged = 0
+        self._hedge_wins = 0
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def requests(self) -> int:
+        """经过对冲策略的请求数。"""
+        return self._requests
+
+    @property
+    def hedged(self) -> int:
+        """实际发起的对冲请求数。"""
+        return self._hedged
+
+    @property
+    def hedge_wins(self) -> int:
+        """对冲请求先于原请求返回的次数。"""
+        return self._hedge_wins
+
+    @property
+    def hedge_rate(self) -> float:
+        """对冲率：hedged / requests。"""
+        return self._hedged / self._requests if self._requests else 0.0
+
+    def delay(self) -> float:
+        """
+        计算本次请求的对冲延迟，并计入请求数。
+
+        返回：
+        - float: 等待多少秒未返回时发起对冲请求。
+        """
+        with self._lock:
+            self._requests += 1
+            if self.fixed_delay is not None:
+                return self.fixed_delay
+            if len(self._samples) < self.min_samples:
+                return self.initial_delay
+            ordered = sorted(self._samples)
+        rank = max(math.ceil(self.percentile / 100 * len(ordered)) - 1, 0)
+        value = max(ordered[rank], self.min_delay)
+        if self.max_delay is not None:
+            value = min(value, self.max_delay)
+        return value
+
+    def try_hedge(self) -> bool:
+        """
+        申请发起一次对冲请求，超过 max_hedge_rate 时拒绝。
+
+        返回：
+        - bool: 允许对冲时为 True（并计入对冲数）。
+        """
+        with self._lock:
+            if self._hedged + 1 > self.max_hedge_rate * self._requests:
+                return False
+            self._hedged += 1
+            return True
+
+    def observe(self, latency: float) -> None:
+        """记录一次成功请求的延迟（秒），用于计算分位数。"""
+        with self._lock:
+            self._samples.append(latency)
+
+    def record_win(self) -> None:
+        """记录一次对冲请求胜出。"""
+        with self._lock:
+            self._hedge_wins += 1
+
+    def executor(self) -> ThreadPoolExecutor:
+        """同步管理器发起原请求与对冲请求的共享线程池，首次调用时创建。"""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="audit-hedge"
+                )
+            return self._executor
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        关闭共享线程池；之后再次使用时重新创建。
+
+        参数：
+        - wait (bool): 是否等待进行中的请求结束，默认 True。
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
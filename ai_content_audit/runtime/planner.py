@@ -0,0 +1,196 @@
+import json
+import threading
+from pathlib import Path
+from typing import Dict, List, Literal, Optional, Sequence, Union
+from uuid import UUID
+from pydantic import BaseModel, Field
+from ai_content_audit.models import AuditOptionsItem
+
+
+class ItemStats(BaseModel):
+    """单个审核项的累计运行统计。"""
+
+    evaluations: int = Field(0, description="已统计的审核次数（不含失败与跳过）")
+    blocks: int = Field(0, description="给出阻断结论的次数")
+    total_latency: float = Field(0.0, description="模型请求累计耗时（秒）")
+    total_tokens: int = Field(0, description="模型请求累计 token 用量")
+
+    @property
+    def block_rate(self) -> float:
+        """阻断率。"""
+        return self.blocks / self.evaluations if self.evaluations else 0.0
+
+    @property
+    def avg_latency(self) -> float:
+        """平均每次审核的模型耗时（秒，缓存与预过滤命中计为 0）。"""
+        return self.total_latency / self.evaluations if self.evaluations else 0.0
+
+    @property
+    def avg_tokens(self) -> float:
+        """平均每次审核的 token 用量（缓存与预过滤命中计为 0）。"""
+        return self.total_tokens / self.evaluations if self.evaluations else 0.0
+
+
+class ItemPlanner:
+    """
+    审核项排序规划器：按各审核项的运行统计，为短路模式规划审核顺序，使期望成本最小。
+
+    - 按 AuditOptionsItem.id 累计审核次数、阻断次数、耗时与 token 用量（AuditManager 自动记录）。
+    - 审核项相互独立时，按 成本 / 阻断概率 升序排列可使期望成本最小
+      （期望成本 = Σ 成本_i × Π_{j<i}(1 - 阻断率_j)）；不能阻断的审核项（未配置 blocking_choices）排在最后。
+    - 样本较少的审核项的阻断率向 prior_block_rate 收缩，没有样本时成本取已知审核项的平均值。
+    - 统计可通过 save / load 在多次运行间持久化。
+
+    线程安全。
+    """
+
+    def __init__(
+        self,
+        *,
+        cost: Literal["tokens", "latency"] = "tokens",
+        prior_block_rate: float = 0.1,
+        prior_weight: float = 5.0,
+        stats: Optional[Dict[UUID, ItemStats]] = None,
+    ) -> None:
+        """
+        参数：
+        - cost (str): 成本度量，"tokens"（默认，token 用量）或 "latency"（模型耗时）。
+        - prior_block_rate (float): 无样本时假定的阻断率，默认 0.1。
+        - prior_weight (float): 先验的等效样本数，样本越少阻断率越接近先验，默认 5。
+        - stats (Optional[Dict[UUID, ItemStats]]): 初始统计（通常由 load 提供）。
+        """
+        if cost not in ("tokens", "latency"):
+            raise ValueError(f"不支持的成本度量: {cost}")
+        if not 0 <= prior_block_rate <= 1:
+            raise ValueError("prior_block_rate 必须在 [0, 1] 之间")
+        self.cost = cost
+        self.prior_block_rate = prior_block_rate
+        self.prior_weight = prior_weight
+        self._stats: Dict[UUID, ItemStats] = dict(stats or {})
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        item_id: UUID,
+        *,
+        blocked: bool,
+        latency: float = 0.0,
+        tokens: int = 0,
+    ) -> None:
+        """
+        记录一次审核结果。
+
+        参数：
+        - item_id (UUID): 审核项ID。
+        - blocked (bool): 是否给出阻断结论。
+        - latency (float): 本次审核的模型请求耗时（秒）。
+        - tokens (int): 本次审核的 token 用量。
+        """
+        with self._lock:
+            stats = self._stats.setdefault(item_id, ItemStats())
+            stats.evaluations += 1
+            stats.blocks += int(blocked)
+            stats.total_latency += latency
+            stats.total_tokens += tokens
+
+    def stats(self, item_id: UUID) -> ItemStats:
+        """读取审核项统计的副本，无记录时返回空统计。"""
+        with self._lock:
+            stats = self._stats.get(item_id)
+            return stats.model_copy() if stats is not None else ItemStats()
+
+    def plan(self, items: Sequence[AuditOptionsItem]) -> List[AuditOptionsItem]:
+        """
+        规划审核顺序。
+
+        参数：
+        - items (Sequence[AuditOptionsItem]): 审核项列表。
+
+        返回：
+        - List[AuditOptionsItem]: 按期望成本最小排序后的审核项（排序稳定，同等条件保持原顺序）。
+        """
+        return [items[i] for i in self.plan_order(items)]
+
+    def plan_order(self, items: Sequence[AuditOptionsItem]) -> List[int]:
+        """
+        规划审核顺序，返回 items 的下标序列（见 plan）。
+        """
+        with self._lock:
+            snapshot = {
+                it.id: self._stats[it.id].model_copy()
+                for it in items
+                if it.id in self._stats
+            }
+
+        known = [self._cost(s) for s in snapshot.values() if s.evaluations]
+        default_cost = sum(known) / len(known) if known else 1.0
+
+        def key(item: AuditOptionsItem) -> float:
+            if not item.blocking_choices:
+                return float("inf")
+            stats = snapshot.get(item.id, ItemStats())
+            rate = (stats.blocks + self.prior_block_rate * self.prior_weight) / (
+                stats.evaluations + self.prior_weight
+            )
+            if rate <= 0:
+                return float("inf")
+            cost = self._cost(stats) if stats.evaluations else default_cost
+            return cost / rate
+
+        return sorted(range(len(items)), key=lambda i: key(items[i]))
+
+    def expected_cost(self, items: Sequence[AuditOptionsItem]) -> float:
+        """
+        按当前统计估算某一顺序下每个内容的期望成本（用于比较排序效果）。
+
+        参数：
+        - items (Sequence[AuditOptionsItem]): 按审核顺序排列的审核项。
+
+        返回：
+        - float: 期望成本（单位取决于 cost）。
+        """
+        total = 0.0
+        survive = 1.0
+        for item in items:
+            stats = self.stats(item.id)
+            total += survive * self._cost(stats)
+            if item.blocking_choices:
+                survive *= 1 - stats.block_rate
+        return total
+
+    def save(self, path: Union[str, Path]) -> None:
+        """将统计保存为 JSON 文件。"""
+        with self._lock:
+            data = {
+                str(item_id): stats.model_dump()
+                for item_id, stats in self._stats.items()
+            }
+        Path(path).write_text(
+            json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+
+    @classmethod
+    def load(cls, path: Union[str, Path], **kwargs) -> "ItemPlanner":
+        """
+        从 JSON 文件加载统计，文件不存在时返回空规划器。
+
+        参数：
+        - path (Union[str, Path]): 统计文件路径。
+        - **kwargs: 传给构造函数的其它参数（cost、prior_block_rate 等）。
+
+        返回：
+        - ItemPlanner: 规划器。
+        """
+        p = Path(path)
+        stats: Dict[UUID, ItemStats] = {}
+        if p.exists():
+            data = json.loads(p.read_text(encoding="utf-8"))
+            stats = {
+                UUID(item_id): ItemStats.model_validate(value)
+                for item_id, value in data.items()
+            }
+        return cls(stats=stats, **kwargs)
+
+    def _cost(self, stats: ItemStats) -> float:
+        """内部方法：按成本度量取平均成本。"""
+        return stats.avg_tokens if self.cost == "tokens" else stats.avg_latency
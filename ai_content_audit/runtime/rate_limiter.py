@@ -0,0 +1,129 @@
+import asyncio
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from ai_content_audit.prompts.token_estimator import estimate_message_tokens
+
+
+class _TokenBucket:
+    """
+    令牌桶：容量为每分钟配额，按 配额/60 每秒匀速补充。
+
+    采用预约方式：reserve 立即扣减（允许为负），返回需等待的秒数，调用方在锁外等待，
+    保证请求按到达顺序获得配额。
+    """
+
+    def __init__(self, per_minute: float) -> None:
+        self.capacity = float(per_minute)
+        self.fill_rate = self.capacity / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated) * self.fill_rate
+        )
+        self.updated = now
+
+    def reserve(self, amount: float, now: float) -> float:
+        self._refill(now)
+        self.tokens -= amount
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.fill_rate
+
+    def adjust(self, delta: float, now: float) -> None:
+        """按实际用量修正：delta > 0 表示多扣，delta < 0 表示少扣。"""
+        self._refill(now)
+        self.tokens = min(self.capacity, self.tokens + delta)
+
+
+class RateLimiter:
+    """
+    客户端 RPM/TPM 限流器（令牌桶）。
+
+    - rpm：每分钟请求数上限；tpm：每分钟 token 数上限，二者可只配置其一。
+    - 请求前按估算 token 数（渲染后的消息 + 预计输出 token）预约配额，
+      返回后用实际 usage 修正 TPM 桶，使发送速率贴近配额而不触发 429。
+    - 线程安全，同时提供同步 acquire 与异步 acquire_async，可在 AuditManager 与 AsyncAuditManager 间共享。
+    """
+
+    def __init__(
+        self,
+        *,
+        rpm: Optional[float] = None,
+        tpm: Optional[float] = None,
+        expected_completion_tokens: int = 100,
+    ) -> None:
+        """
+        参数：
+        - rpm (Optional[float]): 每分钟请求数上限，None 表示不限制。
+        - tpm (Optional[float]): 每分钟 token 数上限，None 表示不限制。
+        - expected_completion_tokens (int): 预约配额时预计的输出 token 数，默认 100。
+        """
+        if rpm is None and tpm is None:
+            raise ValueError("rpm 与 tpm 至少需要配置一个")
+        if (rpm is not None and rpm <= 0) or (tpm is not None and tpm <= 0):
+            raise ValueError("rpm 与 tpm 必须大于 0")
+        self.rpm = rpm
+        self.tpm = tpm
+        self.expected_completion_tokens = expected_completion_tokens
+        self._requests = _TokenBucket(rpm) if rpm is not None else None
+        self._tokens = _TokenBucket(tpm) if tpm is not None else None
+        self._lock = threading.Lock()
+
+    def estimate_tokens(self, messages: List[Dict[str, Any]]) -> int:
+        """估算一次请求消耗的 token 数（输入估算 + 预计输出）。"""
+        return estimate_message_tokens(messages) + self.expected_completion_tokens
+
+    def _reserve(self, tokens: int) -> float:
+        now = time.monotonic()
+        with self._lock:
+            wait = 0.0
+            if self._requests is not None:
+                wait = max(wait, self._requests.reserve(1, now))
+            if self._tokens is not None:
+                wait = max(wait, self._tokens.reserve(tokens, now))
+        return wait
+
+    def acquire(self, tokens: int = 0) -> float:
+        """
+        预约一次请求的配额，必要时阻塞等待。
+
+        参数：
+        - tokens (int): 本次请求的估算 token 数。
+
+        返回：
+        - float: 实际等待的秒数。
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, tokens: int = 0) -> float:
+        """acquire 的 asyncio 版本，等待期间不阻塞事件循环。"""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def reconcile(self, estimated: int, actual: Optional[int]) -> None:
+        """
+        用实际 token 用量修正 TPM 桶。
+
+        参数：
+        - estimated (int): 预约时的估算 token 数。
+        - actual (Optional[int]): 响应 usage 中的实际 token 数，None 表示未返回，不修正。
+        """
+        if self._tokens is None or actual is None:
+            return
+        with self._lock:
+            self._tokens.adjust(estimated - actual, time.monotonic())
+
+
+def usage_total_tokens(resp: Any) -> Optional[int]:
+    """从模型响应中读取 usage.total_tokens，不存在时返回 None。"""
+    usage = getattr(resp, "usage", None)
+    total = getattr(usage, "total_tokens", None)
+    return total if isinstance(total, int) else None
@@ -0,0 +1,123 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+import openai
+
+# 可重试的 HTTP 状态码：请求超时、冲突、限流
+RETRYABLE_STATUS_CODES = {408, 409, 429}
+
+
+def is_retryable_error(exc: BaseException) -> bool:
+    """
+    判断异常是否值得重试。
+
+    - 可重试：连接错误与超时（APIConnectionError / APITimeoutError）、408/409/429 与 5xx 状态码。
+    - 不可重试：鉴权/权限错误（401/403）、请求错误（400/404/422）、结构化输出校验失败等。
+    """
+    if isinstance(exc, openai.APIConnectionError):
+        return True
+    if isinstance(exc, openai.APIStatusError):
+        status = exc.status_code
+        return status in RETRYABLE_STATUS_CODES or status >= 500
+    return False
+
+
+def retry_after_seconds(exc: BaseException) -> Optional[float]:
+    """
+    读取错误响应中的服务端建议等待时间（retry-after-ms / retry-after 头）。
+
+    retry-after 支持秒数与 HTTP 日期两种格式，无法解析时返回 None。
+    """
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    value = headers.get("retry-after-ms")
+    if value is not None:
+        try:
+            return max(float(value) / 1000.0, 0.0)
+        except (TypeError, ValueError):
+            pass
+
+    value = headers.get("retry-after")
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """
+    模型调用的重试策略：指数退避 + 抖动，优先遵循服务端 Retry-After。
+
+    - 仅重试 is_retryable_error 判定为可重试的错误，鉴权或校验类错误立即失败。
+    - 第 n 次重试前的等待时间为 base_delay * multiplier^(n-1)，不超过 max_delay；
+      开启 jitter 时在 [0, 等待时间] 内均匀随机（full jitter），避免大量请求同时重试。
+    - 错误响应带有 Retry-After 时使用该值（不超过 max_retry_after）。
+
+    建议同时将 OpenAI 客户端的 max_retries 设为 0，由本策略统一控制重试。
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        *,
+        base_delay: float = 0.5,
+        multiplier: float = 2.0,
+        max_delay: float = 30.0,
+        jitter: bool = True,
+        max_retry_after: float = 60.0,
+    ) -> None:
+        """
+        参数：
+        - max_attempts (int): 最大尝试次数（含首次调用），默认 3。
+        - base_delay (float): 首次重试前的基础等待秒数，默认 0.5。
+        - multiplier (float): 退避倍数，默认 2。
+        - max_delay (float): 单次退避等待上限（秒），默认 30。
+        - jitter (bool): 是否启用随机抖动，默认 True。
+        - max_retry_after (float): 遵循 Retry-After 时的等待上限（秒），默认 60。
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts 必须大于等于 1")
+        if base_delay < 0 or max_delay < 0:
+            raise ValueError("等待时间不能为负数")
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.multiplier = multiplier
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.max_retry_after = max_retry_after
+
+    def should_retry(self, exc: BaseException, attempt: int) -> bool:
+        """
+        判断第 attempt 次尝试失败后是否继续重试。
+
+        参数：
+        - exc (BaseException): 本次尝试抛出的异常。
+        - attempt (int): 已进行的尝试次数（从 1 开始）。
+        """
+        return attempt < self.max_attempts and is_retryable_error(exc)
+
+    def delay(self, exc: BaseException, attempt: int) -> float:
+        """
+        计算第 attempt 次尝试失败后、下次重试前的等待秒数。
+
+        参数：
+        - exc (BaseException): 本次尝试抛出的异常。
+        - attempt (int): 已进行的尝试次数（从 1 开始）。
+        """
+        retry_after = retry_after_seconds(exc)
+        if retry_after is not None:
+            return min(retry_after, self.max_retry_after)
+        backoff = min(
+            self.base_delay * self.multiplier ** (attempt - 1), self.max_delay
+        )
+        return random.uniform(0, backoff) if self.jitter else backoff
@@ -0,0 +1,249 @@
+import asyncio
+import heapq
+import itertools
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Dict, Iterator, List, Literal, Optional, Tuple
+from ai_content_audit.runtime.adaptive import AdaptiveConcurrencyLimiter
+
+Priority = Literal["interactive", "bulk"]
+
+# 优先级从高到低
+PRIORITIES: Tuple[str, ...] = ("interactive", "bulk")
+
+
+class _Waiter:
+    """排队中的请求；异步等待者持有所属事件循环与 future。"""
+
+    __slots__ = ("priority", "loop", "future", "granted", "cancelled")
+
+    def __init__(
+        self,
+        priority: str,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        future: Optional[asyncio.Future] = None,
+    ) -> None:
+        self.priority = priority
+        self.loop = loop
+        self.future = future
+        self.granted = False
+        self.cancelled = False
+
+
+class PriorityScheduler:
+    """
+    优先级请求调度器：在模型请求前排队，按优先级分配有限的并发名额。
+
+    - 两个优先级：interactive（实时审核）与 bulk（批量 / 回填）。有空闲名额时先分配给 interactive，
+      bulk 只使用剩余名额，实时请求不会排在积压的批量请求之后。
+    - reserved_interactive 为 interactive 预留名额：bulk 在途请求数不超过 max_concurrency - reserved_interactive，
+      实时请求到达时无需等待在途的批量请求结束。
+    - 同一优先级内按租户加权公平排队（起始时间公平排队，SFQ）：各租户按 tenant_weights 的权重分享名额，
+      未配置租户时按到达顺序（FIFO）。
+    - 绑定自适应并发限制器（limiter）时，名额数随 limiter.limit 收缩：调度器是唯一按优先级排队的关口，
+      取得名额的请求在限制器处基本无需等待，不会出现批量请求占着名额在限制器前排队、实时请求无法插队。
+    - in_flight 与 waiting 可作为监控指标。
+
+    同时提供同步 acquire 与异步 acquire_async，可在 AuditManager 与 AsyncAuditManager 间共享。
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        *,
+        reserved_interactive: int = 0,
+        tenant_weights: Optional[Dict[str, float]] = None,
+        default_weight: float = 1.0,
+        limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+    ) -> None:
+        """
+        参数：
+        - max_concurrency (int): 同时在途的模型请求数上限。
+        - reserved_interactive (int): 为 interactive 预留的名额数，默认 0（不预留，bulk 可占满空闲名额）。
+        - tenant_weights (Optional[Dict[str, float]]): 租户权重，权重越大分得的名额越多。
+        - default_weight (float): 未配置权重的租户的默认权重，默认 1。
+        - limiter (Optional[AdaptiveConcurrencyLimiter]): 可选自适应并发限制器，名额数取
+          min(max_concurrency, limiter.limit)。管理器同时配置 scheduler 与 concurrency_limiter 时自动绑定。
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency 必须大于等于 1")
+        if not 0 <= reserved_interactive < max_concurrency:
+            raise ValueError("reserved_interactive 必须在 [0, max_concurrency) 之间")
+        weights = dict(tenant_weights or {})
+        if default_weight <= 0 or any(w <= 0 for w in weights.values()):
+            raise ValueError("租户权重必须大于 0")
+        self.max_concurrency = max_concurrency
+        self.reserved_interactive = reserved_interactive
+        self.tenant_weights = weights
+        self.default_weight = default_weight
+        self.limiter = limiter
+
+        self._in_flight = 0
+        self._queues: Dict[str, List[Tuple[float, int, _Waiter]]] = {
+            p: [] for p in PRIORITIES
+        }
+        self._waiting: Dict[str, int] = {p: 0 for p in PRIORITIES}
+        self._virtual_time: Dict[str, float] = {p: 0.0 for p in PRIORITIES}
+        self._finish_tags: Dict[Tuple[str, Optional[str]], float] = {}
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+
+    @property
+    def in_flight(self) -> int:
+        """当前在途请求数。"""
+        return self._in_flight
+
+    @property
+    def capacity(self) -> int:
+        """当前名额数：max_concurrency，绑定限制器时不超过其当前并发上限。"""
+        if self.limiter is None:
+            return self.max_concurrency
+        return min(self.max_concurrency, self.limiter.limit)
+
+    def bind_limiter(self, limiter: AdaptiveConcurrencyLimiter) -> None:
+        """
+        绑定自适应并发限制器，名额数随其并发上限变化。
+
+        参数：
+        - limiter (AdaptiveConcurrencyLimiter): 并发限制器；已绑定其它限制器时抛出 ValueError。
+        """
+        with self._cond:
+            if self.limiter is not None and self.limiter is not limiter:
+                raise ValueError("调度器已绑定其它并发限制器")
+            self.limiter = limiter
+
+    @property
+    def waiting(self) -> Dict[str, int]:
+        """各优先级排队中的请求数。"""
+        with self._cond:
+            return dict(self._waiting)
+
+    def acquire(
+        self, priority: Priority = "interactive", *, tenant: Optional[str] = None
+    ) -> None:
+        """
+        按优先级排队并占用一个名额，无可用名额时阻塞等待。
+
+        参数：
+        - priority (str): 优先级，"interactive" 或 "bulk"，默认 "interactive"。
+        - tenant (Optional[str]): 可选租户标识，用于同一优先级内的加权公平排队。
+        """
+        waiter = _Waiter(priority)
+        with self._cond:
+            self._enqueue(waiter, tenant)
+            woken = self._dispatch()
+        _wake_all(woken)
+        with self._cond:
+            while not waiter.granted:
+                self._cond.wait()
+
+    async def acquire_async(
+        self, priority: Priority = "interactive", *, tenant: Optional[str] = None
+    ) -> None:
+        """acquire 的 asyncio 版本；等待期间被取消时退出队列（已分配的名额会归还）。"""
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(priority, loop, loop.create_future())
+        with self._cond:
+            self._enqueue(waiter, tenant)
+            woken = self._dispatch()
+        _wake_all(woken)
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            with self._cond:
+                granted = waiter.granted
+                if not granted:
+                    waiter.cancelled = True
+                    self._waiting[priority] -= 1
+            if granted:
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """归还名额，并按优先级把空出的名额分配给排队中的请求。"""
+        with self._cond:
+            self._in_flight -= 1
+            woken = self._dispatch()
+        _wake_all(woken)
+
+    @contextmanager
+    def slot(
+        self, priority: Priority = "interactive", *, tenant: Optional[str] = None
+    ) -> Iterator[None]:
+        """占用一个名额的上下文管理器（见 acquire）。"""
+        self.acquire(priority, tenant=tenant)
+        try:
+            yield
+        finally:
+            self.release()
+
+    @asynccontextmanager
+    async def slot_async(
+        self, priority: Priority = "interactive", *, tenant: Optional[str] = None
+    ) -> AsyncIterator[None]:
+        """slot 的 asyncio 版本。"""
+        await self.acquire_async(priority, tenant=tenant)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def _enqueue(self, waiter: _Waiter, tenant: Optional[str]) -> None:
+        """内部方法：计算起始标签并入队（调用方持有锁）。"""
+        priority = waiter.priority
+        if priority not in self._queues:
+            raise ValueError(f"不支持的优先级: {priority}")
+        weight = self.tenant_weights.get(tenant, self.default_weight)
+        flow = (priority, tenant)
+        start = max(self._virtual_time[priority], self._finish_tags.get(flow, 0.0))
+        self._finish_tags[flow] = start + 1.0 / weight
+        heapq.heappush(self._queues[priority], (start, next(self._seq), waiter))
+        self._waiting[priority] += 1
+
+    def _dispatch(self) -> List[_Waiter]:
+        """
+        内部方法：按优先级分配空闲名额（调用方持有锁），返回需在锁外唤醒的异步等待者。
+
+        绑定限制器时名额数随其上限变化；限制器只在请求结束时调整上限，随后的 release 会重新分配。
+        名额收缩到不足预留数时，bulk 仍保留 1 个名额，避免批量任务饿死。
+        """
+        woken: List[_Waiter] = []
+        granted = False
+        capacity = self.capacity
+        bulk_capacity = capacity - min(self.reserved_interactive, capacity - 1)
+        while self._in_flight < capacity:
+            waiter = self._pop("interactive")
+            if waiter is None and self._in_flight < bulk_capacity:
+                waiter = self._pop("bulk")
+            if waiter is None:
+                break
+            waiter.granted = True
+            self._in_flight += 1
+            granted = True
+            if waiter.future is not None:
+                woken.append(waiter)
+        if granted:
+            self._cond.notify_all()
+        return woken
+
+    def _pop(self, priority: str) -> Optional[_Waiter]:
+        """内部方法：取出该优先级起始标签最小的请求，并推进虚拟时间（调用方持有锁）。"""
+        queue = self._queues[priority]
+        while queue:
+            start, _, waiter = heapq.heappop(queue)
+            if waiter.cancelled:
+                continue
+            self._waiting[priority] -= 1
+            self._virtual_time[priority] = start
+            return waiter
+        return None
+
+
+def _wake_all(waiters: List[_Waiter]) -> None:
+    for waiter in waiters:
+        waiter.loop.call_soon_threadsafe(_wake, waiter.future)
+
+
+def _wake(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
@@ -0,0 +1,132 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Generic, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+    """一次在途调用的状态（线程版）。"""
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.value: Optional[T] = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    单飞去重（线程版）：相同 key 的并发调用只执行一次，其余调用等待并共享结果。
+
+    - 首个调用者（leader）执行函数；执行期间到达的相同 key 调用直接等待 leader 的结果。
+    - leader 抛出的异常同样传递给所有等待者。
+    - 调用结束后 key 立即释放，之后的调用会重新执行（结果复用交给缓存层）。
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+
+    def do(self, key: str, fn: Callable[[], T]) -> Tuple[T, bool]:
+        """
+        执行或加入 key 对应的在途调用。
+
+        参数：
+        - key (str): 去重键。
+        - fn (Callable[[], T]): 实际执行的函数。
+
+        返回：
+        - Tuple[T, bool]: 结果，以及是否为共享结果（True 表示未实际执行 fn）。
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value, True
+
+        try:
+            call.value = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.value, False
+
+    def in_flight(self) -> int:
+        """当前在途的不同 key 数量。"""
+        with self._lock:
+            return len(self._calls)
+
+
+class _AsyncCall:
+    """一次在途调用的状态（asyncio 版）：共享任务与仍在等待的调用者数量。"""
+
+    def __init__(self, task: "asyncio.Future[Any]") -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class AsyncSingleFlight:
+    """
+    单飞去重（asyncio 版）：相同 key 的并发协程只执行一次，其余协程等待并共享结果。
+
+    - 函数在独立的任务中执行，所有调用者（含 leader）通过 asyncio.shield 等待该任务，
+      任一调用者被取消（如 asyncio.wait_for 超时）都不会影响其它调用者。
+    - 所有调用者都被取消后，共享任务随之取消。
+    - 需在同一事件循环内使用。
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[str, _AsyncCall] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> Tuple[T, bool]:
+        """
+        执行或加入 key 对应的在途调用。
+
+        参数：
+        - key (str): 去重键。
+        - fn (Callable[[], Awaitable[T]]): 返回协程的函数。
+
+        返回：
+        - Tuple[T, bool]: 结果，以及是否为共享结果。
+        """
+        call = self._calls.get(key)
+        leader = call is None or call.task.done()
+        if leader:
+            call = _AsyncCall(asyncio.ensure_future(fn()))
+            self._calls[key] = call
+            # 先于等待者的回调注册：任务结束后立即释放 key
+            call.task.add_done_callback(lambda _: self._release(key, call))
+            # 标记异常已被读取，避免无等待者时输出 "exception was never retrieved"
+            call.task.add_done_callback(_consume_exception)
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task), not leader
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                call.task.cancel()
+
+    def _release(self, key: str, call: _AsyncCall) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+
+    def in_flight(self) -> int:
+        """当前在途的不同 key 数量。"""
+        return len(self._calls)
+
+
+def _consume_exception(future: "asyncio.Future[Any]") -> None:
+    if not future.cancelled():
+        future.exception()
@@ -0,0 +1,42 @@
+"""
+本地追踪模块。
+
+`Tracer` 为加载器、提示词构建器与审核管理器的各个阶段创建带父子关系的 span
+（属性含 batch_id、text_id、item_id、model 等），结束时交给导出器：
+`JsonlSpanExporter` 写入 JSONL 文件，`MemorySpanExporter` 保存在内存中。
+`analyze_spans` / `format_breakdown` 汇总各阶段耗时，也可直接运行
+`python -m ai_content_audit.tracing trace.jsonl` 打印耗时分解。无需外部采集服务。
+"""
+
+from ai_content_audit.tracing.tracer import (
+    NOOP_SPAN,
+    Span,
+    Tracer,
+    current_span,
+    get_tracer,
+    set_tracer,
+    traced,
+)
+from ai_content_audit.tracing.exporters import JsonlSpanExporter, MemorySpanExporter
+from ai_content_audit.tracing.analyzer import (
+    StageStats,
+    analyze_spans,
+    format_breakdown,
+    load_spans,
+)
+
+__all__ = [
+    "JsonlSpanExporter",
+    "MemorySpanExporter",
+    "NOOP_SPAN",
+    "Span",
+    "StageStats",
+    "Tracer",
+    "analyze_spans",
+    "current_span",
+    "format_breakdown",
+    "get_tracer",
+    "load_spans",
+    "set_tracer",
+    "traced",
+]
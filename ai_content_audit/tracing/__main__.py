@@ -0,0 +1,21 @@
+import argparse
+from ai_content_audit.tracing.analyzer import (
+    analyze_spans,
+    format_breakdown,
+    load_spans,
+)
+
+
+def main() -> None:
+    """命令行入口：打印 span 文件的各阶段耗时分解。"""
+    parser = argparse.ArgumentParser(
+        prog="python -m ai_content_audit.tracing",
+        description="打印 JsonlSpanExporter 输出文件的各阶段耗时分解",
+    )
+    parser.add_argument("path", help="span JSONL 文件路径")
+    args = parser.parse_args()
+    print(format_breakdown(analyze_spans(load_spans(args.path))))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+import json
+import math
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Union
+from pydantic import BaseModel, Field
+
+
+class StageStats(BaseModel):
+    """某一阶段（同名 span）的耗时统计，单位为秒。"""
+
+    name: str = Field(..., description="阶段（span）名称")
+    count: int = Field(0, description="span 数")
+    errors: int = Field(0, description="状态为 error 的 span 数")
+    total: float = Field(0.0, description="累计耗时（含子 span）")
+    self_total: float = Field(
+        0.0, description="累计自身耗时（扣除直接子 span 的耗时，不小于 0）"
+    )
+    mean: float = Field(0.0, description="平均耗时")
+    p50: float = Field(0.0, description="耗时中位数")
+    p95: float = Field(0.0, description="耗时 p95")
+    max: float = Field(0.0, description="最大耗时")
+
+
+def load_spans(path: Union[str, Path]) -> List[Dict[str, Any]]:
+    """
+    读取 JsonlSpanExporter 写出的 span 文件，忽略不完整的行。
+
+    参数：
+    - path (Union[str, Path]): span 文件路径。
+
+    返回：
+    - List[Dict[str, Any]]: span 字典列表。
+    """
+    spans: List[Dict[str, Any]] = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                spans.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return spans
+
+
+def analyze_spans(spans: Iterable[Dict[str, Any]]) -> List[StageStats]:
+    """
+    按 span 名称汇总耗时，自身耗时 = 耗时 - 直接子 span 耗时之和（并行的子 span 可能使其为 0）。
+
+    参数：
+    - spans (Iterable[Dict[str, Any]]): span 字典（load_spans 或 MemorySpanExporter.spans）。
+
+    返回：
+    - List[StageStats]: 各阶段统计，按自身耗时降序排列。
+    """
+    spans = [s for s in spans if s.get("duration") is not None]
+    children: Dict[str, float] = defaultdict(float)
+    for span in spans:
+        if span.get("parent_id"):
+            children[span["parent_id"]] += span["duration"]
+
+    durations: Dict[str, List[float]] = defaultdict(list)
+    self_totals: Dict[str, float] = defaultdict(float)
+    errors: Dict[str, int] = defaultdict(int)
+    for span in spans:
+        name = span["name"]
+        durations[name].append(span["duration"])
+        self_totals[name] += max(span["duration"] - children[span["span_id"]], 0.0)
+        errors[name] += span.get("status") == "error"
+
+    stats = []
+    for name, values in durations.items():
+        values.sort()
+        stats.append(
+            StageStats(
+                name=name,
+                count=len(values),
+                errors=errors[name],
+                total=sum(values),
+                self_total=self_totals[name],
+                mean=sum(values) / len(values),
+                p50=_percentile(values, 50),
+                p95=_percentile(values, 95),
+                max=values[-1],
+            )
+        )
+    stats.sort(key=lambda s: s.self_total, reverse=True)
+    return stats
+
+
+def format_breakdown(stats: List[StageStats]) -> str:
+    """
+    将阶段统计格式化为文本表格（耗时单位毫秒，占比为自身耗时占全部自身耗时的比例）。
+
+    参数：
+    - stats (List[StageStats]): analyze_spans 的结果。
+
+    返回：
+    - str: 表格文本。
+    """
+    grand = sum(s.self_total for s in stats) or 1.0
+    header = (
+        f"{'stage':<24}{'count':>8}{'errors':>8}{'self%':>8}"
+        f"{'self_ms':>12}{'mean_ms':>10}{'p50_ms':>10}{'p95_ms':>10}{'max_ms':>10}"
+    )
+    lines = [header, "-" * len(header)]
+    for s in stats:
+        lines.append(
+            f"{s.name:<24}{s.count:>8}{s.errors:>8}{s.self_total / grand:>8.1%}"
+            f"{s.self_total * 1000:>12.1f}{s.mean * 1000:>10.1f}"
+            f"{s.p50 * 1000:>10.1f}{s.p95 * 1000:>10.1f}{s.max * 1000:>10.1f}"
+        )
+    return "\n".join(lines)
+
+
+def _percentile(ordered: List[float], percentile: float) -> float:
+    rank = max(math.ceil(percentile / 100 * len(ordered)) - 1, 0)
+    return ordered[rank]
@@ -0,0 +1,66 @@
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+from ai_content_audit.tracing.tracer import Span
+
+
+class JsonlSpanExporter:
+    """
+    JSONL span 导出器：每个结束的 span 追加写入一行 JSON（见 Span.to_dict）。
+
+    - 每行写入后 flush，读取时（load_spans）忽略不完整的行。
+    - 线程安全。
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """
+        参数：
+        - path (Union[str, Path]): 输出文件路径，不存在时自动创建，已存在时追加。
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def export(self, span: Span) -> None:
+        """写入一个 span。"""
+        line = json.dumps(span.to_dict(), ensure_ascii=False)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        """关闭输出文件。"""
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self) -> "JsonlSpanExporter":
+        return self
+
+    def __exit__(self, *exc_info: Optional[object]) -> None:
+        self.close()
+
+
+class MemorySpanExporter:
+    """内存 span 导出器：保存 span 字典，便于在进程内直接分析（见 analyze_spans）。线程安全。"""
+
+    def __init__(self) -> None:
+        self._spans: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        """保存一个 span。"""
+        record = span.to_dict()
+        with self._lock:
+            self._spans.append(record)
+
+    @property
+    def spans(self) -> List[Dict[str, Any]]:
+        """已导出的 span 字典（副本）。"""
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self) -> None:
+        """清空已保存的 span。"""
+        with self._lock:
+            self._spans.clear()
@@ -0,0 +1,229 @@
+import contextvars
+import functools
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, TypeVar
+from uuid import uuid4
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# 当前线程 / 协程中处于活动状态的 span
+_CURRENT_SPAN: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar(
+    "ai_content_audit_current_span", default=None
+)
+
+
+class Span:
+    """
+    一段被追踪的操作：名称、起止时间、父子关系与属性。
+
+    同一次审核的 span 共用 trace_id，parent_id 指向父 span；
+    attributes 记录 batch_id、text_id、item_id、model 等上下文。
+    """
+
+    __slots__ = (
+        "tracer",
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "start_time",
+        "duration",
+        "attributes",
+        "status",
+        "error",
+        "_started",
+    )
+
+    def __init__(
+        self,
+        tracer: Optional["Tracer"],
+        name: str,
+        *,
+        parent: Optional["Span"] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.tracer = tracer
+        self.name = name
+        self.trace_id = parent.trace_id if parent is not None else uuid4().hex
+        self.span_id = uuid4().hex[:16]
+        self.parent_id = parent.span_id if parent is not None else None
+        self.start_time = time.time()
+        self.duration: Optional[float] = None
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.status = "ok"
+        self.error: Optional[str] = None
+        self._started = time.perf_counter()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """设置属性。"""
+        self.attributes[key] = value
+
+    def record_error(self, error: BaseException) -> None:
+        """记录异常，span 状态置为 error。"""
+        self.status = "error"
+        self.error = f"{type(error).__name__}: {error}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为可 JSON 序列化的字典（属性值非基础类型时转为字符串）。"""
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_time": self.start_time,
+            "duration": self.duration,
+            "status": self.status,
+            "error": self.error,
+            "attributes": {k: _jsonable(v) for k, v in self.attributes.items()},
+        }
+
+
+class _NoopSpan:
+    """未启用追踪时使用的空 span，所有操作均为空操作。"""
+
+    name = ""
+    trace_id = ""
+    span_id = ""
+    parent_id = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def record_error(self, error: BaseException) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Tracer:
+    """
+    本地追踪器：创建 span 并在结束时交给导出器（如 JsonlSpanExporter），无需外部采集服务。
+
+    - span() 为上下文管理器，进入时成为当前 span，其内创建的 span 自动成为子 span；
+      跨线程时通过 parent= 显式指定父 span。
+    - 未配置导出器时不记录任何 span，开销可忽略。
+    - 通过 set_tracer 设置为全局追踪器后，加载器、提示词构建器与审核管理器均使用它。
+    """
+
+    def __init__(self, exporter: Optional[Any] = None) -> None:
+        """
+        参数：
+        - exporter (Optional[Any]): span 导出器，需提供 export(span) 方法；None 表示不记录。
+        """
+        self.exporter = exporter
+
+    @property
+    def enabled(self) -> bool:
+        """是否记录 span。"""
+        return self.exporter is not None
+
+    def start_span(
+        self, name: str, *, parent: Optional[Span] = None, **attributes: Any
+    ) -> Any:
+        """
+        创建 span 但不设为当前 span（用于生成器等无法使用上下文管理器的场景），需调用 end_span 结束。
+
+        参数：
+        - name (str): span 名称。
+        - parent (Optional[Span]): 父 span，默认取当前 span。
+        - **attributes: span 属性。
+
+        返回：
+        - Span: 新建的 span；未启用时返回空 span。
+        """
+        if not self.enabled:
+            return NOOP_SPAN
+        if parent is None or parent is NOOP_SPAN:
+            parent = _CURRENT_SPAN.get()
+        return Span(self, name, parent=parent, attributes=attributes)
+
+    def end_span(self, span: Any, error: Optional[BaseException] = None) -> None:
+        """结束 span 并导出；error 不为空时记录异常。"""
+        if not isinstance(span, Span):
+            return
+        span.duration = time.perf_counter() - span._started
+        if error is not None:
+            span.record_error(error)
+        self.exporter.export(span)
+
+    @contextmanager
+    def span(
+        self, name: str, *, parent: Optional[Span] = None, **attributes: Any
+    ) -> Iterator[Any]:
+        """
+        追踪代码块：创建 span 并设为当前 span，退出时结束并导出，异常会被记录后继续抛出。
+
+        参数：
+        - name (str): span 名称。
+        - parent (Optional[Span]): 父 span，默认取当前 span。
+        - **attributes: span 属性。
+        """
+        if not self.enabled:
+            yield NOOP_SPAN
+            return
+        span = self.start_span(name, parent=parent, **attributes)
+        token = _CURRENT_SPAN.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            _CURRENT_SPAN.reset(token)
+            self.end_span(span, e)
+            raise
+        _CURRENT_SPAN.reset(token)
+        self.end_span(span)
+
+
+_global_tracer = Tracer()
+
+
+def set_tracer(tracer: Tracer) -> None:
+    """设置全局追踪器。"""
+    global _global_tracer
+    _global_tracer = tracer
+
+
+def get_tracer() -> Tracer:
+    """
+    获取当前追踪器：处于某个 span 内时返回创建该 span 的追踪器，否则返回全局追踪器。
+
+    因此审核管理器使用自己的 tracer 时，其调用的提示词构建器也记录到同一追踪器。
+    """
+    span = _CURRENT_SPAN.get()
+    if span is not None and span.tracer is not None:
+        return span.tracer
+    return _global_tracer
+
+
+def traced(name: str, **attributes: Any) -> Callable[[F], F]:
+    """
+    装饰器：调用时以 get_tracer() 追踪整个函数调用。
+
+    参数：
+    - name (str): span 名称。
+    - **attributes: 固定的 span 属性。
+    """
+
+    def decorator(fn: F) -> F:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with get_tracer().span(name, **attributes):
+                return fn(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def current_span() -> Optional[Span]:
+    """当前活动的 span，不存在时返回 None。"""
+    return _CURRENT_SPAN.get()
+
+
+def _jsonable(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    return str(value)
@@ -0,0 +1,13 @@
+"""
+性能基准。
+
+- fake_server：进程内的 OpenAI 兼容 HTTP 服务替身，可配置延迟分布、响应内容与故障注入。
+- throughput：各执行模式（顺序、多线程、异步、打包、缓存）的吞吐基准，
+  运行 `python -m benchmarks.throughput --output report.json` 输出 JSON 报告，
+  `--baseline old.json` 与历史报告对比。
+- chaos：故障注入压测，按比例注入 429（Retry-After）、5xx、连接重置、slow-loris 与
+  非法结构化输出，运行 `python -m benchmarks.chaos --rate-limit 0.1 --max-attempts 3`
+  报告有效吞吐、兜底率、浪费的请求与延迟。
+- micro：客户端热路径（提示词构建、结构化输出描述、Pydantic 校验、媒体加载）的
+  timeit 微基准，并用 tracemalloc 统计内存分配，运行 `python -m benchmarks.micro`。
+"""
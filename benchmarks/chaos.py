@@ -0,0 +1,238 @@
+import argparse
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
+from openai import OpenAI
+from pydantic import BaseModel, Field
+from ai_content_audit import AuditManager
+from ai_content_audit.runtime import AdaptiveConcurrencyLimiter, RetryPolicy
+from ai_content_audit.tracing import MemorySpanExporter, Tracer
+from benchmarks.fake_server import FakeOpenAIServer, FaultProfile, parse_latency
+from benchmarks.throughput import _percentile, make_dataset
+
+
+class ChaosReport(BaseModel):
+    """故障注入压测结果，耗时单位为秒。"""
+
+    config: Dict[str, Any] = Field(default_factory=dict, description="压测参数")
+    audits: int = Field(0, description="审核结果数（文本数 × 审核项数）")
+    success: int = Field(0, description="成功结果数")
+    failed: int = Field(0, description="兜底（failed）结果数")
+    fallback_rate: float = Field(0.0, description="兜底结果占比")
+    http_requests: int = Field(0, description="服务端收到的请求数")
+    attempts: int = Field(0, description="客户端记录的模型调用尝试次数之和")
+    wasted_calls: int = Field(
+        0, description="未产出成功结果的请求数（http_requests - success）"
+    )
+    injected: Dict[str, int] = Field(
+        default_factory=dict, description="服务端各类故障（含 ok）的注入次数"
+    )
+    wall_time: float = Field(0.0, description="总耗时")
+    goodput: float = Field(0.0, description="每秒成功结果数")
+    latency_p50: float = Field(
+        0.0, description="单条审核端到端耗时中位数（含重试等待）"
+    )
+    latency_p95: float = Field(0.0, description="单条审核端到端耗时 p95")
+    latency_p99: float = Field(0.0, description="单条审核端到端耗时 p99")
+    latency_max: float = Field(0.0, description="单条审核端到端最大耗时")
+
+
+def run_chaos(
+    faults: FaultProfile,
+    *,
+    texts: int = 100,
+    items: int = 2,
+    latency: str = "lognormal:0.02,0.5",
+    concurrency: int = 8,
+    max_attempts: int = 3,
+    base_delay: float = 0.1,
+    max_delay: float = 2.0,
+    max_retry_after: float = 60.0,
+    timeout: float = 10.0,
+    adaptive: Optional[int] = None,
+) -> ChaosReport:
+    """
+    在注入故障的服务替身上以 AuditManager.audit_batch 并发审核，统计有效吞吐（goodput）、
+    兜底率、浪费的请求与端到端延迟（audit.unit span），用于离线调整重试与并发参数。
+
+    OpenAI 客户端的内置重试关闭（max_retries=0），重试完全由 RetryPolicy 控制；
+    timeout 为客户端的连接/读写超时（按单次读写计），不限制 slow-loris 响应的总时长。
+
+    参数：
+    - faults (FaultProfile): 故障注入配置。
+    - texts (int): 文本数，默认 100。
+    - items (int): 审核项数，默认 2。
+    - latency (str): 正常响应的延迟分布（见 parse_latency），默认 "lognormal:0.02,0.5"。
+    - concurrency (int): audit_batch 并发数，默认 8。
+    - max_attempts (int): RetryPolicy 最大尝试次数，默认 3。
+    - base_delay (float): RetryPolicy 基础退避秒数，默认 0.1。
+    - max_delay (float): RetryPolicy 单次退避上限秒数，默认 2。
+    - max_retry_after (float): RetryPolicy 遵循 Retry-After 的上限秒数，默认 60。
+    - timeout (float): OpenAI 客户端超时秒数，默认 10。
+    - adaptive (Optional[int]): 启用 AdaptiveConcurrencyLimiter 时的初始并发上限，默认不启用。
+
+    返回：
+    - ChaosReport: 压测结果。
+    """
+    config = {
+        "faults": faults.model_dump(),
+        "texts": texts,
+        "items": items,
+        "latency": latency,
+        "concurrency": concurrency,
+        "max_attempts": max_attempts,
+        "base_delay": base_delay,
+        "max_delay": max_delay,
+        "max_retry_after": max_retry_after,
+        "timeout": timeout,
+        "adaptive": adaptive,
+    }
+    contents, audit_items = make_dataset(texts, items)
+
+    with FakeOpenAIServer(
+        latency=parse_latency(latency, seed=faults.seed), faults=faults
+    ) as server:
+        client = OpenAI(
+            base_url=server.base_url,
+            api_key="chaos",
+            max_retries=0,
+            timeout=timeout,
+        )
+        exporter = MemorySpanExporter()
+        manager = AuditManager(
+            client=client,
+            model="fake-model",
+            max_concurrency=concurrency,
+            retry_policy=RetryPolicy(
+                max_attempts,
+                base_delay=base_delay,
+                max_delay=max_delay,
+                max_retry_after=max_retry_after,
+            ),
+            concurrency_limiter=(
+                AdaptiveConcurrencyLimiter(adaptive, max_limit=concurrency)
+                if adaptive is not None
+                else None
+            ),
+            tracer=Tracer(exporter),
+        )
+
+        started = time.perf_counter()
+        results = manager.audit_batch(contents, audit_items)
+        wall = time.perf_counter() - started
+        requests, injected = server.requests, server.injected
+
+    # 每个 audit.unit span 覆盖一条审核从开始到得出结论（含重试与退避等待）的全过程
+    latencies = sorted(
+        span["duration"] for span in exporter.spans if span["name"] == "audit.unit"
+    )
+    success = sum(r.status == "success" for r in results)
+    return ChaosReport(
+        config=config,
+        audits=len(results),
+        success=success,
+        failed=len(results) - success,
+        fallback_rate=(len(results) - success) / len(results) if results else 0.0,
+        http_requests=requests,
+        attempts=sum(r.attempts for r in results),
+        wasted_calls=max(requests - success, 0),
+        injected=injected,
+        wall_time=wall,
+        goodput=success / wall if wall > 0 else 0.0,
+        latency_p50=_percentile(latencies, 50),
+        latency_p95=_percentile(latencies, 95),
+        latency_p99=_percentile(latencies, 99),
+        latency_max=latencies[-1] if latencies else 0.0,
+    )
+
+
+def format_chaos_report(report: ChaosReport) -> str:
+    """将压测结果格式化为文本（耗时单位毫秒）。"""
+    injected = ", ".join(f"{k}={v}" for k, v in report.injected.items() if v)
+    return "\n".join(
+        [
+            f"audits        {report.audits} (success {report.success}, "
+            f"failed {report.failed}, fallback {report.fallback_rate:.1%})",
+            f"requests      {report.http_requests} (attempts {report.attempts}, "
+            f"wasted {report.wasted_calls})",
+            f"injected      {injected}",
+            f"goodput       {report.goodput:.1f} audits/s "
+            f"in {report.wall_time:.2f}s",
+            f"latency_ms    p50 {report.latency_p50 * 1000:.1f}  "
+            f"p95 {report.latency_p95 * 1000:.1f}  "
+            f"p99 {report.latency_p99 * 1000:.1f}  "
+            f"max {report.latency_max * 1000:.1f}",
+        ]
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """命令行入口：运行故障注入压测，打印结果并可写入 JSON 报告。"""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.chaos",
+        description="在注入 429、5xx、连接重置、slow-loris 与非法输出的服务替身上压测 AuditManager",
+    )
+    parser.add_argument("--texts", type=int, default=100, help="文本数")
+    parser.add_argument("--items", type=int, default=2, help="审核项数")
+    parser.add_argument(
+        "--latency", default="lognormal:0.02,0.5", help="正常响应的延迟分布"
+    )
+    parser.add_argument("--rate-limit", type=float, default=0.1, help="429 比例")
+    parser.add_argument(
+        "--retry-after",
+        type=float,
+        default=0.2,
+        help="429 的 Retry-After 秒数，负数表示不带",
+    )
+    parser.add_argument("--server-error", type=float, default=0.05, help="503 比例")
+    parser.add_argument("--reset", type=float, default=0.02, help="连接重置比例")
+    parser.add_argument("--slow", type=float, default=0.02, help="slow-loris 比例")
+    parser.add_argument(
+        "--slow-seconds", type=float, default=2.0, help="slow-loris 秒数"
+    )
+    parser.add_argument("--malformed", type=float, default=0.02, help="非法输出比例")
+    parser.add_argument("--seed", type=int, default=0, help="随机种子")
+    parser.add_argument("--concurrency", type=int, default=8, help="并发数")
+    parser.add_argument("--max-attempts", type=int, default=3, help="最大尝试次数")
+    parser.add_argument("--base-delay", type=float, default=0.1, help="基础退避秒数")
+    parser.add_argument("--max-delay", type=float, default=2.0, help="单次退避上限秒数")
+    parser.add_argument(
+        "--max-retry-after", type=float, default=60.0, help="Retry-After 上限秒数"
+    )
+    parser.add_argument("--timeout", type=float, default=10.0, help="客户端超时秒数")
+    parser.add_argument(
+        "--adaptive", type=int, help="启用自适应并发限制器并指定初始并发上限"
+    )
+    parser.add_argument("--output", help="JSON 报告输出路径")
+    args = parser.parse_args(argv)
+
+    faults = FaultProfile(
+        rate_limit=args.rate_limit,
+        retry_after=args.retry_after if args.retry_after >= 0 else None,
+        server_error=args.server_error,
+        reset=args.reset,
+        slow=args.slow,
+        slow_seconds=args.slow_seconds,
+        malformed=args.malformed,
+        seed=args.seed,
+    )
+    report = run_chaos(
+        faults,
+        texts=args.texts,
+        items=args.items,
+        latency=args.latency,
+        concurrency=args.concurrency,
+        max_attempts=args.max_attempts,
+        base_delay=args.base_delay,
+        max_delay=args.max_delay,
+        max_retry_after=args.max_retry_after,
+        timeout=args.timeout,
+        adaptive=args.adaptive,
+    )
+    if args.output:
+        Path(args.output).write_text(report.model_dump_json(indent=2), encoding="utf-8")
+    print(format_chaos_report(report))
+
+
+if __name__ == "__main__":
+    main()
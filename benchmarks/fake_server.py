@@ -0,0 +1,403 @@
+import json
+import math
+import random
+import re
+import socket
+import struct
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Union
+from pydantic import BaseModel, Field, model_validator
+
+# 延迟分布：每次调用返回一次请求的模拟延迟（秒）
+Latency = Callable[[], float]
+# 响应生成器：根据请求体返回 message.content（字典会被序列化为 JSON 字符串）
+Responder = Callable[[Dict[str, Any]], Union[str, Dict[str, Any]]]
+
+_OPTIONS_RE = re.compile(r"可选项（标签：含义）：\n((?:- [^\n]*\n?)+)")
+_PACKED_RE = re.compile(r"以下共 (\d+) 条待审核文本")
+_ITEM_FIELD_RE = re.compile(r"item_(\d+)$")
+
+# 注入故障的种类（ok 表示正常响应）
+FAULTS = ("ok", "rate_limit", "server_error", "reset", "slow", "malformed")
+
+
+def constant(seconds: float) -> Latency:
+    """固定延迟。"""
+    return lambda: seconds
+
+
+def uniform(low: float, high: float, *, seed: Optional[int] = None) -> Latency:
+    """[low, high] 内均匀分布的延迟。"""
+    rng = random.Random(seed)
+    return lambda: rng.uniform(low, high)
+
+
+def lognormal(median: float, sigma: float, *, seed: Optional[int] = None) -> Latency:
+    """对数正态分布的延迟（长尾），median 为中位数，sigma 越大尾部越长。"""
+    if median <= 0:
+        return constant(0.0)
+    rng = random.Random(seed)
+    mu = math.log(median)
+    return lambda: rng.lognormvariate(mu, sigma)
+
+
+def parse_latency(spec: str, *, seed: Optional[int] = None) -> Latency:
+    """
+    解析延迟分布描述。
+
+    参数：
+    - spec (str): "constant:0.05"、"uniform:0.02,0.08" 或 "lognormal:0.05,0.5"；
+      仅写数字时视为固定延迟。
+    - seed (Optional[int]): 随机种子。
+
+    返回：
+    - Latency: 延迟分布。
+    """
+    kind, _, args = spec.partition(":")
+    if not args:
+        return constant(float(kind))
+    values = [float(v) for v in args.split(",")]
+    if kind == "constant" and len(values) == 1:
+        return constant(values[0])
+    if kind == "uniform" and len(values) == 2:
+        return uniform(*values, seed=seed)
+    if kind == "lognormal" and len(values) == 2:
+        return lognormal(*values, seed=seed)
+    raise ValueError(f"无法解析的延迟分布: {spec}")
+
+
+def _user_text(body: Dict[str, Any]) -> str:
+    parts: List[str] = []
+    for message in body.get("messages", []):
+        content = message.get("content")
+        if isinstance(content, str):
+            parts.append(content)
+        elif isinstance(content, list):
+            parts.extend(p.get("text", "") for p in content if isinstance(p, dict))
+    return "\n".join(parts)
+
+
+def schema_responder(reason_length: int = 20) -> Responder:
+    """
+    按请求的 response_format（JSON Schema）生成合法的结构化输出。
+
+    choice 取提示词中对应审核项的第一个选项标签，reason 为 reason_length 个字符的理由，
+    打包请求的 decisions 按提示词中的文本条数逐条生成，index 从 1 开始。
+
+    参数：
+    - reason_length (int): reason 字段的长度，用于模拟不同大小的响应体。
+    """
+    reason = ("模拟理由" * (reason_length // 4 + 1))[:reason_length]
+
+    def respond(body: Dict[str, Any]) -> Dict[str, Any]:
+        text = _user_text(body)
+        choices = [
+            block.split("\n")[0][2:].split("：")[0]
+            for block in _OPTIONS_RE.findall(text)
+        ] or ["无"]
+        packed = _PACKED_RE.search(text)
+        count = int(packed.group(1)) if packed else 1
+        schema = body.get("response_format", {}).get("json_schema", {}).get("schema")
+        if not schema:
+            return {"choice": choices[0], "reason": reason}
+        defs = schema.get("$defs", {})
+
+        def build(node: Dict[str, Any], key: str, index: int, choice: str) -> Any:
+            if "$ref" in node:
+                return build(defs[node["$ref"].split("/")[-1]], key, index, choice)
+            if "anyOf" in node:
+                return build(node["anyOf"][0], key, index, choice)
+            kind = node.get("type")
+            if kind == "object":
+                value = {}
+                for name, prop in node.get("properties", {}).items():
+                    match = _ITEM_FIELD_RE.match(name)
+                    item_choice = (
+                        choices[min(int(match.group(1)), len(choices)) - 1]
+                        if match
+                        else choice
+                    )
+                    value[name] = build(prop, name, index, item_choice)
+                return value
+            if kind == "array":
+                return [
+                    build(node.get("items", {}), key, i, choice)
+                    for i in range(1, count + 1)
+                ]
+            if kind == "integer":
+                return index
+            if kind == "number":
+                return float(index)
+            if kind == "boolean":
+                return False
+            return choice if key == "choice" else reason
+
+        return build(schema, "", 1, choices[0])
+
+    return respond
+
+
+class FaultProfile(BaseModel):
+    """
+    故障注入配置：每个请求按比例随机注入一种故障，其余请求正常响应。
+
+    - rate_limit：429，带 Retry-After 头。
+    - server_error：503。
+    - reset：不返回响应，直接以 RST 断开连接。
+    - slow：slow-loris 响应，响应体在 slow_seconds 内逐段缓慢写出。
+    - malformed：200，但 content 为不完整的 JSON（结构化输出校验失败）。
+    """
+
+    rate_limit: float = Field(0.0, ge=0, le=1, description="429 的比例")
+    retry_after: Optional[float] = Field(
+        1.0, ge=0, description="429 响应的 Retry-After 秒数，None 表示不带该头"
+    )
+    server_error: float = Field(0.0, ge=0, le=1, description="503 的比例")
+    reset: float = Field(0.0, ge=0, le=1, description="连接重置的比例")
+    slow: float = Field(0.0, ge=0, le=1, description="slow-loris 响应的比例")
+    slow_seconds: float = Field(2.0, ge=0, description="slow-loris 响应写完的总秒数")
+    malformed: float = Field(0.0, ge=0, le=1, description="非法结构化输出的比例")
+    seed: Optional[int] = Field(None, description="随机种子")
+
+    @model_validator(mode="after")
+    def _check_total(self) -> "FaultProfile":
+        """各故障比例之和不能超过 1"""
+        if sum(getattr(self, fault) for fault in FAULTS[1:]) > 1:
+            raise ValueError("各故障比例之和不能超过 1")
+        return self
+
+
+class FakeOpenAIServer:
+    """
+    进程内的 OpenAI 兼容 HTTP 服务替身：响应 POST .../chat/completions。
+
+    - 每个请求先按 latency 分布休眠，再返回 responder 生成的结构化输出，
+      usage 按字符数估算（约 2 字符 1 token）。
+    - 配置 faults 时按比例注入 429、503、连接重置、slow-loris 与非法结构化输出，
+      injected 记录各类故障的注入次数（限流、5xx 与连接重置不休眠，立即返回）。
+    - 多线程处理请求，统计请求数与处理请求消耗的 CPU 时间（不含休眠），
+      便于从进程 CPU 时间中扣除服务端开销。
+    - 支持上下文管理器：进入时启动，退出时关闭。
+    """
+
+    def __init__(
+        self,
+        *,
+        latency: Optional[Latency] = None,
+        responder: Optional[Responder] = None,
+        faults: Optional[FaultProfile] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        """
+        参数：
+        - latency (Optional[Latency]): 延迟分布，默认无延迟。
+        - responder (Optional[Responder]): 响应生成器，默认 schema_responder()。
+        - faults (Optional[FaultProfile]): 故障注入配置，默认不注入。
+        - host (str): 监听地址，默认 127.0.0.1。
+        - port (int): 监听端口，默认 0（随机空闲端口）。
+        """
+        self.latency = latency or constant(0.0)
+        self.responder = responder or schema_responder()
+        self.faults = faults
+        self._rng = random.Random(faults.seed if faults is not None else None)
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._cpu_time = 0.0
+        self._injected: Dict[str, int] = dict.fromkeys(FAULTS, 0)
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """OpenAI 客户端使用的 base_url，如 http://127.0.0.1:12345/v1。"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    @property
+    def requests(self) -> int:
+        """已处理的请求数。"""
+        with self._lock:
+            return self._requests
+
+    @property
+    def cpu_time(self) -> float:
+        """处理请求累计消耗的 CPU 时间（秒，不含模拟延迟）。"""
+        with self._lock:
+            return self._cpu_time
+
+    @property
+    def injected(self) -> Dict[str, int]:
+        """各类故障（含 ok）的注入次数。"""
+        with self._lock:
+            return dict(self._injected)
+
+    def start(self) -> "FakeOpenAIServer":
+        """在后台线程中启动服务。"""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._httpd.serve_forever, name="fake-openai", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """关闭服务。"""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FakeOpenAIServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Optional[object]) -> None:
+        self.stop()
+
+    def _pick_fault(self) -> str:
+        """按 faults 比例选择本次请求的故障种类，并计数。"""
+        fault = "ok"
+        if self.faults is not None:
+            with self._lock:
+                draw = self._rng.random()
+            for name in FAULTS[1:]:
+                rate = getattr(self.faults, name)
+                if draw < rate:
+                    fault = name
+                    break
+                draw -= rate
+        with self._lock:
+            self._injected[fault] += 1
+        return fault
+
+    def _record(self, cpu: float) -> None:
+        with self._lock:
+            self._requests += 1
+            self._cpu_time += cpu
+
+    def _completion(
+        self, body: Dict[str, Any], *, malformed: bool = False
+    ) -> Dict[str, Any]:
+        """生成 chat.completion 响应体；malformed 时 content 为截断的 JSON。"""
+        content = self.responder(body)
+        if not isinstance(content, str):
+            content = json.dumps(content, ensure_ascii=False)
+        if malformed:
+            content = content[: len(content) // 2]
+        prompt_tokens = max(len(_user_text(body)) // 2, 1)
+        completion_tokens = max(len(content) // 2, 1)
+        return {
+            "id": f"chatcmpl-fake-{time.monotonic_ns()}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "fake"),
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+
+    def _handler_class(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_POST(self) -> None:
+                started = time.thread_time()
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length) or b"{}")
+                if not self.path.rstrip("/").endswith("/chat/completions"):
+                    self.send_json(
+                        404, {"error": {"message": "not found"}}, started=started
+                    )
+                    return
+                fault = server._pick_fault()
+                if fault == "rate_limit":
+                    retry_after = server.faults.retry_after
+                    self.send_json(
+                        429,
+                        {"error": {"message": "rate limited", "type": "rate_limit"}},
+                        started=started,
+                        headers=(
+                            {"Retry-After": f"{retry_after:g}"}
+                            if retry_after is not None
+                            else None
+                        ),
+                    )
+                    return
+                if fault == "server_error":
+                    self.send_json(
+                        503,
+                        {"error": {"message": "overloaded", "type": "server_error"}},
+                        started=started,
+                    )
+                    return
+                if fault == "reset":
+                    # SO_LINGER=0：关闭时发送 RST 而非正常的 FIN
+                    server._record(time.thread_time() - started)
+                    self.connection.setsockopt(
+                        socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0)
+                    )
+                    self.close_connection = True
+                    return
+                cpu = time.thread_time() - started
+                time.sleep(server.latency())
+                payload = server._completion(body, malformed=fault == "malformed")
+                self.send_json(
+                    200,
+                    payload,
+                    started=time.thread_time(),
+                    cpu=cpu,
+                    dribble=server.faults.slow_seconds if fault == "slow" else 0.0,
+                )
+
+            def send_json(
+                self,
+                status: int,
+                payload: Dict[str, Any],
+                *,
+                started: float,
+                cpu: float = 0.0,
+                headers: Optional[Dict[str, str]] = None,
+                dribble: float = 0.0,
+            ) -> None:
+                # 在写出响应前计数，客户端收到响应时统计已包含该请求
+                data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                server._record(cpu + time.thread_time() - started)
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                if dribble <= 0:
+                    self.wfile.write(data)
+                    return
+                # slow-loris：分 10 段在 dribble 秒内写完响应体
+                step = max(len(data) // 10, 1)
+                for i in range(0, len(data), step):
+                    time.sleep(dribble / 10)
+                    try:
+                        self.wfile.write(data[i : i + step])
+                    except OSError:
+                        self.close_connection = True
+                        return
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        return Handler
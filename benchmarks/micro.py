@@ -0,0 +1,326 @@
+import argparse
+import base64
+import gc
+import itertools
+import random
+import statistics
+import struct
+import sys
+import platform
+import tempfile
+import timeit
+import tracemalloc
+import zlib
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+from uuid import uuid4
+import filetype
+from pydantic import BaseModel, Field
+from ai_content_audit.loader.media_loader import MediaLoader
+from ai_content_audit.models import (
+    AuditContent,
+    AuditDecision,
+    AuditOptionsItem,
+    AuditResult,
+    PrefilterRule,
+    create_multi_decision_model,
+)
+from ai_content_audit.prompts.builder import (
+    build_messages,
+    build_multi_item_messages,
+    build_packed_messages,
+)
+from ai_content_audit.prompts.structured_output_prompt import (
+    generate_model_description,
+    structured_output,
+)
+from benchmarks.throughput import _package_version
+
+# 基准用例：名称 -> 被测函数（无参数）
+Case = Callable[[], Any]
+
+
+class MicroResult(BaseModel):
+    """单个微基准用例的结果，耗时单位为秒，内存单位为字节。"""
+
+    name: str = Field(..., description="用例名称")
+    number: int = Field(..., description="每轮调用次数")
+    repeat: int = Field(..., description="轮数")
+    best: float = Field(..., description="各轮中最快的单次调用耗时")
+    median: float = Field(..., description="各轮单次调用耗时的中位数")
+    peak_bytes: int = Field(..., description="单次调用的内存分配峰值（tracemalloc）")
+    retained_bytes: float = Field(
+        ...,
+        description="多次调用后平均每次调用仍未释放的内存（用于发现泄漏或缓存增长）",
+    )
+
+
+class MicroReport(BaseModel):
+    """微基准报告。"""
+
+    created_at: str = Field(..., description="生成时间（UTC，ISO 8601）")
+    version: Optional[str] = Field(None, description="ai-content-audit 版本")
+    python: str = Field(..., description="Python 版本")
+    platform: str = Field(..., description="运行平台")
+    results: List[MicroResult] = Field(default_factory=list, description="各用例结果")
+
+
+def _png(width: int, height: int, *, seed: int = 0) -> bytes:
+    """生成 RGB 噪声 PNG（噪声几乎不可压缩，文件大小接近真实照片）。"""
+    rng = random.Random(seed)
+    raw = b"".join(
+        b"\x00" + rng.randbytes(width * 3) for _ in range(height)
+    )  # 每行前缀 0 表示无滤波
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return (
+            struct.pack(">I", len(data))
+            + kind
+            + data
+            + struct.pack(">I", zlib.crc32(kind + data))
+        )
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(raw, 6))
+        + chunk(b"IEND", b"")
+    )
+
+
+def _prefilter_fixtures(
+    *, keywords: int = 2000, texts: int = 200, seed: int = 0
+) -> Tuple[PrefilterRule, PrefilterRule, Iterator[str]]:
+    """生成预过滤用例的关键词规则、关键词加手机号正则的规则与循环的文本语料。"""
+    rng = random.Random(seed)
+    # 取 3000 个常用区段的汉字，使关键词首字在文本中频繁出现（接近真实中文的密度）
+    alphabet = [chr(0x4E00 + i) for i in range(3000)]
+    words = [
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(2, 4)))
+        for _ in range(keywords)
+    ]
+    corpus = []
+    for i in range(texts):
+        text = "".join(rng.choice(alphabet) for _ in range(100))
+        if i % 10 == 0:
+            text = text[:50] + rng.choice(words) + text[50:]
+        elif i % 10 == 5:
+            text = text[:30] + "13812345678" + text[30:]
+        corpus.append(text)
+    keyword_rule = PrefilterRule(choice="有", keywords=words)
+    phone_rule = PrefilterRule(
+        choice="有", keywords=words, patterns=[r"(?<!\d)1[3-9]\d{9}(?!\d)"]
+    )
+    return keyword_rule, phone_rule, itertools.cycle(corpus)
+
+
+def make_cases(workdir: Path) -> Dict[str, Case]:
+    """
+    构造各微基准用例：提示词构建、结构化输出描述、Pydantic 校验、媒体加载与预过滤。
+
+    文本夹具为 100 字与 5000 字的中文文本，图像夹具为 256×256 的 PNG（约 200KB），
+    写入 workdir。预过滤用例为 2000 个关键词（可选再加手机号正则）的规则，
+    每次调用轮流扫描 200 条 100 字文本之一（约 1/10 含关键词、1/10 含手机号）。
+
+    参数：
+    - workdir (Path): 夹具文件目录。
+
+    返回：
+    - Dict[str, Case]: 用例名称到被测函数的映射。
+    """
+    sentence = "这是一段用于性能测试的示例文本，包含常见的标点符号与数字 123。"
+    short_text = (sentence * 4)[:100]
+    long_text = (sentence * 200)[:5000]
+    item = AuditOptionsItem(
+        name="敏感信息",
+        instruction="检查文本中是否出现个人隐私、密钥、内网地址等敏感信息。",
+        options={"有": "检测到敏感信息", "无": "没有敏感信息", "不确定": "无法判断"},
+    )
+    items = [
+        item.model_copy(update={"id": uuid4(), "name": f"{item.name}{i}"})
+        for i in range(3)
+    ]
+    short = AuditContent(content=short_text, source="micro")
+    long = AuditContent(content=long_text, source="micro")
+    packed = [AuditContent(content=short_text, source="micro") for _ in range(10)]
+    multi_model = create_multi_decision_model(items)
+    decision = AuditDecision(choice="无", reason="未发现敏感信息")
+
+    text_path = workdir / "sample.txt"
+    text_path.write_text(long_text, encoding="utf-8")
+    image_path = workdir / "sample.png"
+    image_path.write_bytes(_png(256, 256))
+    image_bytes = image_path.read_bytes()
+    content_dict = {"content": short_text, "source": "micro", "file_type": "text"}
+    result_fields = {
+        "text_id": short.id,
+        "item_id": item.id,
+        "item_name": item.name,
+        "text_excerpt": short.content,
+        "decision": decision,
+        "model": "micro",
+        "attempts": 1,
+    }
+    result = AuditResult(**result_fields)
+    keyword_rule, phone_rule, corpus = _prefilter_fixtures()
+
+    return {
+        "build_messages[short]": lambda: build_messages(short, item),
+        "build_messages[long]": lambda: build_messages(long, item),
+        "build_multi_item_messages[3]": lambda: build_multi_item_messages(short, items),
+        "build_packed_messages[10]": lambda: build_packed_messages(packed, item),
+        "structured_output[AuditDecision]": lambda: structured_output(AuditDecision),
+        "generate_model_description[multi3]": lambda: generate_model_description(
+            multi_model
+        ),
+        "AuditContent[init]": lambda: AuditContent(content=short_text, source="micro"),
+        "AuditContent[validate]": lambda: AuditContent.model_validate(content_dict),
+        "AuditResult[init]": lambda: AuditResult(**result_fields),
+        "AuditResult[dump_json]": result.model_dump_json,
+        "filetype.guess[png]": lambda: filetype.guess(str(image_path)),
+        "base64[png]": lambda: base64.b64encode(image_bytes).decode("utf-8"),
+        "MediaLoader.from_file[text]": lambda: MediaLoader.from_file(text_path),
+        "MediaLoader.from_file[png]": lambda: MediaLoader.from_file(image_path),
+        "PrefilterRule.search[2000kw]": lambda: keyword_rule.search(next(corpus)),
+        "PrefilterRule.search[2000kw+phone]": lambda: phone_rule.search(next(corpus)),
+    }
+
+
+def measure(
+    name: str,
+    fn: Case,
+    *,
+    number: Optional[int] = None,
+    repeat: int = 5,
+    alloc_calls: int = 100,
+) -> MicroResult:
+    """
+    测量单个用例：timeit 计时（不开启 tracemalloc），再用 tracemalloc 统计内存。
+
+    参数：
+    - name (str): 用例名称。
+    - fn (Case): 被测函数。
+    - number (Optional[int]): 每轮调用次数，默认由 timeit 自动确定（每轮至少约 0.2 秒）。
+    - repeat (int): 轮数，默认 5。
+    - alloc_calls (int): 统计未释放内存时的调用次数，默认 100。
+
+    返回：
+    - MicroResult: 用例结果。
+    """
+    timer = timeit.Timer(fn)
+    if number is None:
+        number, _ = timer.autorange()
+    per_call = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+
+    fn()  # 预热，排除首次调用的缓存填充
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+        # 回收循环引用的垃圾后再比较，retained 只反映真正未释放的内存
+        gc.collect()
+        start, _ = tracemalloc.get_traced_memory()
+        for _ in range(alloc_calls):
+            fn()
+        gc.collect()
+        end, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return MicroResult(
+        name=name,
+        number=number,
+        repeat=repeat,
+        best=min(per_call),
+        median=statistics.median(per_call),
+        peak_bytes=max(peak - before, 0),
+        retained_bytes=(end - start) / alloc_calls,
+    )
+
+
+def run_micro(
+    *,
+    filters: Sequence[str] = (),
+    number: Optional[int] = None,
+    repeat: int = 5,
+    alloc_calls: int = 100,
+) -> MicroReport:
+    """
+    运行微基准。
+
+    参数：
+    - filters (Sequence[str]): 仅运行名称包含任一子串的用例，默认全部。
+    - number (Optional[int]): 每轮调用次数，默认自动确定。
+    - repeat (int): 轮数，默认 5。
+    - alloc_calls (int): 统计未释放内存时的调用次数，默认 100。
+
+    返回：
+    - MicroReport: 微基准报告。
+    """
+    report = MicroReport(
+        created_at=datetime.now(timezone.utc).isoformat(),
+        version=_package_version(),
+        python=sys.version.split()[0],
+        platform=platform.platform(),
+    )
+    with tempfile.TemporaryDirectory() as workdir:
+        for name, fn in make_cases(Path(workdir)).items():
+            if filters and not any(f in name for f in filters):
+                continue
+            report.results.append(
+                measure(name, fn, number=number, repeat=repeat, alloc_calls=alloc_calls)
+            )
+    return report
+
+
+def format_micro_report(report: MicroReport) -> str:
+    """将报告格式化为文本表格（耗时单位微秒，吞吐为按最快耗时折算的每分钟百万次调用，内存单位 KB / 字节）。"""
+    header = (
+        f"{'case':<38}{'calls':>9}{'best_us':>11}{'median_us':>11}"
+        f"{'M/min':>9}{'peak_kb':>10}{'retained_b':>12}"
+    )
+    lines = [header, "-" * len(header)]
+    for r in report.results:
+        lines.append(
+            f"{r.name:<38}{r.number * r.repeat:>9}{r.best * 1e6:>11.1f}"
+            f"{r.median * 1e6:>11.1f}{60 / r.best / 1e6:>9.2f}"
+            f"{r.peak_bytes / 1024:>10.1f}"
+            f"{r.retained_bytes:>12.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """命令行入口：运行微基准，打印结果表格并可写入 JSON 报告。"""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.micro",
+        description="客户端热路径（提示词构建、模型校验、媒体加载）的微基准",
+    )
+    parser.add_argument(
+        "filters", nargs="*", help="仅运行名称包含任一子串的用例，如 build_messages"
+    )
+    parser.add_argument("--number", type=int, help="每轮调用次数，默认自动确定")
+    parser.add_argument("--repeat", type=int, default=5, help="轮数")
+    parser.add_argument(
+        "--alloc-calls", type=int, default=100, help="统计未释放内存时的调用次数"
+    )
+    parser.add_argument("--output", help="JSON 报告输出路径")
+    args = parser.parse_args(argv)
+
+    report = run_micro(
+        filters=args.filters,
+        number=args.number,
+        repeat=args.repeat,
+        alloc_calls=args.alloc_calls,
+    )
+    if args.output:
+        Path(args.output).write_text(report.model_dump_json(indent=2), encoding="utf-8")
+    print(format_micro_report(report))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,373 @@
+import argparse
+import asyncio
+import json
+import math
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from openai import AsyncOpenAI, OpenAI
+from pydantic import BaseModel, Field
+from ai_content_audit import AsyncAuditManager, AuditManager
+from ai_content_audit.cache import MemoryCache
+from ai_content_audit.models import AuditContent, AuditOptionsItem, AuditResult
+from benchmarks.fake_server import FakeOpenAIServer, parse_latency, schema_responder
+
+MODES = ("sequential", "threaded", "async", "packed", "cached")
+
+
+class ModeReport(BaseModel):
+    """单个执行模式的基准结果，耗时单位为秒。"""
+
+    mode: str = Field(..., description="执行模式")
+    audits: int = Field(0, description="审核结果数（文本数 × 审核项数）")
+    failed: int = Field(0, description="兜底（failed）结果数")
+    http_requests: int = Field(0, description="服务端收到的请求数")
+    wall_time: float = Field(0.0, description="总耗时")
+    audits_per_second: float = Field(0.0, description="每秒审核结果数")
+    requests_per_second: float = Field(0.0, description="每秒 HTTP 请求数")
+    latency_p50: float = Field(
+        0.0, description="单条结果模型调用耗时中位数（AuditResult.usage.latency）"
+    )
+    latency_p95: float = Field(0.0, description="单条结果模型调用耗时 p95")
+    latency_p99: float = Field(0.0, description="单条结果模型调用耗时 p99")
+    cpu_per_audit: float = Field(
+        0.0, description="每条审核结果的客户端 CPU 时间（已扣除服务端替身的 CPU）"
+    )
+    cpu_per_request: float = Field(0.0, description="每个 HTTP 请求的客户端 CPU 时间")
+
+
+class BenchmarkReport(BaseModel):
+    """吞吐基准报告。"""
+
+    created_at: str = Field(..., description="生成时间（UTC，ISO 8601）")
+    version: Optional[str] = Field(None, description="ai-content-audit 版本")
+    python: str = Field(..., description="Python 版本")
+    platform: str = Field(..., description="运行平台")
+    config: Dict[str, Any] = Field(default_factory=dict, description="基准参数")
+    modes: List[ModeReport] = Field(default_factory=list, description="各模式结果")
+
+
+def make_dataset(
+    texts: int, items: int, *, text_length: int = 80
+) -> Tuple[List[AuditContent], List[AuditOptionsItem]]:
+    """
+    生成基准数据：texts 条长度为 text_length 的文本与 items 个三选一审核项。
+
+    参数：
+    - texts (int): 文本数。
+    - items (int): 审核项数。
+    - text_length (int): 每条文本的字符数，默认 80。
+
+    返回：
+    - Tuple[List[AuditContent], List[AuditOptionsItem]]: 文本列表与审核项列表。
+    """
+    filler = "这是一段用于性能基准的示例文本，内容平常，没有违规信息。"
+    contents = [
+        AuditContent(
+            content=(f"[{i}]" + filler * (text_length // len(filler) + 1))[
+                :text_length
+            ],
+            source="benchmark",
+        )
+        for i in range(texts)
+    ]
+    audit_items = [
+        AuditOptionsItem(
+            name=f"审核项{i + 1}",
+            instruction="判断文本是否包含违规内容。",
+            options={
+                "合规": "没有违规内容",
+                "违规": "包含违规内容",
+                "不确定": "无法判断",
+            },
+        )
+        for i in range(items)
+    ]
+    return contents, audit_items
+
+
+def _package_version() -> Optional[str]:
+    """已安装的 ai-content-audit 版本，未安装（源码目录运行）时为 None。"""
+    try:
+        return metadata.version("ai-content-audit")
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def _percentile(ordered: Sequence[float], percentile: float) -> float:
+    if not ordered:
+        return 0.0
+    rank = max(math.ceil(percentile / 100 * len(ordered)) - 1, 0)
+    return ordered[rank]
+
+
+def _measure(
+    mode: str, server: FakeOpenAIServer, run: Callable[[], List[AuditResult]]
+) -> ModeReport:
+    """执行 run 并统计吞吐、延迟与 CPU。"""
+    requests, server_cpu = server.requests, server.cpu_time
+    cpu, started = time.process_time(), time.perf_counter()
+    results = run()
+    wall = time.perf_counter() - started
+    cpu = time.process_time() - cpu - (server.cpu_time - server_cpu)
+    requests = server.requests - requests
+    latencies = sorted(r.usage.latency for r in results)
+    return ModeReport(
+        mode=mode,
+        audits=len(results),
+        failed=sum(r.status == "failed" for r in results),
+        http_requests=requests,
+        wall_time=wall,
+        audits_per_second=len(results) / wall if wall > 0 else 0.0,
+        requests_per_second=requests / wall if wall > 0 else 0.0,
+        latency_p50=_percentile(latencies, 50),
+        latency_p95=_percentile(latencies, 95),
+        latency_p99=_percentile(latencies, 99),
+        cpu_per_audit=max(cpu, 0.0) / len(results) if results else 0.0,
+        cpu_per_request=max(cpu, 0.0) / requests if requests else 0.0,
+    )
+
+
+def run_mode(
+    mode: str,
+    server: FakeOpenAIServer,
+    contents: List[AuditContent],
+    items: List[AuditOptionsItem],
+    *,
+    concurrency: int = 8,
+    pack_size: int = 10,
+    model: str = "fake-model",
+) -> ModeReport:
+    """
+    在 server 上运行一个执行模式的基准。
+
+    - sequential：AuditManager(max_concurrency=1).audit_batch。
+    - threaded：AuditManager(max_concurrency=concurrency).audit_batch。
+    - async：AsyncAuditManager(max_concurrency=concurrency).audit_batch。
+    - packed：对每个审核项调用 audit_packed（每包最多 pack_size 条）。
+    - cached：先以 MemoryCache 预热一遍，再统计全部命中缓存的第二遍。
+
+    参数：
+    - mode (str): 执行模式，见 MODES。
+    - server (FakeOpenAIServer): 已启动的服务替身。
+    - contents (List[AuditContent]): 待审核文本。
+    - items (List[AuditOptionsItem]): 审核项。
+    - concurrency (int): 并发数，默认 8。
+    - pack_size (int): 打包模式的每包条数，默认 10。
+    - model (str): 模型名称。
+
+    返回：
+    - ModeReport: 该模式的基准结果。
+    """
+    client = OpenAI(base_url=server.base_url, api_key="benchmark", max_retries=0)
+    if mode == "sequential":
+        manager = AuditManager(client=client, model=model, max_concurrency=1)
+        return _measure(mode, server, lambda: manager.audit_batch(contents, items))
+    if mode == "threaded":
+        manager = AuditManager(client=client, model=model, max_concurrency=concurrency)
+        return _measure(mode, server, lambda: manager.audit_batch(contents, items))
+    if mode == "async":
+        async_client = AsyncOpenAI(
+            base_url=server.base_url, api_key="benchmark", max_retries=0
+        )
+        async_manager = AsyncAuditManager(
+            client=async_client, model=model, max_concurrency=concurrency
+        )
+
+        async def run_async() -> List[AuditResult]:
+            try:
+                return await async_manager.audit_batch(contents, items)
+            finally:
+                await async_client.close()
+
+        return _measure(mode, server, lambda: asyncio.run(run_async()))
+    if mode == "packed":
+        manager = AuditManager(client=client, model=model, max_concurrency=concurrency)
+        return _measure(
+            mode,
+            server,
+            lambda: [
+                result
+                for item in items
+                for result in manager.audit_packed(
+                    contents, item, max_pack_size=pack_size
+                )
+            ],
+        )
+    if mode == "cached":
+        manager = AuditManager(
+            client=client,
+            model=model,
+            max_concurrency=concurrency,
+            cache=MemoryCache(),
+        )
+        manager.audit_batch(contents, items)
+        return _measure(mode, server, lambda: manager.audit_batch(contents, items))
+    raise ValueError(f"未知的执行模式: {mode}")
+
+
+def run_benchmark(
+    *,
+    modes: Sequence[str] = MODES,
+    texts: int = 200,
+    items: int = 2,
+    text_length: int = 80,
+    latency: str = "lognormal:0.02,0.5",
+    reason_length: int = 20,
+    concurrency: int = 8,
+    pack_size: int = 10,
+    seed: Optional[int] = 0,
+) -> BenchmarkReport:
+    """
+    启动服务替身并依次运行各执行模式的基准。
+
+    参数：
+    - modes (Sequence[str]): 执行模式，默认全部。
+    - texts (int): 文本数，默认 200。
+    - items (int): 审核项数，默认 2。
+    - text_length (int): 文本字符数，默认 80。
+    - latency (str): 服务端延迟分布（见 parse_latency），默认 "lognormal:0.02,0.5"。
+    - reason_length (int): 响应中 reason 的字符数，默认 20。
+    - concurrency (int): 并发数，默认 8。
+    - pack_size (int): 打包模式的每包条数，默认 10。
+    - seed (Optional[int]): 延迟分布随机种子，默认 0。
+
+    返回：
+    - BenchmarkReport: 基准报告。
+    """
+    config = {
+        "texts": texts,
+        "items": items,
+        "text_length": text_length,
+        "latency": latency,
+        "reason_length": reason_length,
+        "concurrency": concurrency,
+        "pack_size": pack_size,
+        "seed": seed,
+    }
+    report = BenchmarkReport(
+        created_at=datetime.now(timezone.utc).isoformat(),
+        version=_package_version(),
+        python=sys.version.split()[0],
+        platform=platform.platform(),
+        config=config,
+    )
+    contents, audit_items = make_dataset(texts, items, text_length=text_length)
+    with FakeOpenAIServer(
+        latency=parse_latency(latency, seed=seed),
+        responder=schema_responder(reason_length),
+    ) as server:
+        for mode in modes:
+            report.modes.append(
+                run_mode(
+                    mode,
+                    server,
+                    contents,
+                    audit_items,
+                    concurrency=concurrency,
+                    pack_size=pack_size,
+                )
+            )
+    return report
+
+
+def format_report(report: BenchmarkReport) -> str:
+    """将报告格式化为文本表格（耗时单位毫秒）。"""
+    header = (
+        f"{'mode':<12}{'audits':>8}{'reqs':>8}{'failed':>8}{'audits/s':>10}"
+        f"{'reqs/s':>10}{'p50_ms':>9}{'p95_ms':>9}{'p99_ms':>9}{'cpu_us/audit':>14}"
+    )
+    lines = [header, "-" * len(header)]
+    for m in report.modes:
+        lines.append(
+            f"{m.mode:<12}{m.audits:>8}{m.http_requests:>8}{m.failed:>8}"
+            f"{m.audits_per_second:>10.1f}{m.requests_per_second:>10.1f}"
+            f"{m.latency_p50 * 1000:>9.1f}{m.latency_p95 * 1000:>9.1f}"
+            f"{m.latency_p99 * 1000:>9.1f}{m.cpu_per_audit * 1e6:>14.0f}"
+        )
+    return "\n".join(lines)
+
+
+def compare_reports(baseline: BenchmarkReport, current: BenchmarkReport) -> str:
+    """
+    对比两份报告中同名模式的吞吐、p95 延迟与单条 CPU 时间（变化率，正数表示增加）。
+
+    参数：
+    - baseline (BenchmarkReport): 基线报告。
+    - current (BenchmarkReport): 当前报告。
+
+    返回：
+    - str: 对比表格文本；无同名模式时仅有表头。
+    """
+    before = {m.mode: m for m in baseline.modes}
+    header = f"{'mode':<12}{'audits/s':>12}{'p95':>12}{'cpu/audit':>12}"
+    lines = [header, "-" * len(header)]
+
+    def change(old: float, new: float) -> str:
+        return f"{(new - old) / old:+.1%}" if old else "n/a"
+
+    for m in current.modes:
+        old = before.get(m.mode)
+        if old is None:
+            continue
+        lines.append(
+            f"{m.mode:<12}"
+            f"{change(old.audits_per_second, m.audits_per_second):>12}"
+            f"{change(old.latency_p95, m.latency_p95):>12}"
+            f"{change(old.cpu_per_audit, m.cpu_per_audit):>12}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """命令行入口：运行基准，打印结果表格并写入 JSON 报告。"""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.throughput",
+        description="在进程内 OpenAI 兼容服务替身上运行各执行模式的吞吐基准",
+    )
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--texts", type=int, default=200, help="文本数")
+    parser.add_argument("--items", type=int, default=2, help="审核项数")
+    parser.add_argument("--text-length", type=int, default=80, help="文本字符数")
+    parser.add_argument(
+        "--latency",
+        default="lognormal:0.02,0.5",
+        help="服务端延迟分布：constant:S | uniform:LOW,HIGH | lognormal:MEDIAN,SIGMA",
+    )
+    parser.add_argument("--reason-length", type=int, default=20, help="响应理由字符数")
+    parser.add_argument("--concurrency", type=int, default=8, help="并发数")
+    parser.add_argument("--pack-size", type=int, default=10, help="打包模式每包条数")
+    parser.add_argument("--seed", type=int, default=0, help="延迟分布随机种子")
+    parser.add_argument(
+        "--output", default="benchmark-report.json", help="JSON 报告输出路径"
+    )
+    parser.add_argument("--baseline", help="用于对比的历史 JSON 报告")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(
+        modes=args.modes,
+        texts=args.texts,
+        items=args.items,
+        text_length=args.text_length,
+        latency=args.latency,
+        reason_length=args.reason_length,
+        concurrency=args.concurrency,
+        pack_size=args.pack_size,
+        seed=args.seed,
+    )
+    Path(args.output).write_text(report.model_dump_json(indent=2), encoding="utf-8")
+    print(format_report(report))
+    if args.baseline:
+        baseline = BenchmarkReport.model_validate(
+            json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        )
+        print()
+        print(compare_reports(baseline, report))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+import asyncio
+import inspect
+import time
+import pytest
+from pydantic import BaseModel
+from ai_content_audit.models import AuditDecision
+
+
+def _prompt_text(messages):
+    """单审核项提示词中的待审核文本（“待审核文本：”后的第一行）"""
+    return messages[1]["content"].split("待审核文本：\n")[1].split("\n")[0]
+
+
+@pytest.fixture
+def prompt_text():
+    """从模型请求的 messages 中取出待审核文本"""
+    return _prompt_text
+
+
+@pytest.fixture
+def make_response(mocker):
+    """
+    构造模拟的 chat.completions.parse 响应。
+
+    make_response(parsed) 使用给定的解析结果；省略时为 AuditDecision(choice, reason)。
+    usage 不为 None 时设置响应的 usage。
+    """
+
+    def make(parsed=None, *, choice="有", reason="r", usage=None):
+        if parsed is None:
+            parsed = AuditDecision(choice=choice, reason=reason)
+        response = mocker.Mock(
+            choices=[mocker.Mock(message=mocker.Mock(parsed=parsed))]
+        )
+        if usage is not None:
+            response.usage = usage
+        return response
+
+    return make
+
+
+def _answer(make_response, answer, model, messages, response_format, kwargs):
+    """按 answer 生成响应：可调用对象返回解析结果、响应或异常，其余为固定的解析结果。"""
+    if callable(answer) and not isinstance(answer, BaseModel):
+        answer = answer(model=model, messages=messages, response_format=response_format)
+    if isinstance(answer, Exception):
+        raise answer
+    if answer is None or isinstance(answer, BaseModel):
+        return make_response(answer, **kwargs)
+    return answer
+
+
+@pytest.fixture
+def make_client(mocker, make_response):
+    """
+    构造模拟的 OpenAI 客户端。
+
+    - answer：省略时返回 AuditDecision(choice, reason)；BaseModel 为固定的解析结果；
+      可调用对象以 model、messages、response_format 关键字参数调用，
+      返回解析结果、完整响应或异常（异常会被抛出）。
+    - delay：每次调用前休眠的秒数。
+    - 其余关键字参数（choice、reason、usage）传给 make_response。
+    """
+
+    def make(answer=None, *, delay=0.0, **kwargs):
+        client = mocker.Mock()
+
+        def fake_parse(*, model, messages, response_format):
+            if delay:
+                time.sleep(delay)
+            return _answer(
+                make_response, answer, model, messages, response_format, kwargs
+            )
+
+        client.chat.completions.parse.side_effect = fake_parse
+        return client
+
+    return make
+
+
+@pytest.fixture
+def make_async_client(mocker, make_response):
+    """构造模拟的 AsyncOpenAI 客户端，参数同 make_client；answer 也可以是协程函数，delay 期间不阻塞事件循环。"""
+
+    def make(answer=None, *, delay=0.0, **kwargs):
+        client = mocker.Mock()
+
+        async def fake_parse(*, model, messages, response_format):
+            if delay:
+                await asyncio.sleep(delay)
+            result = answer
+            if callable(answer) and not isinstance(answer, BaseModel):
+                result = answer(
+                    model=model, messages=messages, response_format=response_format
+                )
+                if inspect.isawaitable(result):
+                    result = await result
+            return _answer(
+                make_response, result, model, messages, response_format, kwargs
+            )
+
+        client.chat.completions.parse = mocker.AsyncMock(side_effect=fake_parse)
+        return client
+
+    return make
@@ -0,0 +1,104 @@
+import asyncio
+import threading
+import time
+import openai
+import pytest
+from ai_content_audit.runtime import AdaptiveConcurrencyLimiter, is_overload_error
+
+
+def _rate_limit_error(mocker):
+    response = mocker.Mock(status_code=429, headers={})
+    return openai.RateLimitError("限流", response=response, body=None)
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """测试 AIMD 自适应并发限制器"""
+
+    def test_invalid_args(self):
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(initial=0)
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(initial=100, max_limit=10)
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(decrease_factor=1)
+
+    def test_additive_increase(self):
+        """测试健康请求使上限每轮约 +1"""
+        limiter = AdaptiveConcurrencyLimiter(initial=4, max_limit=5)
+        for _ in range(4):
+            limiter.acquire()
+            limiter.release(latency=0.01)
+        assert limiter.limit == 4  # 4 + 4 * (1/4..) 略小于 5
+        for _ in range(10):
+            limiter.acquire()
+            limiter.release(latency=0.01)
+        assert limiter.limit == 5  # 不超过上界
+        assert limiter.ewma_latency == pytest.approx(0.01)
+
+    def test_multiplicative_decrease_with_cooldown(self, mocker):
+        """测试过载时乘性缩减，冷却期内只缩减一次"""
+        limiter = AdaptiveConcurrencyLimiter(initial=16, cooldown=60)
+        err = _rate_limit_error(mocker)
+        for _ in range(3):
+            limiter.acquire()
+            limiter.release(error=err)
+        assert limiter.limit == 8
+
+    def test_latency_threshold_and_neutral_errors(self):
+        """测试延迟超阈值视为过载，非过载错误不调整"""
+        limiter = AdaptiveConcurrencyLimiter(
+            initial=8, latency_threshold=1.0, cooldown=0
+        )
+        limiter.acquire()
+        limiter.release(latency=5.0)
+        assert limiter.limit == 4
+        limiter.acquire()
+        limiter.release(error=ValueError("校验失败"))
+        assert limiter.limit == 4
+        assert limiter.in_flight == 0
+
+    def test_acquire_blocks_at_limit(self):
+        """测试在途请求数不超过上限"""
+        limiter = AdaptiveConcurrencyLimiter(initial=2, max_limit=2)
+        peak = 0
+        lock = threading.Lock()
+
+        def worker():
+            nonlocal peak
+            limiter.acquire()
+            with lock:
+                peak = max(peak, limiter.in_flight)
+            time.sleep(0.01)
+            limiter.release(latency=0.01)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert peak <= 2
+        assert limiter.in_flight == 0
+
+    def test_acquire_async(self):
+        """测试异步获取名额"""
+        limiter = AdaptiveConcurrencyLimiter(initial=2, max_limit=2)
+        peak = 0
+
+        async def worker():
+            nonlocal peak
+            await limiter.acquire_async()
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.01)
+            limiter.release(latency=0.01)
+
+        async def main():
+            await asyncio.gather(*(worker() for _ in range(6)))
+
+        asyncio.run(main())
+        assert peak <= 2
+        assert limiter.in_flight == 0
+
+    def test_is_overload_error(self, mocker):
+        assert is_overload_error(_rate_limit_error(mocker))
+        assert is_overload_error(openai.APITimeoutError(request=mocker.Mock()))
+        assert not is_overload_error(ValueError())
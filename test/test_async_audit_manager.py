@@ -0,0 +1,268 @@
+import asyncio
+import threading
+import pytest
+from ai_content_audit.async_audit_manager import AsyncAuditManager
+from ai_content_audit.cache import MemoryCache
+from ai_content_audit.runtime import HedgePolicy, ModelCascade
+from ai_content_audit.tracing import MemorySpanExporter, Tracer
+from ai_content_audit.models import (
+    AuditOptionsItem,
+    AuditContent,
+    AuditDecision,
+    AuditResult,
+)
+
+
+class TestAsyncAuditManager:
+    """测试 AsyncAuditManager 类"""
+
+    @pytest.fixture
+    def mock_client(self, make_async_client):
+        """模拟 AsyncOpenAI 客户端"""
+        return make_async_client(reason="测试理由")
+
+    @pytest.fixture
+    def manager(self, mock_client):
+        """创建 AsyncAuditManager 实例"""
+        return AsyncAuditManager(client=mock_client, model="test-model")
+
+    @pytest.fixture
+    def sample_text(self):
+        """示例 AuditContent"""
+        return AuditContent(content="测试文本", source="test", file_type="text")
+
+    @pytest.fixture
+    def sample_item(self):
+        """示例 AuditOptionsItem"""
+        return AuditOptionsItem(
+            name="测试项", instruction="测试指令", options={"有": "desc", "无": "desc"}
+        )
+
+    def test_init_invalid_concurrency(self, mock_client):
+        """测试非法并发数"""
+        with pytest.raises(ValueError):
+            AsyncAuditManager(client=mock_client, model="m", max_concurrency=0)
+
+    def test_audit_one_success(self, manager, sample_text, sample_item, mock_client):
+        """测试 audit_one 成功"""
+        result = asyncio.run(manager.audit_one(sample_text, sample_item))
+
+        assert isinstance(result, AuditResult)
+        assert result.text_id == sample_text.id
+        assert result.item_id == sample_item.id
+        assert result.decision.choice == "有"
+        assert result.decision.reason == "测试理由"
+        mock_client.chat.completions.parse.assert_awaited_once()
+
+    def test_audit_one_normalizes_choice(
+        self, sample_text, sample_item, make_async_client
+    ):
+        """测试 audit_one 对非法 choice 的清洗"""
+        client = make_async_client(choice="其它", reason=" ")
+        manager = AsyncAuditManager(client=client, model="test-model")
+
+        result = asyncio.run(manager.audit_one(sample_text, sample_item))
+
+        assert result.decision.choice == "有"
+        assert result.decision.reason == "基于文本与选项说明给出的判定"
+
+    def test_audit_batch_bounded_concurrency(self, sample_item, make_async_client):
+        """测试 audit_batch 保持顺序并限制在途请求数"""
+        in_flight = 0
+        peak = 0
+
+        async def fake_parse(*, model, messages, response_format):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            choice = "无" if "文本2" in messages[1]["content"] else "有"
+            return AuditDecision(choice=choice, reason="理由")
+
+        client = make_async_client(fake_parse)
+        manager = AsyncAuditManager(client=client, model="m", max_concurrency=3)
+        texts = [AuditContent(content=f"文本{i}") for i in range(10)]
+
+        results = asyncio.run(manager.audit_batch(texts, [sample_item]))
+
+        assert [r.text_id for r in results] == [t.id for t in texts]
+        assert results[2].decision.choice == "无"
+        assert len(set(r.batch_id for r in results)) == 1
+        assert peak <= 3
+
+    def test_audit_batch_failure_handling(
+        self, manager, sample_text, sample_item, mock_client
+    ):
+        """测试 audit_batch 失败处理"""
+        mock_client.chat.completions.parse.side_effect = Exception("API 错误")
+
+        results = asyncio.run(manager.audit_batch([sample_text], [sample_item]))
+
+        assert len(results) == 1
+        assert results[0].decision.choice == "有"
+        assert results[0].decision.reason == "模型调用失败"
+
+    def test_audit_batch_single_flight(self, sample_item, make_async_client):
+        """测试并发的相同审核只调用一次模型"""
+        client = make_async_client(delay=0.01, reason="理由")
+        manager = AsyncAuditManager(client=client, model="m")
+        texts = [AuditContent(content="热门内容") for _ in range(5)]
+
+        results = asyncio.run(manager.audit_batch(texts, [sample_item]))
+
+        assert client.chat.completions.parse.await_count == 1
+        assert all(r.decision.choice == "有" for r in results)
+
+    def test_audit_one_cascade(self, make_async_client):
+        """测试快速模型给出不确定结论时升级到主模型"""
+        choices = {"fast": "不确定", "big": "违规"}
+        client = make_async_client(
+            lambda *, model, messages, response_format: AuditDecision(
+                choice=choices[model], reason=model
+            )
+        )
+        manager = AsyncAuditManager(
+            client=client, model="big", cascade=ModelCascade("fast")
+        )
+        item = AuditOptionsItem(
+            name="项", instruction="指令", options={"违规": "d", "不确定": "d"}
+        )
+
+        result = asyncio.run(manager.audit_one(AuditContent(content="文本"), item))
+
+        models = [
+            c.kwargs["model"] for c in client.chat.completions.parse.call_args_list
+        ]
+        assert models == ["fast", "big"]
+        assert result.decision.choice == "违规"
+        assert result.escalated is True
+        assert result.model == "big"
+
+    def test_audit_one_hedged(self, make_async_client, sample_item):
+        """测试原请求过慢时对冲请求胜出，落后的请求被取消"""
+        cancelled = []
+
+        async def fake_parse(*, model, messages, response_format):
+            if model == "slow":
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    cancelled.append(model)
+                    raise
+            return AuditDecision(choice="有", reason=model)
+
+        client = make_async_client(fake_parse)
+        policy = HedgePolicy(delay=0.01, max_hedge_rate=1.0, model="fast")
+        manager = AsyncAuditManager(client=client, model="slow", hedge_policy=policy)
+
+        result = asyncio.run(
+            manager.audit_one(AuditContent(content="文本"), sample_item)
+        )
+
+        assert result.decision.reason == "fast"
+        assert cancelled == ["slow"]
+        assert policy.hedge_wins == 1
+
+    def test_tracing(self, mock_client, sample_text, sample_item):
+        """测试异步审核的 span 层级"""
+        exporter = MemorySpanExporter()
+        manager = AsyncAuditManager(
+            client=mock_client, model="m", tracer=Tracer(exporter)
+        )
+
+        asyncio.run(manager.audit_one(sample_text, sample_item))
+
+        by_name = {s["name"]: s for s in exporter.spans}
+        by_id = {s["span_id"]: s for s in exporter.spans}
+        assert {"audit.one", "model.attempt", "http.request", "audit.parse"} <= set(
+            by_name
+        )
+        assert by_id[by_name["http.request"]["parent_id"]]["name"] == "model.attempt"
+        assert by_name["audit.one"]["parent_id"] is None
+
+    def test_cache_off_event_loop(self, mock_client, sample_text, sample_item):
+        """测试阻塞的缓存后端在线程中读写，进入调用前再次读取缓存"""
+        threads = []
+
+        class RecordingCache(MemoryCache):
+            blocking = True
+
+            def get(self, key):
+                threads.append(threading.current_thread())
+                return super().get(key)
+
+            def set(self, key, decision):
+                threads.append(threading.current_thread())
+                super().set(key, decision)
+
+        cache = RecordingCache()
+        manager = AsyncAuditManager(client=mock_client, model="m", cache=cache)
+
+        first = asyncio.run(manager.audit_one(sample_text, sample_item))
+        second = asyncio.run(manager.audit_one(sample_text, sample_item))
+
+        assert not first.cache_hit and second.cache_hit
+        assert len(threads) == 4
+        assert threading.main_thread() not in threads
+        assert mock_client.chat.completions.parse.await_count == 1
+
+    def test_memory_cache_hit_stays_on_loop(
+        self, mock_client, sample_text, sample_item, mocker
+    ):
+        """测试 MemoryCache 不阻塞，读写直接执行，不使用默认线程池"""
+        manager = AsyncAuditManager(client=mock_client, model="m", cache=MemoryCache())
+
+        async def main():
+            run_in_executor = mocker.spy(asyncio.get_running_loop(), "run_in_executor")
+            await manager.audit_one(sample_text, sample_item)
+            hit = await manager.audit_one(sample_text, sample_item)
+            return hit, run_in_executor.call_count
+
+        hit, executor_calls = asyncio.run(main())
+
+        assert hit.cache_hit
+        assert executor_calls == 0
+
+    def test_cache_recheck_inside_call(self, mock_client, sample_text, sample_item):
+        """测试进入调用时缓存已被写入（如其他进程），不再调用模型"""
+        cache = MemoryCache()
+        reads = []
+        original = cache.get
+
+        def get(key):
+            reads.append(key)
+            if len(reads) == 2:
+                cache.set(key, AuditDecision(choice="无", reason="其他进程写入"))
+            return original(key)
+
+        cache.get = get
+        manager = AsyncAuditManager(client=mock_client, model="m", cache=cache)
+
+        result = asyncio.run(manager.audit_one(sample_text, sample_item))
+
+        assert result.cache_hit
+        assert result.decision.reason == "其他进程写入"
+        mock_client.chat.completions.parse.assert_not_awaited()
+
+    def test_cancelled_leader_does_not_abort_batch(
+        self, make_async_client, sample_text, sample_item
+    ):
+        """测试单飞 leader 超时取消时，共享同一请求的 audit_batch 仍得到结果"""
+        client = make_async_client(delay=0.1, choice="无", reason="理由")
+        manager = AsyncAuditManager(client=client, model="m")
+
+        async def main():
+            leader = asyncio.wait_for(manager.audit_one(sample_text, sample_item), 0.05)
+            return await asyncio.gather(
+                leader,
+                manager.audit_batch([sample_text], [sample_item]),
+                return_exceptions=True,
+            )
+
+        timed_out, batch = asyncio.run(main())
+
+        assert isinstance(timed_out, asyncio.TimeoutError)
+        assert [r.status for r in batch] == ["success"]
+        assert batch[0].decision.choice == "无"
+        assert client.chat.completions.parse.await_count == 1
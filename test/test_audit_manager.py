@@ -1,10 +1,36 @@
+import threading
+import time
+from uuid import uuid4
+import openai
 import pytest
 from ai_content_audit.audit_manager import AuditManager, _ensure_choice
+from ai_content_audit.cache import MemoryCache, make_cache_key
+from ai_content_audit.journal import BatchJournal
+from ai_content_audit.metrics import AuditMetrics
+from ai_content_audit.tracing import MemorySpanExporter, Tracer
+from ai_content_audit.runtime import (
+    AdaptiveConcurrencyLimiter,
+    ClientPool,
+    HedgePolicy,
+    ItemPlanner,
+    ModelCascade,
+    PoolEndpoint,
+    PriorityScheduler,
+    RateLimiter,
+    RetryPolicy,
+)
 from ai_content_audit.models import (
     AuditOptionsItem,
     AuditContent,
     AuditDecision,
     AuditResult,
+    AuditPackedDecision,
+    AuditPackedDecisionEntry,
+    AuditPrefilter,
+    AuditUsageSummary,
+    PrefilterRule,
+    create_multi_decision_model,
+    multi_decision_field,
 )
 
 
@@ -219,3 +245,1209 @@ class TestAuditManager:
 
         # 验证使用覆盖客户端
         override_client.chat.completions.parse.assert_called_once()
+
+    def test_init_invalid_concurrency(self, mock_client):
+        """测试非法并发数"""
+        with pytest.raises(ValueError):
+            AuditManager(client=mock_client, model="test-model", max_concurrency=0)
+
+    def test_audit_batch_concurrent_preserves_order(self, make_client):
+        """测试 audit_batch 并发执行时保持结果顺序"""
+        texts = [AuditContent(content=f"文本{i}") for i in range(6)]
+        items = [
+            AuditOptionsItem(
+                name=f"项{j}", instruction="指令", options={"有": "desc", "无": "desc"}
+            )
+            for j in range(3)
+        ]
+
+        def answer(*, model, messages, response_format):
+            choice = "无" if "文本3" in messages[1]["content"] else "有"
+            return AuditDecision(choice=choice, reason="理由")
+
+        manager = AuditManager(
+            client=make_client(answer), model="test-model", max_concurrency=4
+        )
+
+        results = manager.audit_batch(texts, items)
+
+        assert len(results) == 18
+        expected = [(t.id, it.id) for t in texts for it in items]
+        assert [(r.text_id, r.item_id) for r in results] == expected
+        assert len(set(r.batch_id for r in results)) == 1
+        assert [r.decision.choice for r in results[9:12]] == ["无", "无", "无"]
+
+    def test_audit_batch_concurrent_failure_handling(
+        self, manager, sample_item, mock_client
+    ):
+        """测试 audit_batch 并发执行时单项失败兜底"""
+        texts = [AuditContent(content=f"文本{i}") for i in range(4)]
+        mock_client.chat.completions.parse.side_effect = Exception("API 错误")
+
+        results = manager.audit_batch(texts, [sample_item], max_concurrency=3)
+
+        assert len(results) == 4
+        assert all(r.decision.reason == "模型调用失败" for r in results)
+
+
+class TestAuditManagerMultiItem:
+    """测试单次调用多审核项模式"""
+
+    @pytest.fixture
+    def items(self):
+        return [
+            AuditOptionsItem(
+                name="项1", instruction="指令1", options={"有": "desc", "无": "desc"}
+            ),
+            AuditOptionsItem(
+                name="项2",
+                instruction="指令2",
+                options={"违规": "desc", "正常": "desc", "不确定": "desc"},
+            ),
+        ]
+
+    @pytest.fixture
+    def mock_client(self, make_client):
+        return make_client(
+            lambda *, model, messages, response_format: response_format(
+                item_1=AuditDecision(choice="无", reason="理由1"),
+                item_2=AuditDecision(choice="乱写", reason="理由2"),
+            )
+        )
+
+    def test_create_multi_decision_model(self, items):
+        """测试动态模型生成与缓存"""
+        model_cls = create_multi_decision_model(items)
+        assert list(model_cls.model_fields) == ["item_1", "item_2"]
+        assert create_multi_decision_model(items) is model_cls
+        with pytest.raises(ValueError):
+            create_multi_decision_model([])
+
+    def test_audit_items(self, mock_client, items):
+        """测试 audit_items 单次调用拆分为多个结果"""
+        manager = AuditManager(client=mock_client, model="test-model")
+        content = AuditContent(content="测试文本")
+
+        results = manager.audit_items(content, items)
+
+        mock_client.chat.completions.parse.assert_called_once()
+        messages = mock_client.chat.completions.parse.call_args.kwargs["messages"]
+        assert "项1" in messages[1]["content"] and "项2" in messages[1]["content"]
+        assert [r.item_id for r in results] == [it.id for it in items]
+        assert results[0].decision.choice == "无"
+        assert results[1].decision.choice == "不确定"  # 非法选项被清洗
+
+    def test_audit_batch_combine_items(self, mock_client, items):
+        """测试 audit_batch 合并审核项模式"""
+        manager = AuditManager(client=mock_client, model="test-model")
+        texts = [AuditContent(content="文本1"), AuditContent(content="文本2")]
+
+        results = manager.audit_batch(texts, items, combine_items=True)
+
+        assert mock_client.chat.completions.parse.call_count == 2
+        expected = [(t.id, it.id) for t in texts for it in items]
+        assert [(r.text_id, r.item_id) for r in results] == expected
+        assert len(set(r.batch_id for r in results)) == 1
+
+    def test_audit_batch_combine_items_failure(self, mock_client, items):
+        """测试合并审核项模式调用失败时全部兜底"""
+        mock_client.chat.completions.parse.side_effect = Exception("API 错误")
+        manager = AuditManager(client=mock_client, model="test-model")
+
+        results = manager.audit_batch(
+            [AuditContent(content="文本")], items, combine_items=True
+        )
+
+        assert [r.decision.choice for r in results] == ["有", "不确定"]
+        assert all(r.decision.reason == "模型调用失败" for r in results)
+
+
+class TestAuditManagerPacked:
+    """测试多条短文本打包审核"""
+
+    @pytest.fixture
+    def item(self):
+        return AuditOptionsItem(
+            name="是否违规",
+            instruction="指令",
+            options={"正常": "desc", "违规": "desc"},
+        )
+
+    def test_audit_packed_with_fallback(self, item, make_client):
+        """测试打包审核解析与缺失/非法条目回退"""
+
+        def answer(*, model, messages, response_format):
+            if response_format is AuditPackedDecision:
+                return AuditPackedDecision(
+                    decisions=[
+                        AuditPackedDecisionEntry(index=1, choice="违规", reason="r1"),
+                        AuditPackedDecisionEntry(index=3, choice="乱写", reason="r3"),
+                        AuditPackedDecisionEntry(index=9, choice="正常", reason="r9"),
+                    ]
+                )
+            return AuditDecision(choice="正常", reason="单条")
+
+        client = make_client(answer)
+        manager = AuditManager(client=client, model="test-model")
+        texts = [AuditContent(content=f"评论{i}") for i in range(3)]
+
+        results = manager.audit_packed(texts, item)
+
+        assert [r.text_id for r in results] == [t.id for t in texts]
+        assert results[0].decision.choice == "违规"
+        assert results[1].decision.reason == "单条"  # 缺失条目回退
+        assert results[2].decision.reason == "单条"  # 非法 choice 回退
+        assert client.chat.completions.parse.call_count == 3
+        assert len(set(r.batch_id for r in results)) == 1
+
+    def test_audit_packed_splits_packs(self, item, make_client):
+        """测试按条数与 token 上限分包，图片单独调用"""
+        pack_sizes = []
+
+        def answer(*, model, messages, response_format):
+            if response_format is AuditPackedDecision:
+                n = messages[1]["content"].count("\n[")
+                pack_sizes.append(n)
+                return AuditPackedDecision(
+                    decisions=[
+                        AuditPackedDecisionEntry(index=i, choice="正常", reason="r")
+                        for i in range(1, n + 1)
+                    ]
+                )
+            pack_sizes.append(1)
+            return AuditDecision(choice="正常", reason="r")
+
+        client = make_client(answer)
+        manager = AuditManager(client=client, model="test-model")
+        contents = [AuditContent(content=f"短评{i}") for i in range(5)]
+        contents.append(
+            AuditContent(content="data:image/png;base64,xx", file_type="image")
+        )
+        contents.append(AuditContent(content="长" * 50))
+        contents.append(AuditContent(content="短评"))
+
+        results = manager.audit_packed(
+            contents, item, max_pack_size=3, max_pack_tokens=40
+        )
+
+        assert [r.text_id for r in results] == [c.id for c in contents]
+        assert pack_sizes == [3, 2, 1, 1, 1]
+
+    def test_audit_packed_whole_pack_failure(self, item, mocker):
+        """测试整包失败时回退为单条调用，单条失败返回兜底"""
+        client = mocker.Mock()
+        client.chat.completions.parse.side_effect = Exception("API 错误")
+        manager = AuditManager(client=client, model="test-model")
+
+        results = manager.audit_packed(
+            [AuditContent(content="a"), AuditContent(content="b")], item
+        )
+
+        assert client.chat.completions.parse.call_count == 3
+        assert all(r.decision.reason == "模型调用失败" for r in results)
+
+    def test_failed_pack_usage_spread_to_fallbacks(self, item, mocker, make_client):
+        """测试整包失败时打包请求的尝试次数与 token 用量分摊到回退结果，汇总不丢失"""
+        pack_answers = [
+            openai.InternalServerError(
+                "故障", response=mocker.Mock(status_code=500, headers={}), body=None
+            ),
+            mocker.Mock(
+                choices=[mocker.Mock(message=mocker.Mock(parsed=None))],
+                usage=mocker.Mock(
+                    prompt_tokens=40, completion_tokens=10, total_tokens=50
+                ),
+            ),
+        ]
+
+        def answer(*, model, messages, response_format):
+            if response_format is AuditPackedDecision:
+                return pack_answers.pop(0)
+            return AuditDecision(choice="正常", reason="单条")
+
+        client = make_client(
+            answer,
+            usage=mocker.Mock(prompt_tokens=8, completion_tokens=2, total_tokens=10),
+        )
+        manager = AuditManager(
+            client=client,
+            model="m",
+            retry_policy=RetryPolicy(base_delay=0, max_attempts=2),
+        )
+        contents = [AuditContent(content=f"文本{i}") for i in range(3)]
+
+        results = manager.audit_packed(contents, item)
+        summary = AuditUsageSummary.from_results(results)
+
+        assert [r.decision.reason for r in results] == ["单条"] * 3
+        assert [r.usage.total_tokens for r in results] == [27, 27, 26]
+        assert all(r.usage.shared == 1 for r in results)
+        assert (summary.attempts, summary.total_tokens) == (5, 80)
+        assert (summary.prompt_tokens, summary.completion_tokens) == (64, 16)
+
+
+class TestAuditManagerCache:
+    """测试审核结论缓存"""
+
+    @pytest.fixture
+    def mock_client(self, make_client):
+        return make_client(reason="理由")
+
+    @pytest.fixture
+    def item(self):
+        return AuditOptionsItem(
+            name="测试项", instruction="测试指令", options={"有": "desc", "无": "desc"}
+        )
+
+    def test_audit_one_cache_hit(self, mock_client, item):
+        """测试相同内容第二次审核命中缓存"""
+        manager = AuditManager(client=mock_client, model="m", cache=MemoryCache())
+
+        first = manager.audit_one(AuditContent(content="文本"), item)
+        second = manager.audit_one(AuditContent(content="文本"), item)
+
+        assert first.cache_hit is False
+        assert second.cache_hit is True
+        assert second.decision == first.decision
+        mock_client.chat.completions.parse.assert_called_once()
+
+    def test_cache_keyed_by_model(self, mock_client, item):
+        """测试不同模型不共享缓存"""
+        manager = AuditManager(client=mock_client, model="m", cache=MemoryCache())
+
+        manager.audit_one(AuditContent(content="文本"), item)
+        result = manager.audit_one(AuditContent(content="文本"), item, model="other")
+
+        assert result.cache_hit is False
+        assert mock_client.chat.completions.parse.call_count == 2
+
+    def test_audit_batch_cache_and_no_failure_caching(self, mock_client, item):
+        """测试批量审核命中缓存，且失败结果不写入缓存"""
+        manager = AuditManager(client=mock_client, model="m", cache=MemoryCache())
+        texts = [AuditContent(content="a"), AuditContent(content="a")]
+
+        results = manager.audit_batch(texts, [item])
+        assert [r.cache_hit for r in results] == [False, True]
+
+        mock_client.chat.completions.parse.side_effect = Exception("API 错误")
+        failed = manager.audit_batch([AuditContent(content="b")], [item])
+        assert failed[0].decision.reason == "模型调用失败"
+        assert (
+            manager.cache.get(make_cache_key(AuditContent(content="b"), item, "m"))
+            is None
+        )
+
+    def test_audit_items_partial_cache(self, mock_client, item):
+        """测试多审核项模式仅发送未命中缓存的审核项"""
+        other = AuditOptionsItem(
+            name="项2", instruction="指令2", options={"有": "desc", "无": "desc"}
+        )
+        manager = AuditManager(client=mock_client, model="m", cache=MemoryCache())
+        content = AuditContent(content="文本")
+        manager.audit_one(content, item)
+
+        results = manager.audit_items(content, [item, other])
+
+        assert [r.cache_hit for r in results] == [True, False]
+        last_call = mock_client.chat.completions.parse.call_args.kwargs
+        assert last_call["response_format"] is AuditDecision
+
+
+class TestAuditManagerSingleFlight:
+    """测试相同请求的在途合并"""
+
+    @pytest.fixture
+    def item(self):
+        return AuditOptionsItem(
+            name="测试项", instruction="测试指令", options={"有": "desc", "无": "desc"}
+        )
+
+    def test_concurrent_identical_audits_coalesced(self, item, make_client):
+        """测试并发的相同审核只调用一次模型"""
+        client = make_client(delay=0.05)
+        manager = AuditManager(client=client, model="m")
+        texts = [AuditContent(content="热门内容") for _ in range(6)]
+
+        results = manager.audit_batch(texts, [item], max_concurrency=6)
+
+        client.chat.completions.parse.assert_called_once()
+        assert all(r.decision.choice == "有" for r in results)
+        assert len({id(r.decision) for r in results}) == 6
+
+    def test_single_flight_disabled(self, item, make_client):
+        """测试关闭单飞去重时每次都调用模型"""
+        client = make_client(delay=0.05)
+        manager = AuditManager(client=client, model="m", single_flight=False)
+        texts = [AuditContent(content="热门内容") for _ in range(3)]
+
+        manager.audit_batch(texts, [item], max_concurrency=3)
+
+        assert client.chat.completions.parse.call_count == 3
+
+    def test_no_cache_key_without_cache_or_single_flight(
+        self, item, make_client, mocker
+    ):
+        """测试未启用缓存与单飞时不计算缓存键"""
+        key = mocker.patch("ai_content_audit.audit_manager.make_cache_key")
+        manager = AuditManager(client=make_client(), model="m", single_flight=False)
+
+        result = manager.audit_one(AuditContent(content="文本"), item)
+
+        assert result.decision.choice == "有"
+        key.assert_not_called()
+
+
+class TestAuditManagerRateLimiter:
+    """测试限流器接入"""
+
+    def test_rate_limiter_acquire_and_reconcile(self, mocker, make_client):
+        """测试每次调用前预约配额，返回后按实际 usage 修正"""
+        client = make_client(usage=mocker.Mock(total_tokens=321))
+        limiter = RateLimiter(rpm=1000, tpm=100000)
+        acquire = mocker.spy(limiter, "acquire")
+        reconcile = mocker.spy(limiter, "reconcile")
+        manager = AuditManager(client=client, model="m", rate_limiter=limiter)
+        item = AuditOptionsItem(name="项", instruction="指令", options={"有": "d"})
+
+        manager.audit_one(AuditContent(content="文本"), item)
+
+        estimated = acquire.call_args.args[0]
+        assert estimated > limiter.expected_completion_tokens
+        reconcile.assert_called_once_with(estimated, 321)
+
+
+class TestAuditManagerRetry:
+    """测试重试策略接入"""
+
+    @pytest.fixture
+    def item(self):
+        return AuditOptionsItem(
+            name="测试项", instruction="测试指令", options={"有": "desc", "无": "desc"}
+        )
+
+    @staticmethod
+    def _error(mocker, cls, status):
+        response = mocker.Mock(status_code=status, headers={})
+        return cls("错误", response=response, body=None)
+
+    def test_retry_then_success(self, item, mocker, make_response):
+        """测试 429 后重试成功，记录尝试次数"""
+        client = mocker.Mock()
+        client.chat.completions.parse.side_effect = [
+            self._error(mocker, openai.RateLimitError, 429),
+            make_response(choice="无"),
+        ]
+        manager = AuditManager(
+            client=client, model="m", retry_policy=RetryPolicy(base_delay=0)
+        )
+
+        results = manager.audit_batch([AuditContent(content="文本")], [item])
+
+        assert results[0].decision.choice == "无"
+        assert results[0].attempts == 2
+
+    def test_fail_fast_on_auth_error(self, item, mocker):
+        """测试鉴权错误不重试"""
+        client = mocker.Mock()
+        client.chat.completions.parse.side_effect = self._error(
+            mocker, openai.AuthenticationError, 401
+        )
+        manager = AuditManager(
+            client=client, model="m", retry_policy=RetryPolicy(base_delay=0)
+        )
+
+        results = manager.audit_batch([AuditContent(content="文本")], [item])
+
+        assert results[0].decision.reason == "模型调用失败"
+        assert results[0].attempts == 1
+
+    def test_retries_exhausted(self, item, mocker):
+        """测试重试耗尽后返回兜底结果"""
+        client = mocker.Mock()
+        client.chat.completions.parse.side_effect = self._error(
+            mocker, openai.InternalServerError, 503
+        )
+        manager = AuditManager(
+            client=client,
+            model="m",
+            retry_policy=RetryPolicy(max_attempts=4, base_delay=0),
+        )
+
+        results = manager.audit_batch([AuditContent(content="文本")], [item])
+
+        assert results[0].decision.reason == "模型调用失败"
+        assert results[0].attempts == 4
+        assert client.chat.completions.parse.call_count == 4
+
+    def test_audit_one_raises_after_retries(self, item, mocker):
+        """测试 audit_one 重试耗尽后抛出最后一次异常"""
+        client = mocker.Mock()
+        client.chat.completions.parse.side_effect = self._error(
+            mocker, openai.RateLimitError, 429
+        )
+        manager = AuditManager(
+            client=client,
+            model="m",
+            retry_policy=RetryPolicy(max_attempts=2, base_delay=0),
+        )
+
+        with pytest.raises(openai.RateLimitError):
+            manager.audit_one(AuditContent(content="文本"), item)
+
+
+class TestAuditManagerAdaptiveConcurrency:
+    """测试自适应并发限制器接入"""
+
+    def test_limiter_reacts_to_rate_limit(self, mocker, make_response):
+        """测试 429 使并发上限下降，成功请求不占用名额"""
+        client = mocker.Mock()
+        response = mocker.Mock(status_code=429, headers={})
+        ok = make_response()
+        client.chat.completions.parse.side_effect = [
+            openai.RateLimitError("限流", response=response, body=None),
+            ok,
+            ok,
+        ]
+        limiter = AdaptiveConcurrencyLimiter(initial=8, max_limit=16)
+        manager = AuditManager(client=client, model="m", concurrency_limiter=limiter)
+        item = AuditOptionsItem(name="项", instruction="指令", options={"有": "d"})
+        texts = [AuditContent(content=f"文本{i}") for i in range(3)]
+
+        results = manager.audit_batch(texts, [item], max_concurrency=1)
+
+        assert results[0].decision.reason == "模型调用失败"
+        assert limiter.limit == 4
+        assert limiter.in_flight == 0
+        assert manager._workers(None) == 16
+
+
+class TestAuditManagerIter:
+    """测试流式批量审核"""
+
+    @pytest.fixture
+    def item(self):
+        return AuditOptionsItem(
+            name="项", instruction="指令", options={"有": "d", "无": "d"}
+        )
+
+    @pytest.fixture
+    def echo_client(self, make_client, prompt_text):
+        """按文本内容回显理由的模拟客户端，可按文本设置延时"""
+
+        def make(delay=None):
+            def answer(*, model, messages, response_format):
+                text = prompt_text(messages)
+                if delay is not None:
+                    time.sleep(delay(text))
+                return AuditDecision(choice="有", reason=text)
+
+            return make_client(answer)
+
+        return make
+
+    def test_iter_accepts_generator_and_is_lazy(self, echo_client, item):
+        """测试生成器输入按需读取，已提交任务数受 max_pending 限制"""
+        client = echo_client()
+        manager = AuditManager(client=client, model="m", max_concurrency=2)
+        consumed = []
+
+        def contents():
+            for i in range(100):
+                consumed.append(i)
+                yield AuditContent(content=f"文本{i}")
+
+        it = manager.audit_iter(contents(), [item], ordered=True, max_pending=3)
+        first = next(it)
+
+        assert first.decision.reason == "文本0"
+        assert len(consumed) <= 4
+        it.close()
+        assert len(consumed) < 100
+
+    def test_iter_ordered(self, echo_client, item):
+        """测试 ordered=True 时按输入顺序产出，且共享 batch_id"""
+        client = echo_client(delay=lambda text: 0.05 if text == "文本0" else 0)
+        manager = AuditManager(client=client, model="m", max_concurrency=4)
+        contents = (AuditContent(content=f"文本{i}") for i in range(6))
+
+        results = list(manager.audit_iter(contents, [item], ordered=True))
+
+        assert [r.decision.reason for r in results] == [f"文本{i}" for i in range(6)]
+        assert len({r.batch_id for r in results}) == 1
+
+    def test_iter_completion_order(self, echo_client, item):
+        """测试默认按完成顺序产出，慢请求不阻塞其它结果"""
+        client = echo_client(delay=lambda text: 0.2 if text == "文本0" else 0)
+        manager = AuditManager(client=client, model="m", max_concurrency=4)
+        contents = [AuditContent(content=f"文本{i}") for i in range(4)]
+
+        results = list(manager.audit_iter(iter(contents), [item]))
+
+        assert results[-1].decision.reason == "文本0"
+        assert sorted(r.decision.reason for r in results) == [
+            f"文本{i}" for i in range(4)
+        ]
+
+    def test_iter_failure_handling(self, mocker, item):
+        """测试失败单元返回兜底结果且不中断迭代"""
+        client = mocker.Mock()
+        client.chat.completions.parse.side_effect = Exception("API错误")
+        manager = AuditManager(client=client, model="m")
+
+        results = list(
+            manager.audit_iter(
+                (AuditContent(content=f"文本{i}") for i in range(3)), [item]
+            )
+        )
+
+        assert len(results) == 3
+        assert all(r.decision.reason == "模型调用失败" for r in results)
+        with pytest.raises(ValueError):
+            next(manager.audit_iter([], [item], max_pending=0))
+
+
+class TestAuditManagerJournal:
+    """测试批量审核日志与断点续跑"""
+
+    def test_resume_skips_completed_cells(self, mocker, make_response, tmp_path):
+        """测试续跑时只审核剩余及失败的单元格"""
+        ok = make_response()
+        client = mocker.Mock()
+        client.chat.completions.parse.side_effect = [ok, Exception("API错误"), ok]
+        metrics = AuditMetrics()
+        manager = AuditManager(client=client, model="m", metrics=metrics)
+        item = AuditOptionsItem(name="项", instruction="指令", options={"有": "d"})
+        texts = [AuditContent(content=f"文本{i}") for i in range(3)]
+        batch_id = uuid4()
+
+        with BatchJournal(tmp_path / "journal.jsonl") as journal:
+            first = manager.audit_batch(
+                texts, [item], batch_id=batch_id, journal=journal
+            )
+        assert [r.status for r in first] == ["success", "failed", "success"]
+        assert first[0].batch_id == batch_id
+
+        client.chat.completions.parse.reset_mock(side_effect=True)
+        client.chat.completions.parse.return_value = ok
+        with BatchJournal(tmp_path / "journal.jsonl") as journal:
+            second = manager.audit_batch(
+                texts, [item], batch_id=batch_id, journal=journal
+            )
+
+        assert client.chat.completions.parse.call_count == 1
+        assert [r.status for r in second] == ["success"] * 3
+        assert [r.attempts for r in second] == [0, 1, 0]
+        assert [r.text_id for r in second] == [t.id for t in texts]
+        # 由日志恢复的结果不计入指标与用量：成功数为首次的 2 条加续跑的 1 条
+        assert metrics.results.value(model="m", item="项", status="success") == 3
+        assert metrics.results.value(model="", item="项", status="success") == 0
+        assert AuditUsageSummary.from_results(second).attempts == 1
+
+
+class TestAuditManagerClientPool:
+    """测试客户端池接入"""
+
+    def test_failover_to_healthy_endpoint(self, mocker, make_client):
+        """测试故障端点被摘除，重试与后续请求转向健康端点，并使用端点的模型覆盖"""
+        bad = make_client(
+            openai.InternalServerError(
+                "故障", response=mocker.Mock(status_code=503, headers={}), body=None
+            )
+        )
+        good = make_client()
+        pool = ClientPool(
+            [
+                PoolEndpoint(bad, name="bad"),
+                PoolEndpoint(good, name="good", model="good-model"),
+            ],
+            strategy="round_robin",
+            max_consecutive_failures=1,
+        )
+        manager = AuditManager(
+            client=pool, model="m", retry_policy=RetryPolicy(base_delay=0)
+        )
+        item = AuditOptionsItem(name="项", instruction="指令", options={"有": "d"})
+
+        results = manager.audit_batch(
+            [AuditContent(content=f"文本{i}") for i in range(3)], [item]
+        )
+
+        assert all(r.status == "success" for r in results)
+        assert bad.chat.completions.parse.call_count == 1
+        assert good.chat.completions.parse.call_count == 3
+        assert good.chat.completions.parse.call_args.kwargs["model"] == "good-model"
+        assert [s["healthy"] for s in pool.stats()] == [False, True]
+        assert manager.client is None
+
+
+class TestAuditManagerCascade:
+    """测试模型级联"""
+
+    @pytest.fixture
+    def item(self):
+        return AuditOptionsItem(
+            name="项",
+            instruction="指令",
+            options={"正常": "d", "违规": "d", "不确定": "d"},
+        )
+
+    @pytest.fixture
+    def answers_client(self, make_client, prompt_text):
+        """按 (模型, 文本) 返回预设标签的模拟客户端"""
+
+        def make(answers):
+            def answer(*, model, messages, response_format):
+                choice = answers[(model, prompt_text(messages))]
+                if isinstance(choice, Exception):
+                    return choice
+                return AuditDecision(choice=choice, reason=model)
+
+            return make_client(answer)
+
+        return make
+
+    def test_escalates_uncertain_and_configured_labels(self, answers_client, item):
+        """测试仅不确定、指定标签及快速模型失败的结论升级到主模型"""
+        client = answers_client(
+            {
+                ("fast", "a"): "正常",
+                ("fast", "b"): "不确定",
+                ("fast", "c"): "违规",
+                ("fast", "d"): Exception("快速模型失败"),
+                ("big", "b"): "违规",
+                ("big", "c"): "正常",
+                ("big", "d"): "正常",
+            },
+        )
+        manager = AuditManager(
+            client=client,
+            model="big",
+            cascade=ModelCascade("fast", escalate_labels=["违规"]),
+        )
+        texts = [AuditContent(content=t) for t in "abcd"]
+
+        results = manager.audit_batch(texts, [item])
+
+        assert [r.decision.choice for r in results] == ["正常", "违规", "正常", "正常"]
+        assert [r.model for r in results] == ["fast", "big", "big", "big"]
+        assert [r.escalated for r in results] == [False, True, True, True]
+        assert [r.attempts for r in results] == [1, 2, 2, 2]
+
+    def test_tiers_cached_separately(self, answers_client, item):
+        """测试两级结论按各自模型缓存，重复审核不再调用模型"""
+        client = answers_client({("fast", "a"): "不确定", ("big", "a"): "违规"})
+        manager = AuditManager(
+            client=client,
+            model="big",
+            cache=MemoryCache(),
+            cascade=ModelCascade("fast"),
+        )
+        content = AuditContent(content="a")
+
+        manager.audit_one(content, item)
+        result = manager.audit_one(content, item)
+
+        assert client.chat.completions.parse.call_count == 2
+        assert result.cache_hit is True
+        assert result.escalated is True
+        assert result.model == "big"
+        assert result.decision.choice == "违规"
+
+
+class TestAuditManagerPrefilter:
+    """测试审核项本地预过滤"""
+
+    @pytest.fixture
+    def item(self):
+        return AuditOptionsItem(
+            name="是否包含手机号",
+            instruction="指令",
+            options={"有": "d", "无": "d", "不确定": "d"},
+            prefilter=AuditPrefilter(
+                rules=[
+                    PrefilterRule(choice="有", patterns=[r"(?<!\d)1[3-9]\d{9}(?!\d)"])
+                ]
+            ),
+        )
+
+    @pytest.fixture
+    def client(self, make_client):
+        return make_client(choice="无")
+
+    def test_only_ambiguous_content_reaches_model(self, client, item):
+        """测试命中的文本与图片分别由预过滤与模型处理"""
+        manager = AuditManager(client=client, model="m")
+        contents = [
+            AuditContent(content="电话13812345678"),
+            AuditContent(content="普通文本"),
+            AuditContent(content="data:image/png;base64,xx", file_type="image"),
+        ]
+
+        results = manager.audit_batch(contents, [item])
+
+        assert [r.decision.choice for r in results] == ["有", "无", "无"]
+        assert [r.prefiltered for r in results] == [True, False, False]
+        assert results[0].attempts == 0
+        assert client.chat.completions.parse.call_count == 2
+
+    def test_prefilter_in_multi_item_and_packed(self, client, item):
+        """测试合并调用与打包审核同样跳过预过滤命中的条目"""
+        other = AuditOptionsItem(name="项2", instruction="指令", options={"无": "d"})
+        manager = AuditManager(client=client, model="m")
+
+        results = manager.audit_items(
+            AuditContent(content="电话13812345678"), [item, other]
+        )
+        assert [r.prefiltered for r in results] == [True, False]
+        assert (
+            client.chat.completions.parse.call_args.kwargs["response_format"]
+            is AuditDecision
+        )
+
+        results = manager.audit_packed(
+            [AuditContent(content="13812345678"), AuditContent(content="普通")],
+            item,
+        )
+        assert [r.decision.choice for r in results] == ["有", "无"]
+        assert client.chat.completions.parse.call_count == 2
+
+
+class TestAuditManagerHedging:
+    """测试 audit_one 对冲请求"""
+
+    def test_slow_primary_is_hedged(self, make_client):
+        """测试原请求超过对冲延迟时，备用客户端先返回的结果胜出"""
+        slow = make_client(delay=0.5, reason="slow")
+        fast = make_client(reason="fast")
+        policy = HedgePolicy(delay=0.05, max_hedge_rate=1.0, client=fast, model="m2")
+        manager = AuditManager(client=slow, model="m", hedge_policy=policy)
+        item = AuditOptionsItem(name="项", instruction="指令", options={"有": "d"})
+
+        started = time.perf_counter()
+        result = manager.audit_one(AuditContent(content="文本"), item)
+
+        assert time.perf_counter() - started < 0.4
+        assert result.decision.reason == "fast"
+        assert fast.chat.completions.parse.call_args.kwargs["model"] == "m2"
+        assert (policy.requests, policy.hedged, policy.hedge_wins) == (1, 1, 1)
+
+    def test_fast_primary_and_batch_not_hedged(self, make_client):
+        """测试原请求及时返回时不对冲，批量审核不使用对冲"""
+        client = make_client(reason="primary")
+        policy = HedgePolicy(delay=1.0, max_hedge_rate=1.0)
+        manager = AuditManager(client=client, model="m", hedge_policy=policy)
+        item = AuditOptionsItem(name="项", instruction="指令", options={"有": "d"})
+
+        result = manager.audit_one(AuditContent(content="文本"), item)
+        manager.audit_batch([AuditContent(content="文本2")], [item])
+
+        assert result.decision.reason == "primary"
+        assert policy.requests == 1
+        assert policy.hedged == 0
+        assert client.chat.completions.parse.call_count == 2
+
+    def test_requests_reuse_shared_executor(self, make_client):
+        """测试对冲模式的请求复用对冲策略的共享线程池，不为每次请求新建线程"""
+        threads = set()
+
+        def answer(*, model, messages, response_format):
+            threads.add(threading.current_thread())
+            time.sleep(0.02 if model == "m" else 0)
+            return AuditDecision(choice="有", reason=model)
+
+        policy = HedgePolicy(delay=0.01, max_hedge_rate=1.0, model="m2", max_workers=2)
+        manager = AuditManager(
+            client=make_client(answer), model="m", hedge_policy=policy
+        )
+        item = AuditOptionsItem(name="项", instruction="指令", options={"有": "d"})
+
+        for i in range(10):
+            manager.audit_one(AuditContent(content=f"文本{i}"), item)
+        policy.shutdown()
+
+        assert policy.hedged == 10
+        assert len(threads) <= 2
+        assert all(t.name.startswith("audit-hedge") for t in threads)
+
+
+class TestAuditManagerShortCircuit:
+    """测试阻断结论短路"""
+
+    @pytest.fixture
+    def items(self):
+        return [
+            AuditOptionsItem(
+                name=f"项{i}",
+                instruction="指令",
+                options={"违规": "d", "正常": "d"},
+                blocking_choices=["违规"],
+            )
+            for i in range(3)
+        ]
+
+    def test_remaining_items_skipped(self, make_client, prompt_text, items):
+        """测试阻断结论之后的审核项标记为 skipped 且不调用模型"""
+
+        def answer(*, model, messages, response_format):
+            name = messages[1]["content"].split("审核项：")[1].split("\n")[0]
+            blocked = (prompt_text(messages), name) == ("坏", "项1")
+            return AuditDecision(choice="违规" if blocked else "正常", reason="r")
+
+        client = make_client(answer)
+        manager = AuditManager(client=client, model="m", max_concurrency=2)
+        contents = [AuditContent(content="坏"), AuditContent(content="好")]
+
+        results = manager.audit_batch(contents, items, short_circuit=True)
+
+        assert [r.status for r in results] == ["success"] * 2 + ["skipped"] + [
+            "success"
+        ] * 3
+        assert results[2].item_name == "项2"
+        assert results[2].attempts == 0
+        assert "项1" in results[2].decision.reason
+        assert client.chat.completions.parse.call_count == 5
+
+    def test_failed_result_does_not_block(self, mocker, items):
+        """测试失败的兜底结论不触发短路，并与 combine_items 互斥"""
+        client = mocker.Mock()
+        client.chat.completions.parse.side_effect = Exception("API错误")
+        manager = AuditManager(client=client, model="m")
+
+        results = manager.audit_batch(
+            [AuditContent(content="文本")], items, short_circuit=True
+        )
+
+        assert [r.status for r in results] == ["failed"] * 3
+        with pytest.raises(ValueError):
+            manager.audit_batch(
+                [AuditContent(content="文本")],
+                items,
+                short_circuit=True,
+                combine_items=True,
+            )
+
+    def test_blocking_choices_validated(self):
+        with pytest.raises(ValueError):
+            AuditOptionsItem(
+                name="项",
+                instruction="指令",
+                options={"正常": "d"},
+                blocking_choices=["违规"],
+            )
+
+    def test_planner_orders_items(self, mocker, make_client, items):
+        """测试规划器让阻断率高的审核项先审核，结果仍按原顺序返回并记录统计"""
+
+        def answer(*, model, messages, response_format):
+            name = messages[1]["content"].split("审核项：")[1].split("\n")[0]
+            return AuditDecision(choice="违规" if name == "项2" else "正常", reason="r")
+
+        client = make_client(answer, usage=mocker.Mock(total_tokens=100))
+        planner = ItemPlanner()
+        manager = AuditManager(client=client, model="m", planner=planner)
+
+        manager.audit_batch([AuditContent(content="文本")], items, short_circuit=True)
+        assert client.chat.completions.parse.call_count == 3
+        assert planner.stats(items[2].id).blocks == 1
+        assert planner.stats(items[0].id).avg_tokens == 100
+
+        results = manager.audit_batch(
+            [AuditContent(content="文本2")], items, short_circuit=True
+        )
+        assert client.chat.completions.parse.call_count == 4
+        assert [r.item_name for r in results] == ["项0", "项1", "项2"]
+        assert [r.status for r in results] == ["skipped", "skipped", "success"]
+
+
+class TestAuditManagerScheduler:
+    """测试优先级调度"""
+
+    def test_interactive_jumps_bulk_backlog(self, make_client, prompt_text):
+        """测试积压的批量请求排队时，audit_one 先获得名额"""
+        gate = threading.Event()
+        calls = []
+
+        def answer(*, model, messages, response_format):
+            text = prompt_text(messages)
+            calls.append(text)
+            if text == "批量0":
+                gate.wait(2)
+            return AuditDecision(choice="有", reason=text)
+
+        client = make_client(answer)
+        scheduler = PriorityScheduler(1)
+        manager = AuditManager(client=client, model="m", scheduler=scheduler)
+        item = AuditOptionsItem(name="项", instruction="指令", options={"有": "d"})
+        contents = [AuditContent(content=f"批量{i}") for i in range(3)]
+
+        batch = threading.Thread(
+            target=manager.audit_batch,
+            args=(contents, [item]),
+            kwargs={"max_concurrency": 3, "tenant": "backfill"},
+        )
+        batch.start()
+        deadline = time.monotonic() + 2
+        while scheduler.waiting["bulk"] < 2:
+            assert time.monotonic() < deadline
+            time.sleep(0.005)
+
+        one = threading.Thread(
+            target=manager.audit_one, args=(AuditContent(content="实时"), item)
+        )
+        one.start()
+        while scheduler.waiting["interactive"] < 1:
+            assert time.monotonic() < deadline
+            time.sleep(0.005)
+        gate.set()
+        batch.join(2)
+        one.join(2)
+
+        assert calls[:2] == ["批量0", "实时"]
+        assert sorted(calls[2:]) == ["批量1", "批量2"]
+        assert scheduler.in_flight == 0
+
+    def test_interactive_jumps_bulk_with_shrunk_limiter(
+        self, mocker, make_client, prompt_text
+    ):
+        """测试并发限制器收缩后批量请求不占着名额排队，audit_one 仍先于积压的批量请求"""
+        gate = threading.Event()
+        calls = []
+
+        def answer(*, model, messages, response_format):
+            text = prompt_text(messages)
+            calls.append(text)
+            if text == "批量0":
+                gate.wait(2)
+            return AuditDecision(choice="有", reason=text)
+
+        limiter = AdaptiveConcurrencyLimiter(4, max_limit=4, increase=0, cooldown=0)
+        error = openai.RateLimitError(
+            "限流", response=mocker.Mock(status_code=429, headers={}), body=None
+        )
+        for _ in range(2):
+            limiter.acquire()
+            limiter.release(error=error)
+        scheduler = PriorityScheduler(4)
+        manager = AuditManager(
+            client=make_client(answer),
+            model="m",
+            scheduler=scheduler,
+            concurrency_limiter=limiter,
+        )
+        item = AuditOptionsItem(name="项", instruction="指令", options={"有": "d"})
+        contents = [AuditContent(content=f"批量{i}") for i in range(4)]
+
+        batch = threading.Thread(
+            target=manager.audit_batch,
+            args=(contents, [item]),
+            kwargs={"max_concurrency": 4},
+        )
+        batch.start()
+        deadline = time.monotonic() + 2
+        while scheduler.waiting["bulk"] < 3:
+            assert time.monotonic() < deadline
+            time.sleep(0.005)
+
+        one = threading.Thread(
+            target=manager.audit_one, args=(AuditContent(content="实时"), item)
+        )
+        one.start()
+        while scheduler.waiting["interactive"] < 1:
+            assert time.monotonic() < deadline
+            time.sleep(0.005)
+        assert scheduler.in_flight == 1
+        gate.set()
+        batch.join(2)
+        one.join(2)
+
+        assert calls[:2] == ["批量0", "实时"]
+        assert (scheduler.in_flight, limiter.in_flight) == (0, 0)
+
+    def test_priority_override(self, mocker, make_client):
+        """测试方法级 priority 与 tenant 覆盖"""
+        content = AuditContent(content="文本")
+        item = AuditOptionsItem(name="项", instruction="指令", options={"有": "d"})
+        client = make_client()
+        scheduler = PriorityScheduler(2)
+        spy = mocker.spy(scheduler, "acquire")
+        manager = AuditManager(client=client, model="m", scheduler=scheduler)
+
+        manager.audit_one(content, item, priority="bulk", tenant="t")
+        manager.audit_batch([content], [item], priority="interactive")
+
+        assert spy.call_args_list[0] == mocker.call("bulk", tenant="t")
+        assert spy.call_args_list[1] == mocker.call("interactive", tenant=None)
+
+
+class TestAuditManagerUsage:
+    """测试调用用量记录与批量汇总"""
+
+    @pytest.fixture
+    def usage(self, mocker):
+        return mocker.Mock(
+            prompt_tokens=80,
+            completion_tokens=20,
+            total_tokens=100,
+            prompt_tokens_details=mocker.Mock(cached_tokens=30),
+        )
+
+    def test_result_usage(self, make_client, usage):
+        """测试单条结果记录 token 用量与耗时，缓存命中时用量为 0"""
+        client = make_client(usage=usage)
+        manager = AuditManager(client=client, model="m", cache=MemoryCache())
+        item = AuditOptionsItem(name="项", instruction="指令", options={"有": "d"})
+        content = AuditContent(content="文本")
+
+        result = manager.audit_one(content, item)
+        cached = manager.audit_one(content, item)
+
+        recorded = result.usage
+        assert (recorded.prompt_tokens, recorded.completion_tokens) == (80, 20)
+        assert (recorded.cached_tokens, recorded.total_tokens) == (30, 100)
+        assert recorded.shared == 1
+        assert recorded.latency > 0
+        assert cached.cache_hit
+        assert cached.usage.total_tokens == 0
+
+    def test_combined_usage_summary(self, make_client, usage):
+        """测试合并调用的用量在汇总时按 shared 分摊只计一次"""
+        items = [
+            AuditOptionsItem(name=f"项{i}", instruction="指令", options={"有": "d"})
+            for i in range(2)
+        ]
+        parsed = create_multi_decision_model(items)(
+            **{
+                multi_decision_field(i): AuditDecision(choice="有", reason="r")
+                for i in range(len(items))
+            }
+        )
+        client = make_client(parsed, usage=usage)
+        manager = AuditManager(client=client, model="m")
+        contents = [AuditContent(content=f"文本{i}") for i in range(3)]
+
+        results = manager.audit_batch(contents, items, combine_items=True)
+        summary = AuditUsageSummary.from_results(results)
+
+        assert all(r.usage.shared == 2 for r in results)
+        assert (summary.results, summary.success, summary.attempts) == (6, 6, 3)
+        assert summary.total_tokens == 300
+        assert summary.prompt_tokens == 240
+        assert summary.cached_tokens == 90
+        assert summary.avg_latency == pytest.approx(summary.latency / 3)
+
+
+class TestAuditManagerMetrics:
+    """测试审核指标"""
+
+    def test_metrics_recorded(self, mocker, make_response):
+        """测试请求结果（含 429）、兜底次数、阶段耗时与在途请求数"""
+        item = AuditOptionsItem(
+            name="测试项", instruction="测试指令", options={"有": "desc", "无": "desc"}
+        )
+        client = mocker.Mock()
+        rate_limited = openai.RateLimitError(
+            "错误", response=mocker.Mock(status_code=429, headers={}), body=None
+        )
+        ok = make_response(
+            choice="无",
+            usage=mocker.Mock(prompt_tokens=80, completion_tokens=20, total_tokens=100),
+        )
+        client.chat.completions.parse.side_effect = [rate_limited, ok] + [
+            rate_limited
+        ] * 2
+        metrics = AuditMetrics()
+        manager = AuditManager(
+            client=client,
+            model="m",
+            retry_policy=RetryPolicy(base_delay=0, max_attempts=2),
+            metrics=metrics,
+        )
+
+        manager.audit_batch([AuditContent(content="文本")], [item])
+        manager.audit_batch([AuditContent(content="文本2")], [item])
+
+        assert metrics.requests.value(model="m", outcome="success") == 1
+        assert metrics.requests.value(model="m", outcome="rate_limited") == 3
+        assert metrics.rate_limited.value(model="m") == 3
+        assert metrics.results.value(model="m", item="测试项", status="success") == 1
+        assert metrics.results.value(model="m", item="测试项", status="failed") == 1
+        assert metrics.fallbacks.value(item="测试项") == 1
+        assert metrics.tokens.value(model="m", type="prompt") == 80
+        assert metrics.stage_seconds.count(stage="prompt_build") == 2
+        assert metrics.stage_seconds.count(stage="network") == 1
+        assert metrics.stage_seconds.count(stage="parse") == 1
+        assert metrics.in_flight.value() == 0
+
+        text = metrics.exposition()
+        assert "# TYPE ai_audit_stage_seconds histogram" in text
+        assert 'ai_audit_fallbacks_total{item="测试项"} 1' in text
+
+    def test_concurrency_limiter_gauges(self, mocker, make_client):
+        """测试配置并发限制器时输出其当前并发上限与在途请求数，未配置时不输出"""
+        item = AuditOptionsItem(name="项", instruction="指令", options={"有": "d"})
+        limiter = AdaptiveConcurrencyLimiter(4, max_limit=8, cooldown=0)
+        metrics = AuditMetrics()
+        seen = []
+
+        def answer(*, model, messages, response_format):
+            seen.append(metrics.exposition())
+            return AuditDecision(choice="有", reason="r")
+
+        manager = AuditManager(
+            client=make_client(answer),
+            model="m",
+            concurrency_limiter=limiter,
+            metrics=metrics,
+        )
+        assert "ai_audit_concurrency_limit 4\n" in metrics.exposition()
+
+        manager.audit_one(AuditContent(content="文本"), item)
+        error = openai.RateLimitError(
+            "限流", response=mocker.Mock(status_code=429, headers={}), body=None
+        )
+        limiter.acquire()
+        limiter.release(error=error)
+
+        assert "ai_audit_concurrency_limiter_in_flight 1\n" in seen[0]
+        text = metrics.exposition()
+        assert f"ai_audit_concurrency_limit {limiter.limit}\n" in text
+        assert limiter.limit == 2
+        assert "ai_audit_concurrency_limiter_in_flight 0\n" in text
+        assert "concurrency_limit" not in AuditMetrics().exposition()
+
+
+class TestAuditManagerTracing:
+    """测试本地追踪"""
+
+    def test_spans_recorded(self, make_client):
+        """测试批量审核的 span 层级与属性"""
+        item = AuditOptionsItem(
+            name="测试项", instruction="测试指令", options={"有": "desc", "无": "desc"}
+        )
+        client = make_client(choice="无")
+        exporter = MemorySpanExporter()
+        manager = AuditManager(client=client, model="m", tracer=Tracer(exporter))
+
+        content = AuditContent(content="文本")
+        results = manager.audit_batch([content], [item])
+
+        spans = exporter.spans
+        by_name = {s["name"]: s for s in spans}
+        by_id = {s["span_id"]: s for s in spans}
+        assert {
+            "audit.batch",
+            "audit.unit",
+            "prompt.build",
+            "model.attempt",
+            "http.request",
+            "audit.parse",
+        } <= set(by_name)
+        assert by_name["audit.batch"]["attributes"]["batch_id"] == str(
+            results[0].batch_id
+        )
+        assert by_name["audit.unit"]["attributes"]["text_id"] == str(content.id)
+        assert by_name["http.request"]["attributes"]["model"] == "m"
+        assert {s["trace_id"] for s in spans} == {by_name["audit.batch"]["trace_id"]}
+        parent = by_id[by_name["http.request"]["parent_id"]]
+        assert parent["name"] == "model.attempt"
+        assert by_id[by_name["prompt.build"]["parent_id"]]["name"] != "audit.batch"
@@ -0,0 +1,136 @@
+import json
+import pytest
+from openai import OpenAI
+from ai_content_audit.audit_manager import AuditManager
+from benchmarks.chaos import run_chaos
+from benchmarks.micro import MicroReport, make_cases, run_micro
+from benchmarks.micro import main as micro_main
+from benchmarks.fake_server import FakeOpenAIServer, FaultProfile, parse_latency
+from benchmarks.throughput import (
+    MODES,
+    BenchmarkReport,
+    compare_reports,
+    main,
+    make_dataset,
+)
+
+
+class TestFakeServer:
+    """测试 OpenAI 兼容服务替身"""
+
+    def test_structured_output_round_trip(self):
+        """测试单审核项、多审核项与打包请求均得到合法的结构化输出"""
+        contents, items = make_dataset(3, 2)
+        with FakeOpenAIServer() as server:
+            client = OpenAI(base_url=server.base_url, api_key="x", max_retries=0)
+            manager = AuditManager(client=client, model="fake")
+
+            single = manager.audit_batch(contents, items)
+            combined = manager.audit_batch(contents, items, combine_items=True)
+            packed = manager.audit_packed(contents, items[0])
+
+            assert server.requests == 6 + 3 + 1
+        for result in single + combined + packed:
+            assert result.status == "success"
+            assert result.decision.choice == "合规"
+            assert result.usage.total_tokens > 0
+
+    def test_parse_latency(self):
+        """测试延迟分布解析"""
+        assert parse_latency("0.5")() == 0.5
+        assert parse_latency("constant:0.1")() == 0.1
+        assert 0.1 <= parse_latency("uniform:0.1,0.2", seed=1)() <= 0.2
+        assert parse_latency("lognormal:0.05,0.5", seed=1)() > 0
+        with pytest.raises(ValueError):
+            parse_latency("pareto:1,2")
+
+
+class TestThroughputBenchmark:
+    """测试吞吐基准"""
+
+    def test_report(self, tmp_path, capsys):
+        """测试各模式的报告写入 JSON 并可与基线对比"""
+        output = tmp_path / "report.json"
+        argv = ["--texts", "4", "--latency", "0", "--output", str(output)]
+        main(argv)
+        main(argv + ["--baseline", str(output)])
+
+        report = BenchmarkReport.model_validate(json.loads(output.read_text("utf-8")))
+        modes = {m.mode: m for m in report.modes}
+        assert list(modes) == list(MODES)
+        assert all(m.audits == 8 and m.failed == 0 for m in report.modes)
+        assert modes["sequential"].http_requests == 8
+        assert modes["packed"].http_requests == 2
+        assert modes["cached"].http_requests == 0
+        assert report.config["texts"] == 4
+        assert "packed" in compare_reports(report, report)
+        assert "audits/s" in capsys.readouterr().out
+
+
+class TestChaos:
+    """测试故障注入压测"""
+
+    def test_fault_profile_total(self):
+        """测试故障比例之和超过 1 时报错"""
+        with pytest.raises(ValueError):
+            FaultProfile(rate_limit=0.6, server_error=0.6)
+
+    def test_malformed_output_falls_back(self):
+        """测试非法结构化输出不重试，直接兜底"""
+        report = run_chaos(FaultProfile(malformed=1.0), texts=3, items=1, latency="0")
+
+        assert report.failed == 3
+        assert report.fallback_rate == 1.0
+        assert report.http_requests == 3
+        assert report.injected["malformed"] == 3
+
+    def test_retryable_faults(self):
+        """测试 429、503 与连接重置被重试，重试耗尽后兜底"""
+        report = run_chaos(
+            FaultProfile(
+                rate_limit=0.2, retry_after=0, server_error=0.2, reset=0.2, seed=0
+            ),
+            texts=10,
+            items=1,
+            latency="0",
+            max_attempts=2,
+            base_delay=0,
+        )
+        injected = report.injected
+
+        assert report.audits == 10
+        assert report.http_requests == sum(injected.values()) == report.attempts
+        assert report.success == injected["ok"]
+        assert report.wasted_calls == report.http_requests - report.success
+        assert report.http_requests > report.audits
+        assert 0 < report.latency_p50 <= report.latency_max
+
+
+class TestMicroBenchmark:
+    """测试微基准"""
+
+    def test_cases(self, tmp_path):
+        """测试各用例可执行，图像夹具为合法 PNG"""
+        cases = make_cases(tmp_path)
+
+        for fn in cases.values():
+            fn()
+        image = cases["MediaLoader.from_file[png]"]()
+        assert image.file_type == "image"
+        assert image.content.startswith("data:image/png;base64,")
+
+    def test_report(self, tmp_path):
+        """测试按名称过滤用例并写入 JSON 报告"""
+        report = run_micro(filters=["AuditContent"], number=10, repeat=2, alloc_calls=5)
+        assert [r.name for r in report.results] == [
+            "AuditContent[init]",
+            "AuditContent[validate]",
+        ]
+        assert all(r.best > 0 and r.peak_bytes > 0 for r in report.results)
+
+        output = tmp_path / "micro.json"
+        micro_main(
+            ["base64", "--number", "5", "--repeat", "1", "--output", str(output)]
+        )
+        saved = MicroReport.model_validate_json(output.read_text("utf-8"))
+        assert [r.name for r in saved.results] == ["base64[png]"]
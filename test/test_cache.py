@@ -0,0 +1,116 @@
+import hashlib
+import time
+import pytest
+from ai_content_audit.cache import (
+    MemoryCache,
+    SQLiteCache,
+    item_fingerprint,
+    make_cache_key,
+)
+from ai_content_audit.models import AuditContent, AuditDecision, AuditOptionsItem
+
+
+@pytest.fixture
+def item():
+    return AuditOptionsItem(
+        name="测试项", instruction="测试指令", options={"有": "desc", "无": "desc"}
+    )
+
+
+@pytest.fixture
+def decision():
+    return AuditDecision(choice="有", reason="理由")
+
+
+class TestCacheKey:
+    """测试缓存键生成"""
+
+    def test_same_content_same_key(self, item):
+        """测试内容相同（ID 不同）时缓存键相同"""
+        a = AuditContent(content="文本", source="a")
+        b = AuditContent(content="文本", source="b")
+        assert make_cache_key(a, item, "m") == make_cache_key(b, item, "m")
+
+    def test_key_changes(self, item):
+        """测试内容、审核项说明或模型变化时缓存键变化"""
+        content = AuditContent(content="文本")
+        base = make_cache_key(content, item, "m")
+        changed_item = AuditOptionsItem(
+            name="测试项", instruction="新指令", options={"有": "desc", "无": "desc"}
+        )
+        # id 仅由 name 与选项标签决定，指纹还包含 instruction
+        assert changed_item.id == item.id
+        assert item_fingerprint(changed_item) != item_fingerprint(item)
+        assert make_cache_key(content, changed_item, "m") != base
+        assert make_cache_key(content, item, "other") != base
+        assert make_cache_key(AuditContent(content="其它"), item, "m") != base
+
+    def test_fingerprint_memoized(self, item, mocker):
+        """测试审核项指纹按字段取值复用，修改字段后重新计算"""
+        fingerprint = item_fingerprint(item)
+        sha256 = mocker.spy(hashlib, "sha256")
+        assert item_fingerprint(item) == fingerprint
+        sha256.assert_not_called()
+
+        item.instruction = "修改后的指令"
+        assert item_fingerprint(item) != fingerprint
+
+
+class TestMemoryCache:
+    """测试 MemoryCache"""
+
+    def test_get_set(self, decision):
+        cache = MemoryCache()
+        assert cache.get("k") is None
+        cache.set("k", decision)
+        assert cache.get("k") == decision
+        assert cache.get("k") is not decision
+
+    def test_lru_eviction(self, decision):
+        """测试超过容量时淘汰最久未使用条目"""
+        cache = MemoryCache(maxsize=2)
+        cache.set("a", decision)
+        cache.set("b", decision)
+        cache.get("a")
+        cache.set("c", decision)
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert len(cache) == 2
+
+    def test_ttl(self, decision):
+        """测试条目过期"""
+        cache = MemoryCache(ttl=0.01)
+        cache.set("k", decision)
+        time.sleep(0.02)
+        assert cache.get("k") is None
+
+    def test_invalid_args(self):
+        with pytest.raises(ValueError):
+            MemoryCache(maxsize=0)
+        with pytest.raises(ValueError):
+            MemoryCache(ttl=0)
+
+
+class TestSQLiteCache:
+    """测试 SQLiteCache"""
+
+    def test_persistent_across_instances(self, tmp_path, decision):
+        """测试不同实例（模拟不同进程）共享同一数据库文件"""
+        path = tmp_path / "cache.db"
+        first = SQLiteCache(path)
+        first.set("k", decision)
+        first.close()
+
+        second = SQLiteCache(path)
+        assert second.get("k") == decision
+        second.clear()
+        assert second.get("k") is None
+        second.close()
+
+    def test_ttl(self, tmp_path, decision):
+        """测试条目过期"""
+        cache = SQLiteCache(tmp_path / "cache.db", ttl=0.01)
+        cache.set("k", decision)
+        time.sleep(0.02)
+        assert cache.get("k") is None
+        cache.close()
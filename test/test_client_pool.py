@@ -0,0 +1,100 @@
+import time
+import openai
+import pytest
+from ai_content_audit.runtime import ClientPool, PoolEndpoint, is_endpoint_error
+
+
+def status_error(mocker, cls, status):
+    return cls("错误", response=mocker.Mock(status_code=status, headers={}), body=None)
+
+
+class TestIsEndpointError:
+    """测试端点错误分类"""
+
+    def test_classification(self, mocker):
+        assert is_endpoint_error(status_error(mocker, openai.RateLimitError, 429))
+        assert is_endpoint_error(status_error(mocker, openai.AuthenticationError, 401))
+        assert is_endpoint_error(status_error(mocker, openai.InternalServerError, 500))
+        assert not is_endpoint_error(status_error(mocker, openai.BadRequestError, 400))
+        assert not is_endpoint_error(ValueError("解析失败"))
+
+
+class TestClientPool:
+    """测试客户端池"""
+
+    def test_weighted_round_robin(self):
+        """测试平滑加权轮询按权重分配"""
+        pool = ClientPool(
+            [PoolEndpoint("a", name="a", weight=2), PoolEndpoint("b", name="b")],
+            strategy="round_robin",
+        )
+        picks = []
+        for _ in range(6):
+            endpoint = pool.acquire()
+            picks.append(endpoint.name)
+            pool.release(endpoint, latency=0.1)
+        # 平滑：高权重端点的请求被打散而非连续集中
+        assert picks == ["a", "b", "a", "a", "b", "a"]
+
+    def test_least_outstanding(self):
+        """测试优先选择在途请求少的端点，平局时轮转"""
+        pool = ClientPool(["a", "b"])
+        first = pool.acquire()
+        second = pool.acquire()
+        assert first is not second
+        pool.release(first, latency=0.1)
+        assert pool.acquire() is first
+
+        pool.release(first, latency=0.1)
+        pool.release(second, latency=0.1)
+        names = set()
+        for _ in range(4):
+            endpoint = pool.acquire()
+            names.add(endpoint.client)
+            pool.release(endpoint, latency=0.1)
+        assert names == {"a", "b"}
+
+    def test_ejection_and_recovery(self, mocker):
+        """测试连续失败后摘除端点，摘除期满后恢复"""
+        pool = ClientPool(["a", "b"], max_consecutive_failures=2, ejection_time=0.05)
+        bad = pool.endpoints[0]
+        error = status_error(mocker, openai.InternalServerError, 503)
+        for _ in range(2):
+            bad.outstanding += 1
+            pool.release(bad, error=error)
+
+        assert not bad.healthy
+        assert all(pool.acquire().client == "b" for _ in range(3))
+        assert pool.stats()[0]["healthy"] is False
+
+        time.sleep(0.06)
+        assert bad.healthy
+        bad.outstanding += 1
+        pool.release(bad, latency=0.1)
+        assert bad.ejections == 0
+
+    def test_request_errors_do_not_eject(self, mocker):
+        """测试请求本身的错误不影响端点健康"""
+        pool = ClientPool(["a"], max_consecutive_failures=1)
+        endpoint = pool.acquire()
+        pool.release(endpoint, error=status_error(mocker, openai.BadRequestError, 400))
+        assert endpoint.healthy
+        assert endpoint.outstanding == 0
+        assert endpoint.failures == 0
+
+    def test_all_ejected_fails_open(self, mocker):
+        """测试全部端点被摘除时仍选择最早恢复的端点"""
+        pool = ClientPool(["a", "b"], max_consecutive_failures=1, ejection_time=10)
+        error = status_error(mocker, openai.InternalServerError, 500)
+        for endpoint in pool.endpoints:
+            endpoint.outstanding += 1
+            pool.release(endpoint, error=error)
+        assert pool.acquire().client == "a"
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            ClientPool([])
+        with pytest.raises(ValueError):
+            ClientPool(["a"], strategy="random")
+        with pytest.raises(ValueError):
+            PoolEndpoint("a", weight=0)
@@ -0,0 +1,44 @@
+import pytest
+from ai_content_audit.runtime import HedgePolicy
+
+
+class TestHedgePolicy:
+    """测试对冲请求策略"""
+
+    def test_fixed_and_initial_delay(self):
+        """测试固定延迟与样本不足时的初始延迟"""
+        assert HedgePolicy(delay=0.2).delay() == 0.2
+        policy = HedgePolicy(initial_delay=1.5, min_samples=5)
+        for _ in range(4):
+            policy.observe(0.1)
+        assert policy.delay() == 1.5
+
+    def test_percentile_delay(self):
+        """测试按延迟分位数计算对冲延迟，并受上下限约束"""
+        policy = HedgePolicy(percentile=90, min_samples=10, min_delay=0.0)
+        for i in range(1, 101):
+            policy.observe(i / 100)
+        assert policy.delay() == pytest.approx(0.9)
+
+        policy.max_delay = 0.5
+        assert policy.delay() == 0.5
+
+    def test_hedge_budget(self):
+        """测试对冲率上限与统计"""
+        policy = HedgePolicy(delay=0, max_hedge_rate=0.25)
+        allowed = []
+        for _ in range(8):
+            policy.delay()
+            allowed.append(policy.try_hedge())
+        assert allowed.count(True) == 2
+        assert policy.requests == 8
+        assert policy.hedged == 2
+        assert policy.hedge_rate == 0.25
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            HedgePolicy(percentile=0)
+        with pytest.raises(ValueError):
+            HedgePolicy(max_hedge_rate=1.5)
+        with pytest.raises(ValueError):
+            HedgePolicy(max_workers=0)
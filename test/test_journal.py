@@ -0,0 +1,53 @@
+from uuid import uuid4
+import pytest
+from ai_content_audit.journal import BatchJournal
+from ai_content_audit.models import (
+    AuditContent,
+    AuditDecision,
+    AuditOptionsItem,
+    AuditResult,
+)
+
+
+@pytest.fixture
+def result():
+    content = AuditContent(content="文本")
+    item = AuditOptionsItem(name="测试项", instruction="测试指令", options={"有": "d"})
+    return AuditResult(
+        text_id=content.id,
+        item_id=item.id,
+        item_name=item.name,
+        text_excerpt=content.content,
+        decision=AuditDecision(choice="有", reason="理由"),
+    )
+
+
+class TestBatchJournal:
+    """测试批量审核日志"""
+
+    def test_record_and_load(self, tmp_path, result):
+        """测试记录跨实例持久化，并按批次隔离"""
+        path = tmp_path / "journal.jsonl"
+        batch_id = uuid4()
+        with BatchJournal(path) as journal:
+            journal.record(batch_id, "k1", result)
+            journal.record(uuid4(), "k2", result)
+
+        with BatchJournal(path) as journal:
+            completed = journal.load(batch_id)
+            assert journal.load(uuid4()) == {}
+        assert list(completed) == ["k1"]
+        assert completed["k1"].choice == "有"
+
+    def test_ignores_truncated_line(self, tmp_path, result):
+        """测试崩溃留下的不完整行被忽略，且不影响后续追加"""
+        path = tmp_path / "journal.jsonl"
+        batch_id = uuid4()
+        with BatchJournal(path) as journal:
+            journal.record(batch_id, "k1", result)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"batch_id": "' + str(batch_id) + '", "key": "k2", "deci')
+
+        with BatchJournal(path) as journal:
+            journal.record(batch_id, "k3", result)
+            assert sorted(journal.load(batch_id)) == ["k1", "k3"]
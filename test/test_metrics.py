@@ -0,0 +1,74 @@
+import pytest
+from ai_content_audit.metrics import MetricsRegistry
+
+
+class TestMetricsRegistry:
+    """测试指标注册表与 Prometheus 文本格式"""
+
+    def test_counter_and_gauge_exposition(self):
+        """测试计数器与仪表的文本格式及标签转义"""
+        registry = MetricsRegistry()
+        counter = registry.counter("jobs_total", "任务数", ("kind",))
+        gauge = registry.gauge("in_flight", "在途数")
+        counter.inc(kind='a"b')
+        counter.inc(2, kind="plain")
+        gauge.inc()
+        gauge.inc()
+        gauge.dec()
+
+        assert registry.exposition() == (
+            "# HELP in_flight 在途数\n"
+            "# TYPE in_flight gauge\n"
+            "in_flight 1\n"
+            "# HELP jobs_total 任务数\n"
+            "# TYPE jobs_total counter\n"
+            'jobs_total{kind="a\\"b"} 1\n'
+            'jobs_total{kind="plain"} 2\n'
+        )
+
+    def test_gauge_function(self):
+        """测试仪表在读取时调用取值函数，set 后取消函数"""
+        registry = MetricsRegistry()
+        gauge = registry.gauge("limit", "上限")
+        current = [3]
+        gauge.set_function(lambda: current[0])
+        current[0] = 5
+
+        assert gauge.value() == 5
+        assert "limit 5\n" in registry.exposition()
+        gauge.set(1)
+        current[0] = 7
+        assert gauge.value() == 1
+
+    def test_histogram_exposition(self):
+        """测试直方图的累计桶、总和与次数"""
+        registry = MetricsRegistry()
+        histogram = registry.histogram(
+            "latency_seconds", "耗时", ("stage",), buckets=(0.1, 1.0)
+        )
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value, stage="net")
+
+        lines = registry.exposition().splitlines()
+        assert lines[2:] == [
+            'latency_seconds_bucket{stage="net",le="0.1"} 2',
+            'latency_seconds_bucket{stage="net",le="1"} 3',
+            'latency_seconds_bucket{stage="net",le="+Inf"} 4',
+            'latency_seconds_sum{stage="net"} 3.65',
+            'latency_seconds_count{stage="net"} 4',
+        ]
+        assert histogram.count(stage="net") == 4
+
+    def test_register_and_validate(self):
+        """测试重复注册复用实例，类型或标签冲突、标签不匹配时报错"""
+        registry = MetricsRegistry()
+        counter = registry.counter("a_total", "a", ("x",))
+        assert registry.counter("a_total", "a", ("x",)) is counter
+        with pytest.raises(ValueError):
+            registry.gauge("a_total", "a", ("x",))
+        with pytest.raises(ValueError):
+            counter.inc(y="1")
+        with pytest.raises(ValueError):
+            counter.inc(-1, x="1")
+        with pytest.raises(ValueError):
+            registry.counter("bad-name", "a")
@@ -0,0 +1,157 @@
+import json
+from ai_content_audit.models import (
+    AuditContent,
+    AuditOptionsItem,
+    AuditPrefilter,
+    PrefilterRule,
+)
+from ai_content_audit.offline import (
+    export_batch_requests,
+    ingest_batch_results,
+    make_custom_id,
+)
+from ai_content_audit.prompts import build_messages
+
+
+def _items():
+    return [
+        AuditOptionsItem(
+            name="广告",
+            instruction="是否为广告",
+            options={"是": "d", "否": "d", "不确定": "d"},
+        ),
+        AuditOptionsItem(
+            name="电话",
+            instruction="是否包含电话",
+            options={"有": "d", "无": "d"},
+            prefilter=AuditPrefilter(
+                rules=[PrefilterRule(choice="有", keywords=["电话"])]
+            ),
+        ),
+    ]
+
+
+def _output(custom_id, content, *, status=200, usage=None):
+    body = {
+        "id": "chatcmpl-1",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "m-2024",
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": usage,
+    }
+    return {
+        "id": f"batch_req_{custom_id[:8]}",
+        "custom_id": custom_id,
+        "response": {"status_code": status, "request_id": "r", "body": body},
+        "error": None,
+    }
+
+
+class TestOfflineBatch:
+    """测试离线批量审核的导出与导入"""
+
+    def test_export(self, tmp_path):
+        """测试导出的请求行、确定性 custom_id、去重与预过滤跳过"""
+        items = _items()
+        contents = [
+            AuditContent(content="买一送一"),
+            AuditContent(content="请拨打电话"),
+            AuditContent(content="买一送一"),
+        ]
+        path = tmp_path / "requests.jsonl"
+
+        assert export_batch_requests(path, contents, items, "m") == 3
+        lines = [json.loads(line) for line in path.read_text("utf-8").splitlines()]
+        assert len(lines) == 3
+        first = lines[0]
+        assert first["method"] == "POST"
+        assert first["url"] == "/v1/chat/completions"
+        assert first["body"]["model"] == "m"
+        assert first["body"]["messages"] == build_messages(contents[0], items[0])
+        assert first["body"]["response_format"]["json_schema"]["strict"] is True
+        # 与 AuditContent.id 无关，重新构建输入得到相同的 custom_id
+        assert first["custom_id"] == make_custom_id(
+            AuditContent(content="买一送一"), items[0], "m"
+        )
+        assert first["custom_id"] != make_custom_id(contents[0], items[0], "m2")
+
+    def test_ingest(self, tmp_path):
+        """测试导入结果：规范化、用量分摊、缺失 / 出错 / 非法输出兜底与预过滤"""
+        items = _items()
+        ad, phone = items
+        contents = [
+            AuditContent(content="买一送一"),
+            AuditContent(content="今天天气好"),
+            AuditContent(content="请拨打电话"),
+            AuditContent(content="买一送一"),
+            AuditContent(content="无效输出"),
+            AuditContent(content="缺失"),
+        ]
+        cid = [make_custom_id(c, ad, "m") for c in contents]
+        output = tmp_path / "output.jsonl"
+        errors = tmp_path / "errors.jsonl"
+        output.write_text(
+            "\n".join(
+                json.dumps(line, ensure_ascii=False)
+                for line in [
+                    _output(
+                        cid[0],
+                        '{"choice": "是", "reason": "促销"}',
+                        usage={
+                            "prompt_tokens": 90,
+                            "completion_tokens": 10,
+                            "total_tokens": 100,
+                        },
+                    ),
+                    _output(cid[1], '{"choice": "可能", "reason": " "}'),
+                    _output(cid[4], '{"choice": "是"'),
+                ]
+            )
+            + "\n{truncated",
+            encoding="utf-8",
+        )
+        errors.write_text(
+            json.dumps(
+                {
+                    "id": "batch_req_x",
+                    "custom_id": cid[2],
+                    "response": None,
+                    "error": {"code": "server_error", "message": "boom"},
+                }
+            ),
+            encoding="utf-8",
+        )
+
+        results = ingest_batch_results([output, errors], contents, [ad], "m")
+        assert len({r.batch_id for r in results}) == 1
+        assert [r.status for r in results] == [
+            "success",
+            "success",
+            "failed",
+            "success",
+            "failed",
+            "failed",
+        ]
+        assert results[0].decision.choice == "是"
+        assert results[0].model == "m-2024"
+        assert results[0].attempts == 1
+        assert results[0].usage.total_tokens == 100
+        assert results[0].usage.shared == 2
+        assert results[3].decision == results[0].decision
+        assert results[1].decision.choice == "不确定"
+        assert results[1].decision.reason == "基于文本与选项说明给出的判定"
+        assert results[2].decision.reason == "模型调用失败"
+        assert results[5].attempts == 0
+
+        prefiltered = ingest_batch_results(output, contents[2:3], items, "m")
+        assert prefiltered[0].status == "failed"
+        assert prefiltered[1].prefiltered
+        assert prefiltered[1].decision.choice == "有"
+        assert prefiltered[1].item_id == phone.id
@@ -0,0 +1,62 @@
+from ai_content_audit.models import AuditOptionsItem
+from ai_content_audit.runtime import ItemPlanner
+
+
+def make_item(name, blocking=True):
+    return AuditOptionsItem(
+        name=name,
+        instruction="指令",
+        options={"违规": "d", "正常": "d"},
+        blocking_choices=["违规"] if blocking else [],
+    )
+
+
+class TestItemPlanner:
+    """测试审核项排序规划器"""
+
+    def test_plan_by_cost_over_block_rate(self):
+        """测试按 成本/阻断率 升序排列，不能阻断的审核项排在最后"""
+        cheap_rare, costly_common, selective, passive = (
+            make_item("a"),
+            make_item("b"),
+            make_item("c"),
+            make_item("d", blocking=False),
+        )
+        planner = ItemPlanner(prior_weight=0)
+        for i in range(100):
+            planner.record(cheap_rare.id, blocked=i < 1, tokens=100)
+            planner.record(costly_common.id, blocked=i < 50, tokens=1000)
+            planner.record(selective.id, blocked=i < 30, tokens=100)
+            planner.record(passive.id, blocked=False, tokens=10)
+
+        items = [passive, cheap_rare, costly_common, selective]
+        planned = planner.plan(items)
+
+        assert [it.name for it in planned] == ["c", "b", "a", "d"]
+        assert planner.expected_cost(planned) < planner.expected_cost(items)
+
+    def test_unknown_items_use_prior(self):
+        """测试无统计的审核项使用先验阻断率与平均成本"""
+        known, unknown = make_item("a"), make_item("b")
+        planner = ItemPlanner(prior_block_rate=0.5)
+        for _ in range(50):
+            planner.record(known.id, blocked=False, tokens=100)
+
+        assert planner.plan([known, unknown]) == [unknown, known]
+        assert planner.plan_order([known, unknown]) == [1, 0]
+
+    def test_save_and_load(self, tmp_path):
+        """测试统计持久化"""
+        item = make_item("a")
+        planner = ItemPlanner()
+        planner.record(item.id, blocked=True, latency=0.5, tokens=200)
+        path = tmp_path / "planner.json"
+        planner.save(path)
+
+        loaded = ItemPlanner.load(path, cost="latency")
+        stats = loaded.stats(item.id)
+        assert (stats.evaluations, stats.blocks, stats.avg_tokens) == (1, 1, 200)
+        assert loaded.cost == "latency"
+        assert (
+            ItemPlanner.load(tmp_path / "missing.json").stats(item.id).evaluations == 0
+        )
@@ -0,0 +1,101 @@
+import random
+import re
+import pytest
+from pydantic import ValidationError
+from ai_content_audit.models import AuditOptionsItem, AuditPrefilter, PrefilterRule
+
+PHONE = r"(?<!\d)1[3-9]\d{9}(?!\d)"
+
+
+class TestPrefilterRule:
+    """测试预过滤规则"""
+
+    def test_keywords_and_patterns(self):
+        """测试关键词与正则任一命中，关键词优先匹配较长者"""
+        rule = PrefilterRule(choice="有", keywords=["微信", "微信号"], patterns=[PHONE])
+        assert rule.search("加我微信号abc") == "微信号"
+        assert rule.search("电话13812345678") == "13812345678"
+        assert rule.search("编号213812345678999") is None
+        assert rule.search("普通文本") is None
+
+    def test_ignore_case_and_escape(self):
+        """测试忽略大小写，关键词中的正则元字符按字面匹配"""
+        rule = PrefilterRule(choice="有", keywords=["a.b"], ignore_case=True)
+        assert rule.search("xA.Bx") == "A.B"
+        assert rule.search("axb") is None
+
+    def test_overlapping_keywords(self):
+        """测试关键词自动机：失败链上的命中、最左命中优先于较早结束的命中"""
+        rule = PrefilterRule(choice="有", keywords=["abcd", "bc", "bcde", "xbcdef"])
+        assert rule.search("zabcz") == "bc"
+        assert rule.search("abcde") == "abcd"
+        assert rule.search("xbcde") == "bcde"
+        assert rule.search("xbcdef") == "xbcdef"
+
+    def test_matches_alternation_regex(self):
+        """测试大量关键词与正则混合时，命中片段与按长度降序的多选正则一致"""
+        rng = random.Random(0)
+        alphabet = "甲乙丙丁a1"
+
+        def word(lo, hi):
+            return "".join(rng.choice(alphabet) for _ in range(rng.randint(lo, hi)))
+
+        for _ in range(50):
+            keywords = [word(1, 4) for _ in range(20)]
+            ignore_case = rng.random() < 0.5
+            rule = PrefilterRule(
+                choice="有",
+                keywords=keywords,
+                patterns=["1{2}", "A乙"],
+                ignore_case=ignore_case,
+            )
+            branches = [
+                re.escape(k) for k in sorted(set(keywords), key=len, reverse=True)
+            ]
+            reference = re.compile(
+                "|".join(branches + ["(?:1{2})", "(?:A乙)"]),
+                re.IGNORECASE if ignore_case else 0,
+            )
+            for _ in range(50):
+                text = word(0, 12) + "A"
+                match = reference.search(text)
+                assert rule.search(text) == (match.group(0) if match else None)
+
+    def test_invalid(self):
+        with pytest.raises(ValidationError):
+            PrefilterRule(choice="有")
+        with pytest.raises(ValidationError):
+            PrefilterRule(choice="有", patterns=["("])
+
+
+class TestAuditPrefilter:
+    """测试审核项预过滤器"""
+
+    def test_apply(self):
+        """测试按规则顺序命中，未命中时按 no_match_choice 决定是否交给模型"""
+        prefilter = AuditPrefilter(
+            rules=[
+                PrefilterRule(choice="有", patterns=[PHONE]),
+                PrefilterRule(choice="不确定", keywords=["电话"], reason="提到电话"),
+            ]
+        )
+        decision = prefilter.apply("电话 13812345678")
+        assert decision.choice == "有"
+        assert decision.reason == "命中预过滤规则：13812345678"
+        assert prefilter.apply("请留电话").reason == "提到电话"
+        assert prefilter.apply("普通文本") is None
+
+        prefilter.no_match_choice = "无"
+        assert prefilter.apply("普通文本").choice == "无"
+
+    def test_choices_validated_against_options(self):
+        """测试预过滤选项必须在审核项 options 中"""
+        with pytest.raises(ValidationError):
+            AuditOptionsItem(
+                name="项",
+                instruction="指令",
+                options={"有": "d", "无": "d"},
+                prefilter=AuditPrefilter(
+                    rules=[PrefilterRule(choice="违规", keywords=["x"])]
+                ),
+            )
@@ -0,0 +1,57 @@
+import asyncio
+import pytest
+from ai_content_audit.runtime import RateLimiter, usage_total_tokens
+
+
+class TestRateLimiter:
+    """测试 RPM/TPM 令牌桶限流器"""
+
+    def test_invalid_args(self):
+        with pytest.raises(ValueError):
+            RateLimiter()
+        with pytest.raises(ValueError):
+            RateLimiter(rpm=0)
+
+    def test_tpm_waits_when_exhausted(self):
+        """测试 TPM 配额耗尽后按补充速率等待"""
+        limiter = RateLimiter(tpm=6000)  # 每秒补充 100 token
+        assert limiter.acquire(6000) == 0
+        wait = limiter.acquire(10)
+        assert 0.05 < wait <= 0.11
+
+    def test_rpm_waits_when_exhausted(self):
+        """测试 RPM 配额耗尽后等待"""
+        limiter = RateLimiter(rpm=600)  # 每秒补充 10 个请求
+        for _ in range(600):
+            assert limiter.acquire() == 0
+        assert limiter.acquire() > 0.05
+
+    def test_reconcile_refunds_overestimate(self):
+        """测试实际用量小于估算时归还配额"""
+        limiter = RateLimiter(tpm=6000)
+        limiter.acquire(6000)
+        limiter.reconcile(6000, 100)
+        assert limiter.acquire(10) == 0
+
+    def test_reconcile_without_usage(self):
+        """测试未返回 usage 时不修正"""
+        limiter = RateLimiter(tpm=6000)
+        limiter.acquire(6000)
+        limiter.reconcile(6000, None)
+        assert limiter.acquire(10) > 0
+
+    def test_acquire_async(self):
+        """测试异步预约"""
+        limiter = RateLimiter(tpm=6000)
+
+        async def main():
+            await limiter.acquire_async(6000)
+            return await limiter.acquire_async(10)
+
+        assert asyncio.run(main()) > 0.05
+
+    def test_usage_total_tokens(self, mocker):
+        resp = mocker.Mock()
+        resp.usage.total_tokens = 42
+        assert usage_total_tokens(resp) == 42
+        assert usage_total_tokens(object()) is None
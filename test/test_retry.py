@@ -0,0 +1,86 @@
+import openai
+import pytest
+from ai_content_audit.runtime import (
+    RetryPolicy,
+    is_retryable_error,
+    retry_after_seconds,
+)
+
+
+def _status_error(mocker, cls, status, headers=None):
+    response = mocker.Mock(status_code=status, headers=headers or {})
+    return cls("错误", response=response, body=None)
+
+
+class TestErrorClassification:
+    """测试错误分类"""
+
+    def test_retryable(self, mocker):
+        assert is_retryable_error(_status_error(mocker, openai.RateLimitError, 429))
+        assert is_retryable_error(
+            _status_error(mocker, openai.InternalServerError, 503)
+        )
+        assert is_retryable_error(openai.APIConnectionError(request=mocker.Mock()))
+        assert is_retryable_error(openai.APITimeoutError(request=mocker.Mock()))
+
+    def test_not_retryable(self, mocker):
+        assert not is_retryable_error(
+            _status_error(mocker, openai.AuthenticationError, 401)
+        )
+        assert not is_retryable_error(
+            _status_error(mocker, openai.BadRequestError, 400)
+        )
+        assert not is_retryable_error(ValueError("校验失败"))
+
+
+class TestRetryAfter:
+    """测试 Retry-After 解析"""
+
+    def test_seconds_and_ms(self, mocker):
+        err = _status_error(mocker, openai.RateLimitError, 429, {"retry-after": "2"})
+        assert retry_after_seconds(err) == 2.0
+        err = _status_error(
+            mocker, openai.RateLimitError, 429, {"retry-after-ms": "1500"}
+        )
+        assert retry_after_seconds(err) == 1.5
+
+    def test_http_date_and_missing(self, mocker):
+        err = _status_error(
+            mocker,
+            openai.RateLimitError,
+            429,
+            {"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"},
+        )
+        assert retry_after_seconds(err) == 0.0  # 过去的时间
+        assert retry_after_seconds(ValueError()) is None
+
+
+class TestRetryPolicy:
+    """测试重试策略"""
+
+    def test_invalid_args(self):
+        with pytest.raises(ValueError):
+            RetryPolicy(max_attempts=0)
+
+    def test_should_retry(self, mocker):
+        policy = RetryPolicy(max_attempts=3)
+        err = _status_error(mocker, openai.RateLimitError, 429)
+        assert policy.should_retry(err, 1)
+        assert policy.should_retry(err, 2)
+        assert not policy.should_retry(err, 3)
+        assert not policy.should_retry(ValueError(), 1)
+
+    def test_delay(self, mocker):
+        policy = RetryPolicy(base_delay=1, max_delay=5, jitter=False)
+        err = _status_error(mocker, openai.InternalServerError, 500)
+        assert [policy.delay(err, n) for n in (1, 2, 3, 4)] == [1, 2, 4, 5]
+
+        jittered = RetryPolicy(base_delay=1, jitter=True)
+        assert 0 <= jittered.delay(err, 3) <= 4
+
+    def test_delay_honors_retry_after(self, mocker):
+        policy = RetryPolicy(max_retry_after=10)
+        err = _status_error(mocker, openai.RateLimitError, 429, {"retry-after": "3"})
+        assert policy.delay(err, 1) == 3
+        err = _status_error(mocker, openai.RateLimitError, 429, {"retry-after": "99"})
+        assert policy.delay(err, 1) == 10
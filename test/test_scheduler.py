@@ -0,0 +1,139 @@
+import asyncio
+import threading
+import time
+import pytest
+import openai
+from ai_content_audit.runtime import AdaptiveConcurrencyLimiter, PriorityScheduler
+
+
+def wait_until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "等待超时"
+        time.sleep(0.005)
+
+
+def start_waiter(scheduler, order, label, priority, tenant=None):
+    """在后台线程排队，获得名额后记录 label。"""
+
+    def run():
+        scheduler.acquire(priority, tenant=tenant)
+        order.append(label)
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return thread
+
+
+class TestPriorityScheduler:
+    """测试优先级调度器"""
+
+    def test_interactive_jumps_queue(self):
+        """测试空出名额时先分配给 interactive，即使 bulk 先到达"""
+        scheduler = PriorityScheduler(1)
+        scheduler.acquire("bulk")
+        order = []
+        for i in range(3):
+            start_waiter(scheduler, order, f"bulk{i}", "bulk")
+            wait_until(lambda: scheduler.waiting["bulk"] == i + 1)
+        start_waiter(scheduler, order, "interactive", "interactive")
+        wait_until(lambda: scheduler.waiting["interactive"] == 1)
+
+        for expected in range(1, 5):
+            scheduler.release()
+            wait_until(lambda: len(order) == expected)
+        assert order == ["interactive", "bulk0", "bulk1", "bulk2"]
+
+    def test_reserved_interactive(self):
+        """测试 bulk 不能占用为 interactive 预留的名额"""
+        scheduler = PriorityScheduler(2, reserved_interactive=1)
+        scheduler.acquire("bulk")
+        order = []
+        start_waiter(scheduler, order, "bulk", "bulk")
+        wait_until(lambda: scheduler.waiting["bulk"] == 1)
+
+        scheduler.acquire("interactive")
+        assert scheduler.in_flight == 2
+        assert order == []
+
+        scheduler.release()
+        scheduler.release()
+        wait_until(lambda: order == ["bulk"])
+
+    def test_capacity_follows_limiter(self, mocker):
+        """测试绑定限制器时名额数随其上限收缩，bulk 至少保留 1 个名额"""
+        limiter = AdaptiveConcurrencyLimiter(4, max_limit=4, cooldown=0)
+        scheduler = PriorityScheduler(4, reserved_interactive=2)
+        scheduler.bind_limiter(limiter)
+        assert scheduler.capacity == 4
+        error = openai.RateLimitError(
+            "限流", response=mocker.Mock(status_code=429, headers={}), body=None
+        )
+        for _ in range(2):
+            limiter.acquire()
+            limiter.release(error=error)
+        assert (limiter.limit, scheduler.capacity) == (1, 1)
+
+        scheduler.acquire("bulk")
+        order = []
+        start_waiter(scheduler, order, "bulk", "bulk")
+        start_waiter(scheduler, order, "interactive", "interactive")
+        wait_until(lambda: sum(scheduler.waiting.values()) == 2)
+
+        scheduler.release()
+        wait_until(lambda: order == ["interactive"])
+        scheduler.release()
+        wait_until(lambda: order == ["interactive", "bulk"])
+
+        with pytest.raises(ValueError):
+            scheduler.bind_limiter(AdaptiveConcurrencyLimiter())
+
+    def test_weighted_fair_queuing(self):
+        """测试同一优先级内按租户权重分配名额"""
+        scheduler = PriorityScheduler(1, tenant_weights={"a": 2})
+        scheduler.acquire("interactive")
+        order = []
+        for i, tenant in enumerate(["a", "a", "a", "a", "b", "b"]):
+            start_waiter(scheduler, order, tenant, "bulk", tenant)
+            wait_until(lambda: scheduler.waiting["bulk"] == i + 1)
+
+        for expected in range(1, 7):
+            scheduler.release()
+            wait_until(lambda: len(order) == expected)
+        assert order == ["a", "b", "a", "a", "b", "a"]
+
+    def test_async_acquire_and_cancel(self):
+        """测试异步排队：取消的等待者退出队列，不占用名额"""
+
+        async def main():
+            scheduler = PriorityScheduler(1)
+            await scheduler.acquire_async("bulk")
+            cancelled = asyncio.create_task(scheduler.acquire_async("interactive"))
+            waiting = asyncio.create_task(scheduler.acquire_async("bulk"))
+            await asyncio.sleep(0.01)
+            assert scheduler.waiting == {"interactive": 1, "bulk": 1}
+
+            cancelled.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await cancelled
+            scheduler.release()
+            await asyncio.wait_for(waiting, 1)
+            assert scheduler.in_flight == 1
+            assert scheduler.waiting == {"interactive": 0, "bulk": 0}
+
+            scheduler.release()
+            async with scheduler.slot_async("interactive"):
+                assert scheduler.in_flight == 1
+            assert scheduler.in_flight == 0
+
+        asyncio.run(asyncio.wait_for(main(), 2))
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            PriorityScheduler(0)
+        with pytest.raises(ValueError):
+            PriorityScheduler(2, reserved_interactive=2)
+        with pytest.raises(ValueError):
+            PriorityScheduler(2, tenant_weights={"a": 0})
+        with pytest.raises(ValueError):
+            PriorityScheduler(1).acquire("urgent")
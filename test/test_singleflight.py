@@ -0,0 +1,137 @@
+import asyncio
+import threading
+import time
+import pytest
+from ai_content_audit.runtime import AsyncSingleFlight, SingleFlight
+
+
+class TestSingleFlight:
+    """测试线程版单飞去重"""
+
+    def test_concurrent_calls_share_result(self):
+        """测试相同 key 的并发调用只执行一次"""
+        flight = SingleFlight()
+        calls = 0
+        barrier = threading.Barrier(8)
+        results = []
+
+        def fn():
+            nonlocal calls
+            calls += 1
+            time.sleep(0.05)
+            return "结果"
+
+        def worker():
+            barrier.wait()
+            results.append(flight.do("k", fn))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert calls == 1
+        assert [value for value, _ in results] == ["结果"] * 8
+        assert sum(1 for _, shared in results if not shared) == 1
+        assert flight.in_flight() == 0
+
+    def test_error_propagates_and_key_released(self):
+        """测试异常传递且调用结束后 key 释放"""
+        flight = SingleFlight()
+
+        def boom():
+            raise RuntimeError("失败")
+
+        with pytest.raises(RuntimeError):
+            flight.do("k", boom)
+        assert flight.do("k", lambda: 1) == (1, False)
+
+
+class TestAsyncSingleFlight:
+    """测试 asyncio 版单飞去重"""
+
+    def test_concurrent_calls_share_result(self):
+        flight = AsyncSingleFlight()
+        calls = 0
+
+        async def fn():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "结果"
+
+        async def main():
+            return await asyncio.gather(*(flight.do("k", fn) for _ in range(5)))
+
+        results = asyncio.run(main())
+
+        assert calls == 1
+        assert [value for value, _ in results] == ["结果"] * 5
+        assert [shared for _, shared in results].count(False) == 1
+        assert flight.in_flight() == 0
+
+    def test_error_propagates(self):
+        flight = AsyncSingleFlight()
+
+        async def boom():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("失败")
+
+        async def main():
+            return await asyncio.gather(
+                flight.do("k", boom), flight.do("k", boom), return_exceptions=True
+            )
+
+        results = asyncio.run(main())
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    def test_leader_cancel_does_not_fail_followers(self):
+        """测试 leader 被取消时共享调用继续执行，等待者得到结果"""
+        flight = AsyncSingleFlight()
+        calls = 0
+
+        async def fn():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return "结果"
+
+        async def main():
+            leader = asyncio.create_task(flight.do("k", fn))
+            await asyncio.sleep(0)
+            follower = asyncio.create_task(flight.do("k", fn))
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+            return await follower
+
+        assert asyncio.run(main()) == ("结果", True)
+        assert calls == 1
+        assert flight.in_flight() == 0
+
+    def test_all_cancelled_cancels_call(self):
+        """测试所有调用者都被取消后共享调用被取消"""
+        flight = AsyncSingleFlight()
+
+        async def main():
+            started = asyncio.Event()
+            stopped = asyncio.Event()
+
+            async def fn():
+                started.set()
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    stopped.set()
+                    raise
+
+            task = asyncio.create_task(flight.do("k", fn))
+            await started.wait()
+            task.cancel()
+            await asyncio.wait_for(stopped.wait(), 1)
+            await asyncio.sleep(0)
+            return flight.in_flight()
+
+        assert asyncio.run(main()) == 0
@@ -0,0 +1,32 @@
+from ai_content_audit.prompts import (
+    build_messages,
+    estimate_message_tokens,
+    estimate_text_tokens,
+)
+from ai_content_audit.prompts.token_estimator import IMAGE_TOKENS
+from ai_content_audit.models import AuditContent, AuditOptionsItem
+
+
+class TestTokenEstimator:
+    """测试 token 估算"""
+
+    def test_text_tokens(self):
+        """测试中英文文本估算"""
+        assert estimate_text_tokens("") == 0
+        assert estimate_text_tokens("你好世界") == 4
+        assert estimate_text_tokens("abcdefgh") == 2
+        assert estimate_text_tokens("你好abcd") == 3
+
+    def test_message_tokens_text_and_image(self):
+        """测试消息列表估算（文本与图片）"""
+        item = AuditOptionsItem(name="项", instruction="指令", options={"有": "desc"})
+        text_messages = build_messages(AuditContent(content="测试"), item)
+        image_messages = build_messages(
+            AuditContent(content="data:image/png;base64,xx", file_type="image"), item
+        )
+
+        text_tokens = estimate_message_tokens(text_messages)
+        image_tokens = estimate_message_tokens(image_messages)
+
+        assert text_tokens > 0
+        assert image_tokens > IMAGE_TOKENS
@@ -0,0 +1,91 @@
+import json
+import pytest
+from ai_content_audit.tracing import (
+    JsonlSpanExporter,
+    MemorySpanExporter,
+    Tracer,
+    analyze_spans,
+    format_breakdown,
+    get_tracer,
+    load_spans,
+    traced,
+)
+
+
+class TestTracer:
+    """测试追踪器与导出器"""
+
+    def test_nested_spans(self):
+        """测试嵌套 span 的父子关系、属性与异常记录"""
+        exporter = MemorySpanExporter()
+        tracer = Tracer(exporter)
+
+        with tracer.span("outer", batch_id="b") as outer:
+            assert get_tracer() is tracer
+            with tracer.span("inner", item_id=1):
+                pass
+            with pytest.raises(ValueError):
+                with tracer.span("broken"):
+                    raise ValueError("boom")
+
+        spans = {s["name"]: s for s in exporter.spans}
+        assert [s["name"] for s in exporter.spans] == ["inner", "broken", "outer"]
+        assert spans["outer"]["parent_id"] is None
+        assert spans["inner"]["parent_id"] == outer.span_id
+        assert spans["inner"]["trace_id"] == spans["outer"]["trace_id"]
+        assert spans["inner"]["attributes"] == {"item_id": 1}
+        assert spans["broken"]["status"] == "error"
+        assert spans["broken"]["error"] == "ValueError: boom"
+        assert spans["outer"]["duration"] >= spans["inner"]["duration"]
+
+    def test_disabled_tracer_is_noop(self):
+        """测试未配置导出器时不记录 span，被装饰函数正常返回"""
+        tracer = Tracer()
+
+        @traced("fn")
+        def fn(x):
+            return x + 1
+
+        with tracer.span("outer") as span:
+            span.set_attribute("k", "v")
+            assert fn(1) == 2
+        assert not tracer.enabled
+
+    def test_jsonl_round_trip(self, tmp_path):
+        """测试 JSONL 导出与读取（忽略不完整的行）"""
+        path = tmp_path / "trace.jsonl"
+        with JsonlSpanExporter(path) as exporter:
+            tracer = Tracer(exporter)
+            with tracer.span("root", obj=object()):
+                with tracer.span("child"):
+                    pass
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"name": "trunc')
+
+        spans = load_spans(path)
+        assert [s["name"] for s in spans] == ["child", "root"]
+        assert isinstance(spans[1]["attributes"]["obj"], str)
+        json.dumps(spans)
+
+
+class TestAnalyzer:
+    """测试阶段耗时分解"""
+
+    def test_self_time(self):
+        """测试自身耗时扣除直接子 span 并按自身耗时降序"""
+        spans = [
+            {"name": "batch", "span_id": "a", "parent_id": None, "duration": 1.0},
+            {"name": "http", "span_id": "b", "parent_id": "a", "duration": 0.6},
+            {"name": "http", "span_id": "c", "parent_id": "a", "duration": 0.2},
+            {"name": "parse", "span_id": "d", "parent_id": "b", "duration": 0.1},
+            {"name": "open", "span_id": "e", "parent_id": None, "duration": None},
+        ]
+
+        stats = {s.name: s for s in analyze_spans(spans)}
+        assert list(stats) == ["http", "batch", "parse"]
+        assert stats["batch"].self_total == pytest.approx(0.2)
+        assert stats["http"].count == 2
+        assert stats["http"].total == pytest.approx(0.8)
+        assert stats["http"].self_total == pytest.approx(0.7)
+        assert stats["http"].max == pytest.approx(0.6)
+        assert "http" in format_breakdown(list(stats.values()))